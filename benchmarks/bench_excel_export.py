@@ -0,0 +1,91 @@
+"""
+Benchmark the streaming (write-only) Excel export against the pandas path.
+
+Usage:
+    python benchmarks/bench_excel_export.py --days 3650 --keys 20000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from py_spoo_url._internal.exporters import export_to_excel
+
+
+def make_payload(days: int, keys: int) -> dict:
+    start = date(2015, 1, 1)
+    counter = {(start + timedelta(days=i)).isoformat(): i % 97 for i in range(days)}
+    dimension = {f"https://referrer-{i}.example.com/": i % 89 + 1 for i in range(keys)}
+    return {
+        "_id": "bench",
+        "url": "https://example.com",
+        "total-clicks": sum(counter.values()),
+        "total_unique_clicks": sum(counter.values()) // 2,
+        "max-clicks": None,
+        "password": None,
+        "creation-date": start.isoformat(),
+        "expired": False,
+        "average_daily_clicks": 48.0,
+        "average_monthly_clicks": 1440.0,
+        "average_weekly_clicks": 336.0,
+        "last-click": start.isoformat(),
+        "last-click-browser": "Chrome",
+        "last-click-os": "Windows",
+        "browser": {f"Browser {i}": i for i in range(50)},
+        "os_name": {f"OS {i}": i for i in range(20)},
+        "country": {f"Country {i}": i for i in range(250)},
+        "referrer": dimension,
+        "counter": counter,
+        "unique_browser": {f"Browser {i}": i for i in range(50)},
+        "unique_os_name": {f"OS {i}": i for i in range(20)},
+        "unique_country": {f"Country {i}": i for i in range(250)},
+        "unique_referrer": dimension,
+        "unique_counter": counter,
+    }
+
+
+def export(payload: dict, streaming: bool, filename: str) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        export_to_excel(payload, filename, streaming=streaming)
+
+
+def measure(payload: dict, streaming: bool, filename: str):
+    started = time.perf_counter()
+    export(payload, streaming, filename)
+    elapsed = time.perf_counter() - started
+
+    # Memory is traced in a separate run, tracing slows the export down a lot
+    tracemalloc.start()
+    export(payload, streaming, filename)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, os.path.getsize(filename)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=3650, help="days of click history")
+    parser.add_argument("--keys", type=int, default=20000, help="referrers per table")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per path")
+    args = parser.parse_args()
+
+    payload = make_payload(args.days, args.keys)
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "bench.xlsx")
+        for name, streaming in (("pandas", False), ("streaming", True)):
+            runs = [measure(payload, streaming, filename) for _ in range(args.repeat)]
+            elapsed = min(run[0] for run in runs)
+            peak = max(run[1] for run in runs)
+            print(
+                f"{name:>9}: {elapsed:7.3f} s  peak {peak / 2**20:7.1f} MiB  "
+                f"file {runs[0][2] / 2**20:6.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
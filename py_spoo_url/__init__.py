@@ -1,4 +1,36 @@
+import importlib
+
 from .shortener import Shortener
 from .statistics import Statistics
+from ._internal.cache import RenderCache
+from ._internal.batch import render_batch
+from ._internal.bulk import export_many, export_ndjson
+from ._internal.sqlite import SQLiteStore, sync_sqlite
+from ._internal.incremental import export_incremental
+
+# Names needing matplotlib are imported on first access
+_LAZY_ATTRIBUTES = {
+    "HeatmapRenderer": "._internal.heatmaps",
+    "render_small_multiples": "._internal.multiples",
+}
+
+__all__ = [
+    "Shortener",
+    "Statistics",
+    "RenderCache",
+    "render_batch",
+    "export_many",
+    "export_ndjson",
+    "SQLiteStore",
+    "sync_sqlite",
+    "export_incremental",
+    "HeatmapRenderer",
+    "render_small_multiples",
+]
+
 
-__all__ = ["Shortener", "Statistics"]
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
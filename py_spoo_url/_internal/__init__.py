@@ -1,9 +1,34 @@
 """
 Internal modules for py_spoo_url
+
+Plotting and exporting pull in matplotlib, geopandas and pandas, so they are
+imported lazily on first attribute access instead of at package import time.
 """
 
+import importlib
+
 from .api import fetch_statistics
-from .plotting import make_chart, make_countries_heatmap, make_unique_countries_heatmap
-from .exporters import export_data
 
-__all__ = ["fetch_statistics", "make_chart", "make_countries_heatmap", "make_unique_countries_heatmap", "export_data"]
+_LAZY_ATTRIBUTES = {
+    "make_chart": ".plotting",
+    "make_countries_heatmap": ".plotting",
+    "make_unique_countries_heatmap": ".plotting",
+    "export_data": ".exporters",
+    "export_formats": ".exporters",
+    "HeatmapRenderer": ".heatmaps",
+    "render_small_multiples": ".multiples",
+    "export_many": ".bulk",
+    "export_ndjson": ".bulk",
+    "SQLiteStore": ".sqlite",
+    "sync_sqlite": ".sqlite",
+    "export_incremental": ".incremental",
+}
+
+__all__ = ["fetch_statistics", "make_chart", "make_countries_heatmap", "make_unique_countries_heatmap", "export_data", "export_formats", "HeatmapRenderer", "render_small_multiples", "export_many", "export_ndjson", "SQLiteStore", "sync_sqlite", "export_incremental"]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,175 @@
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from ..statistics import Statistics
+from .countries import load_country_index
+
+
+CHART_KINDS = ["chart", "countries_heatmap", "unique_countries_heatmap"]
+HEATMAP_TITLES = {
+    "countries_heatmap": "Countries Heatmap",
+    "unique_countries_heatmap": "Unique Countries Heatmap",
+}
+
+# Per worker process heatmap renderers, keyed by (kind, cmap, figsize)
+_heatmap_renderers: Dict[Tuple, object] = {}
+
+
+def _render_polygon_heatmap(
+    stats: Statistics, kind: str, spec: Dict, image_format: str, dpi: float
+) -> bytes:
+    from .heatmaps import HeatmapRenderer
+
+    cmap = spec.get("cmap", "YlOrRd")
+    figsize = spec.get("figsize")
+    key = (kind, cmap, tuple(figsize) if figsize else None)
+    renderer = _heatmap_renderers.get(key)
+    if renderer is None:
+        renderer = HeatmapRenderer(
+            cmap=cmap, title=HEATMAP_TITLES[kind], figsize=figsize
+        )
+        _heatmap_renderers[key] = renderer
+    data = (
+        stats.country_analysis
+        if kind == "countries_heatmap"
+        else stats.unique_country_analysis
+    )
+    return renderer.render(data, format=image_format, dpi=dpi)
+
+
+def _init_worker(engines: Tuple[str, ...]) -> None:
+    """
+    Load the country index and world geometry once per worker process.
+    """
+    load_country_index()
+    if "polygons" in engines:
+        from .polygons import load_world_polygons
+
+        load_world_polygons()
+    if "geopandas" in engines:
+        from .world import load_world
+
+        load_world()
+
+
+def _job_name(data: Dict, spec: Dict) -> str:
+    kind = spec.get("kind", "chart")
+    if kind != "chart":
+        suffix = kind
+    else:
+        suffix = f"{spec.get('data')}_{spec.get('chart_type', 'bar')}"
+        if str(spec.get("data", "")).startswith("last_n_days"):
+            suffix += f"_{spec.get('days', 7)}d"
+    return spec.get("name") or f"{data['_id']}_{suffix}"
+
+
+def _job_path(data: Dict, spec: Dict, output_dir: str) -> str:
+    image_format = spec.get("format", "png")
+    return os.path.join(output_dir, f"{_job_name(data, spec)}.{image_format}")
+
+
+def _render_job(data: Dict, spec: Dict, output_dir: Optional[str]) -> Union[str, bytes]:
+    stats = Statistics.from_data(data)
+    kind = spec.get("kind", "chart")
+    image_format = spec.get("format", "png")
+    options = dict(
+        format=image_format, dpi=spec.get("dpi", 100), figsize=spec.get("figsize")
+    )
+    if kind == "chart":
+        image = stats.render_chart_bytes(
+            spec["data"],
+            chart_type=spec.get("chart_type", "bar"),
+            days=spec.get("days", 7),
+            **options,
+            **spec.get("kwargs", {}),
+        )
+    elif kind in HEATMAP_TITLES and spec.get("engine", "polygons") == "polygons":
+        image = _render_polygon_heatmap(stats, kind, spec, image_format, options["dpi"])
+    elif kind in HEATMAP_TITLES:
+        render = getattr(stats, f"render_{kind}_bytes")
+        image = render(
+            cmap=spec.get("cmap", "YlOrRd"),
+            engine=spec.get("engine", "polygons"),
+            **options,
+        )
+    else:
+        raise ValueError(
+            "Invalid chart kind. Valid chart kinds are: {}".format(CHART_KINDS)
+        )
+    if output_dir is None:
+        return image
+    path = _job_path(data, spec, output_dir)
+    with open(path, "wb") as f:
+        f.write(image)
+    return path
+
+
+def render_batch(
+    jobs: Iterable[Tuple[object, Dict]],
+    output_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> List[Union[str, bytes]]:
+    """
+    Render many charts and heatmaps in parallel worker processes.
+
+    Each job is a ``(source, spec)`` pair. ``source`` is a Statistics object
+    or a raw stats payload. ``spec`` is a dict with ``kind`` ("chart",
+    "countries_heatmap" or "unique_countries_heatmap", default "chart") and
+    the options of the matching ``render_*_bytes`` method: ``data``,
+    ``chart_type``, ``days``, ``kwargs`` for charts, ``cmap`` and ``engine``
+    (default "polygons") for heatmaps, plus ``format``, ``dpi``, ``figsize``
+    and an optional output ``name`` (by default the short code followed by
+    ``data`` and ``chart_type``, plus ``days`` for ``last_n_days`` charts, or
+    by the heatmap kind). Polygon heatmaps reuse one base map per
+    worker process (see ``HeatmapRenderer``).
+
+    Args:
+        jobs: Iterable of (Statistics or payload dict, spec) pairs
+        output_dir: Directory to write images into; bytes are returned if None.
+            Raises ValueError if several jobs would write the same file
+        max_workers: Number of worker processes (CPU count if None)
+        progress: Called as ``progress(done, total)`` after each finished job
+
+    Returns:
+        File paths (if output_dir is given) or encoded images, in job order
+    """
+    payloads = []
+    for source, spec in jobs:
+        data = source if isinstance(source, dict) else source.data
+        payloads.append((data, spec))
+    if output_dir is not None:
+        # Jobs writing the same file would silently overwrite each other
+        paths = [_job_path(data, spec, output_dir) for data, spec in payloads]
+        duplicates = sorted(
+            path for path, count in collections.Counter(paths).items() if count > 1
+        )
+        if duplicates:
+            raise ValueError(
+                "Several jobs write to {}; give them distinct names.".format(
+                    ", ".join(duplicates)
+                )
+            )
+        os.makedirs(output_dir, exist_ok=True)
+    engines = tuple(
+        {
+            spec.get("engine", "polygons")
+            for _, spec in payloads
+            if spec.get("kind", "chart") != "chart"
+        }
+    )
+
+    results: List[Union[str, bytes]] = [b""] * len(payloads)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(engines,)
+    ) as pool:
+        futures = {
+            pool.submit(_render_job, data, spec, output_dir): index
+            for index, (data, spec) in enumerate(payloads)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if progress is not None:
+                progress(done, len(payloads))
+    return results
@@ -0,0 +1,362 @@
+"""
+Bulk export of many links into one consolidated output.
+
+Links are consumed one at a time from any iterable of ``Statistics`` objects
+or raw payloads, and their rows are appended to long tables that carry the
+link's short code. Small sets go into a single multi-sheet workbook; large
+sets into a directory with one Parquet or CSV dataset per table, split into
+part files of ``links_per_file`` links and, for the daily tables, optionally
+into month partitions. Only the writers of the current part are open, so
+memory stays bounded however many links are exported.
+
+``export_ndjson`` streams the same links as JSON Lines, one compact record per
+link or per link and day, optionally gzip or zstd compressed.
+"""
+
+import contextlib
+import csv
+import gzip
+import importlib.util
+import itertools
+import os
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+from ..statistics import Statistics
+from .dependencies import missing_dependency
+from .tables import (
+    EXCEL_SHEET_NAMES,
+    STANDARD_DATAFRAME_CONFIGS,
+    TABLE_FILE_NAMES,
+    general_info_columns,
+    general_info_table,
+    iter_tables,
+)
+from .textexport import ndjson_lines
+
+SHORT_CODE_COLUMN = "Short_Code"
+DEFAULT_LINKS_PER_FILE = 1000
+DEFAULT_MAX_WORKBOOK_LINKS = 100
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+
+def _payload(link: Union[Statistics, Dict]) -> Dict:
+    return link.data if isinstance(link, Statistics) else link
+
+
+def _long_rows(data: Dict) -> Iterable[Tuple[str, List[str], List[Tuple]]]:
+    short_code = data["_id"]
+    for table_name, columns, rows in iter_tables(data):
+        yield (
+            TABLE_FILE_NAMES[table_name],
+            [SHORT_CODE_COLUMN] + columns,
+            [(short_code, key, count) for key, count in rows],
+        )
+
+
+def _write_workbook(links: Iterable[Dict], filename: str) -> None:
+    try:
+        import openpyxl  # type: ignore
+    except ImportError as e:
+        raise missing_dependency("openpyxl", "Excel export") from e
+
+    # Write-only sheets stream to their own temporary files, so rows of
+    # different sheets can be appended link by link
+    workbook = openpyxl.Workbook(write_only=True)
+    sheets = {}
+    for _, table_name, columns in STANDARD_DATAFRAME_CONFIGS:
+        sheet = workbook.create_sheet(EXCEL_SHEET_NAMES[table_name])
+        sheet.append([SHORT_CODE_COLUMN] + columns)
+        sheets[TABLE_FILE_NAMES[table_name]] = sheet
+    general_info = workbook.create_sheet("General_Info")
+    general_info.append(general_info_columns("URL"))
+
+    for data in links:
+        for table, _, rows in _long_rows(data):
+            for row in rows:
+                sheets[table].append(row)
+        general_info.append(general_info_table(data, "URL")[1])
+    workbook.save(filename)
+
+
+class _CsvPart:
+    def __init__(self, path: str, columns: List[str], mode: str = "w"):
+        # Appending to an existing file keeps its header
+        header = mode == "w" or not os.path.exists(path) or not os.path.getsize(path)
+        self._file = open(path, mode, newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, lineterminator="\n")
+        if header:
+            self._writer.writerow(columns)
+
+    def append(self, rows: List[Tuple]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _long_schema(columns: List[str]) -> Any:
+    from .columnar import DIMENSION_TYPE, general_info_schema, pa
+
+    if columns[0] != SHORT_CODE_COLUMN:
+        return general_info_schema("URL")
+    key_type = pa.date32() if columns[1] == "Date" else DIMENSION_TYPE
+    return pa.schema(
+        [(columns[0], DIMENSION_TYPE), (columns[1], key_type), (columns[2], pa.int64())]
+    )
+
+
+class _ParquetPart:
+    def __init__(self, path: str, schema: Any, compression: str):
+        from .columnar import pq
+
+        self._schema = schema
+        self._writer = pq.ParquetWriter(path, schema, compression=compression)
+        self._rows: List[Tuple] = []
+
+    def append(self, rows: List[Tuple]) -> None:
+        self._rows.extend(rows)
+        if len(self._rows) >= PARQUET_ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        from .columnar import column_array, pa
+
+        if not self._rows:
+            return
+        arrays = [
+            column_array(values, field)
+            for values, field in zip(zip(*self._rows), self._schema)
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self._rows = []
+
+    def close(self) -> None:
+        try:
+            self._flush()
+        finally:
+            self._writer.close()
+
+
+class _Dataset:
+    """
+    Directory of one dataset per table, written part by part.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        filetype: Literal["parquet", "csv"],
+        partition_by: Literal["link", "date"],
+        compression: str,
+    ):
+        self.directory = directory
+        self.filetype = filetype
+        self.partition_by = partition_by
+        self.compression = compression
+        self._parts: Dict[Tuple[str, str], object] = {}
+        self._part = 0
+
+    def _open(self, table: str, partition: str, columns: List[str]):
+        folder = os.path.join(self.directory, table, partition)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"part-{self._part:05d}.{self.filetype}")
+        if self.filetype == "csv":
+            return _CsvPart(path, columns)
+        return _ParquetPart(path, _long_schema(columns), self.compression)
+
+    def append(self, table: str, columns: List[str], rows: List[Tuple]) -> None:
+        if self.partition_by == "date" and columns[1:2] == ["Date"]:
+            partitions: Dict[str, List[Tuple]] = {}
+            for row in rows:
+                partitions.setdefault(f"month={row[1][:7]}", []).append(row)
+        else:
+            partitions = {"": rows}
+        for partition, partition_rows in partitions.items():
+            part = self._parts.get((table, partition))
+            if part is None:
+                part = self._parts[(table, partition)] = self._open(
+                    table, partition, columns
+                )
+            part.append(partition_rows)
+
+    def next_part(self) -> None:
+        self.close()
+        self._part += 1
+
+    def close(self) -> None:
+        for part in self._parts.values():
+            part.close()
+        self._parts = {}
+
+
+def _write_dataset(
+    links: Iterable[Dict],
+    directory: str,
+    filetype: Literal["parquet", "csv"],
+    partition_by: Literal["link", "date"],
+    links_per_file: int,
+    compression: str,
+) -> None:
+    if filetype == "parquet":
+        from . import columnar  # noqa: F401 (raises if pyarrow is missing)
+
+    dataset = _Dataset(directory, filetype, partition_by, compression)
+    try:
+        for index, data in enumerate(links):
+            if index and index % links_per_file == 0:
+                dataset.next_part()
+            for table, columns, rows in _long_rows(data):
+                dataset.append(table, columns, rows)
+            columns, row = general_info_table(data, "URL")
+            dataset.append("general_info", columns, [tuple(row)])
+    finally:
+        dataset.close()
+
+
+def export_many(
+    links: Iterable[Union[Statistics, Dict]],
+    filename: str = "export",
+    filetype: Literal["auto", "xlsx", "parquet", "csv"] = "auto",
+    partition_by: Literal["link", "date"] = "link",
+    links_per_file: int = DEFAULT_LINKS_PER_FILE,
+    max_workbook_links: int = DEFAULT_MAX_WORKBOOK_LINKS,
+    compression: Optional[str] = "zstd",
+) -> str:
+    """
+    Export the statistics of many links into one consolidated output.
+
+    Every standard table becomes one long table with a ``Short_Code`` column
+    in front; the general info table gets one row per link.
+
+    Args:
+        links: Statistics objects or raw stats payloads (may be a generator)
+        filename: Workbook path ("xlsx") or output directory ("parquet", "csv")
+        filetype: "xlsx" for one sheet per table, "parquet" or "csv" for a
+            directory ``<table>/part-NNNNN.<ext>`` per table, or "auto" for a
+            workbook up to ``max_workbook_links`` links and Parquet (CSV if
+            pyarrow is not installed) above that
+        partition_by: "link" to only split tables into part files of
+            ``links_per_file`` links, "date" to also split the daily tables
+            into ``month=YYYY-MM`` folders
+        links_per_file: Number of links per part file
+        max_workbook_links: Largest set written as a workbook in "auto" mode
+        compression: Parquet compression codec
+
+    Returns:
+        The path of the workbook or output directory
+    """
+    if partition_by not in ("link", "date"):
+        raise ValueError("Invalid partitioning. Choose either 'link' or 'date'.")
+    if links_per_file < 1:
+        raise ValueError("links_per_file must be at least 1.")
+    payloads = map(_payload, links)
+    if filetype == "auto":
+        head = list(itertools.islice(payloads, max_workbook_links + 1))
+        payloads = itertools.chain(head, payloads)
+        if len(head) <= max_workbook_links:
+            filetype = "xlsx"
+        elif importlib.util.find_spec("pyarrow") is not None:
+            filetype = "parquet"
+        else:
+            filetype = "csv"
+        if filetype == "xlsx" and not filename.endswith(".xlsx"):
+            filename = f"{filename}.xlsx"
+
+    if filetype == "xlsx":
+        _write_workbook(payloads, filename)
+    elif filetype in ("parquet", "csv"):
+        _write_dataset(
+            payloads, filename, filetype, partition_by, links_per_file, compression
+        )
+    else:
+        raise ValueError(
+            "Invalid file type. Choose either 'auto', 'xlsx', 'parquet' or 'csv'."
+        )
+    print(f"Data successfully written to {filename}")
+    return filename
+
+
+def _link_day_records(data: Dict) -> Iterator[Dict]:
+    clicks = data.get("counter", {})
+    unique_clicks = data.get("unique_counter", {})
+    for day in sorted(set(clicks) | set(unique_clicks)):
+        yield {
+            "short_code": data["_id"],
+            "date": day,
+            "clicks": clicks.get(day, 0),
+            "unique_clicks": unique_clicks.get(day, 0),
+        }
+
+
+@contextlib.contextmanager
+def _compressed_writer(
+    filename: Union[str, IO[bytes]], compression: Optional[str]
+) -> Iterator[IO[bytes]]:
+    if compression not in (None, "gzip", "zstd"):
+        raise ValueError("Invalid compression. Choose either None, 'gzip' or 'zstd'.")
+    if compression == "zstd":
+        try:
+            import zstandard  # type: ignore
+        except ImportError as e:
+            raise missing_dependency("zstandard", "Zstandard compression") from e
+
+    with contextlib.ExitStack() as stack:
+        raw = (
+            stack.enter_context(open(filename, "wb"))
+            if isinstance(filename, str)
+            else filename
+        )
+        if compression == "gzip":
+            yield stack.enter_context(gzip.GzipFile(fileobj=raw, mode="wb", mtime=0))
+        elif compression == "zstd":
+            compressor = zstandard.ZstdCompressor()
+            yield stack.enter_context(compressor.stream_writer(raw, closefd=False))
+        else:
+            yield raw
+
+
+def export_ndjson(
+    links: Iterable[Union[Statistics, Dict]],
+    filename: Union[str, IO[bytes]] = "export.ndjson",
+    records: Literal["link", "link-day"] = "link",
+    compression: Optional[Literal["gzip", "zstd"]] = None,
+) -> int:
+    """
+    Stream the statistics of many links as newline-delimited JSON.
+
+    Links are encoded and written one at a time, so the output can be
+    produced and consumed incrementally however many links there are.
+
+    Args:
+        links: Statistics objects or raw stats payloads (may be a generator)
+        filename: Path or binary file-like object to write into
+        records: "link" for one record per link holding its whole payload,
+            "link-day" for one ``{"short_code", "date", "clicks",
+            "unique_clicks"}`` record per link and day
+        compression: None, "gzip" or "zstd" (needs the zstandard package)
+
+    Returns:
+        The number of records written
+    """
+    if records not in ("link", "link-day"):
+        raise ValueError("Invalid records. Choose either 'link' or 'link-day'.")
+    count = 0
+    with _compressed_writer(filename, compression) as stream:
+        for data in map(_payload, links):
+            rows = [data] if records == "link" else _link_day_records(data)
+            for line in ndjson_lines(rows):
+                stream.write(line.encode("utf-8"))
+                count += 1
+    if isinstance(filename, str):
+        print(f"Data successfully written to {filename}")
+    return count
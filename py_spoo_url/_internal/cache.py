@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _canonical(value: Any) -> Any:
+    # Dicts become [key, value] pairs in their own order: the order of an
+    # analysis decides the order of its bars and pie slices, and the pairs
+    # keep 1 and "1" apart. Lists and dicts are tagged so they cannot collide.
+    if isinstance(value, dict):
+        return ["d", [[_canonical(k), _canonical(v)] for k, v in value.items()]]
+    if isinstance(value, (list, tuple)):
+        return ["l", [_canonical(item) for item in value]]
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if type(value).__module__ == "numpy" and hasattr(value, "tolist"):
+        return _canonical(value.tolist())
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__!r} values")
+
+
+def make_cache_key(**parts: Any) -> str:
+    """
+    Build a content-addressed cache key.
+
+    The parts (analysis dict, chart type, kwargs, colormap, format, ...) are
+    serialized canonically: the order of the keyword parts does not matter,
+    while the items of nested dicts are hashed in their own order, since it
+    changes what is drawn. numpy values are converted to Python values.
+
+    Returns:
+        Hex SHA-256 digest of the serialized parts
+
+    Raises:
+        TypeError: If a part holds values that are not JSON-serializable
+    """
+    canonical = {name: _canonical(value) for name, value in parts.items()}
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    Two-tier (memory + optional disk) cache for rendered images.
+
+    Both tiers are bounded by size in bytes and evict least recently used
+    entries first. The disk tier uses file modification times for recency, so
+    it survives restarts and can be shared between processes.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._disk_bytes = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def _remember(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = value
+        self._memory_bytes += len(value)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    value = f.read()
+                os.utime(path)
+            except OSError:
+                value = None
+            if value is not None:
+                with self._lock:
+                    self._remember(key, value)
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._remember(key, value)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        with self._lock:
+            if os.path.exists(path):
+                self._disk_bytes -= os.path.getsize(path)
+            os.replace(tmp_path, path)
+            self._disk_bytes += len(value)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _disk_entries(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".bin"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict_disk(self) -> None:
+        entries = self._disk_entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self.directory is not None:
+                for _, _, path in self._disk_entries():
+                    os.remove(path)
+                self._disk_bytes = 0
@@ -0,0 +1,157 @@
+"""
+Columnar (Parquet and Arrow IPC/Feather) exports.
+
+Every standard table and the general info are written as one file each into
+a directory. Dimension columns (browser, country, ...) are dictionary-encoded,
+dates are stored as ``date32`` and the files are zstd-compressed by default,
+so exports stay small. Uncompressed Arrow files can be memory-mapped and read
+without copying.
+"""
+
+import io
+import os
+import zipfile
+from datetime import date
+from typing import IO, Dict, Iterable, List, Literal, Optional, Sequence, Union
+from .dependencies import missing_dependency
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.feather as feather  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError as e:
+    raise missing_dependency("pyarrow", "Parquet and Arrow export") from e
+from .tables import (
+    GENERAL_INFO_COLUMNS,
+    TABLE_FILE_NAMES,
+    StatisticsTables,
+    general_info_table,
+    iter_tables,
+)
+
+COLUMNAR_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+DEFAULT_COMPRESSION = "zstd"
+DIMENSION_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+# Arrow type of each general info field, so columns that are null in one
+# payload keep the same type as in the others
+GENERAL_INFO_TYPES = {
+    "total-clicks": pa.int64(),
+    "total_unique_clicks": pa.int64(),
+    "url": pa.string(),
+    "_id": pa.string(),
+    "max-clicks": pa.int64(),
+    "password": pa.string(),
+    "creation-date": pa.string(),
+    "expired": pa.bool_(),
+    "average_daily_clicks": pa.float64(),
+    "average_monthly_clicks": pa.float64(),
+    "average_weekly_clicks": pa.float64(),
+    "last-click": pa.string(),
+    "last-click-browser": pa.string(),
+    "last-click-os": pa.string(),
+}
+
+
+def key_array(column: str, keys: List[str]) -> "pa.Array":
+    """
+    Build the key column of a standard table: dates as ``date32``, every
+    other dimension dictionary-encoded.
+    """
+    if column == "Date":
+        return pa.array([date.fromisoformat(key) for key in keys], pa.date32())
+    return pa.array(keys, DIMENSION_TYPE)
+
+
+def column_array(values: Sequence, field: "pa.Field") -> "pa.Array":
+    """
+    Build an array of a schema field from Python values, parsing ISO dates
+    for ``date32`` fields.
+    """
+    if field.type == pa.date32():
+        return pa.array([date.fromisoformat(value) for value in values], pa.date32())
+    return pa.array(values, field.type)
+
+
+def general_info_schema(url_column_name: str = "URL") -> "pa.Schema":
+    """
+    Build the schema of the general info table.
+    """
+    return pa.schema(
+        (url_column_name if name is None else name, GENERAL_INFO_TYPES[key])
+        for name, key in GENERAL_INFO_COLUMNS
+    )
+
+
+def _standard_table(columns: List[str], rows: Iterable) -> "pa.Table":
+    items = list(rows)
+    keys = key_array(columns[0], [key for key, _ in items])
+    counts = pa.array([count for _, count in items], pa.int64())
+    return pa.table([keys, counts], names=columns)
+
+
+def columnar_tables(data: Dict) -> Dict[str, "pa.Table"]:
+    """
+    Build the Arrow tables of a payload.
+
+    Args:
+        data: Raw data dictionary
+
+    Returns:
+        Mapping of file name (without extension) to Arrow table
+    """
+    tables = {
+        TABLE_FILE_NAMES[table_name]: _standard_table(columns, rows)
+        for table_name, columns, rows in iter_tables(data)
+    }
+    columns, row = general_info_table(data, "URL")
+    tables["general_info"] = pa.Table.from_pylist(
+        [dict(zip(columns, row))], schema=general_info_schema("URL")
+    )
+    return tables
+
+
+def _write_table(
+    table: "pa.Table", target, format: Literal["parquet", "arrow"], compression: str
+) -> None:
+    if format == "parquet":
+        pq.write_table(table, target, compression=compression)
+    else:
+        feather.write_feather(table, target, compression=compression)
+
+
+def export_to_columnar(
+    data,
+    filename: Union[str, IO[bytes]] = "export",
+    format: Literal["parquet", "arrow"] = "parquet",
+    compression: str = DEFAULT_COMPRESSION,
+    tables: Optional[StatisticsTables] = None,
+) -> None:
+    """
+    Export the standard tables and general info as Parquet or Arrow files.
+
+    Args:
+        data: Raw data dictionary
+        filename: Directory to write the files into (created if missing), or
+            a binary file-like object to write them into as a zip archive
+        format: "parquet" or "arrow" (Arrow IPC, readable as Feather v2)
+        compression: Compression codec ("zstd", "lz4", or "uncompressed"
+            for Arrow; any Parquet codec for Parquet)
+        tables: Memoized tables of ``data`` to reuse
+    """
+    if format not in COLUMNAR_EXTENSIONS:
+        raise ValueError("Invalid columnar format. Choose either 'parquet' or 'arrow'.")
+    arrow_tables = tables.arrow() if tables else columnar_tables(data)
+    if not isinstance(filename, str):
+        # The files are compressed already, so they are stored as they are
+        with zipfile.ZipFile(filename, "w", zipfile.ZIP_STORED) as zipf:
+            for name, table in arrow_tables.items():
+                content = io.BytesIO()
+                _write_table(table, content, format, compression)
+                zipf.writestr(name + COLUMNAR_EXTENSIONS[format], content.getvalue())
+        return
+    os.makedirs(filename, exist_ok=True)
+    for name, table in arrow_tables.items():
+        path = os.path.join(filename, name + COLUMNAR_EXTENSIONS[format])
+        _write_table(table, path, format, compression)
+    print(f"Data successfully written to {filename}")
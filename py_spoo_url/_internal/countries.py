@@ -0,0 +1,175 @@
+import csv
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Literal, NamedTuple, Optional
+
+
+COUNTRIES_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "countries.csv"
+)
+
+_PUNCTUATION = re.compile(r"[.,'’()\-]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class Country(NamedTuple):
+    """
+    A row of the packaged country lookup table.
+
+    ``name`` is the Natural Earth ``NAME`` for every country drawn on the
+    heatmaps, so it can be joined against the world geometry directly.
+    """
+
+    name: str
+    iso2: str
+    iso3: str
+    continent: str
+    region: str
+    subregion: str
+
+
+def normalize_country_name(name: str) -> str:
+    """
+    Normalize a country name for lookups (case, accents, punctuation, "&").
+
+    Args:
+        name: Country name as reported by the API
+
+    Returns:
+        Normalized lookup key
+    """
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    name = name.casefold().replace("&", " and ")
+    name = _PUNCTUATION.sub(" ", name)
+    return _WHITESPACE.sub(" ", name).strip()
+
+
+@lru_cache(maxsize=None)
+def load_country_index() -> Dict[str, Country]:
+    """
+    Load the packaged country table into a lookup dictionary.
+
+    Every name, alias and ISO code is indexed both verbatim and normalized,
+    so resolving a name is a single dictionary lookup. The table is read
+    once per process.
+
+    Returns:
+        Dictionary mapping names, aliases and codes to countries
+    """
+    index: Dict[str, Country] = {}
+    with open(COUNTRIES_FILE, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            aliases = row.pop("aliases")
+            country = Country(**row)
+            keys = [country.name, country.iso2, country.iso3]
+            keys.extend(aliases.split("|") if aliases else [])
+            for key in keys:
+                if not key:
+                    continue
+                index.setdefault(key, country)
+                index.setdefault(normalize_country_name(key), country)
+    return index
+
+
+def resolve_country(name: str) -> Optional[Country]:
+    """
+    Resolve a country name, alias or ISO code to its table entry.
+
+    Args:
+        name: Country name, alias, ISO 3166-1 alpha-2 or alpha-3 code
+
+    Returns:
+        The matching Country, or None if the name is unknown
+    """
+    index = load_country_index()
+    country = index.get(name)
+    if country is None and isinstance(name, str):
+        country = index.get(normalize_country_name(name))
+    return country
+
+
+def canonical_country_names(data_analysis: Dict[str, int]) -> Dict[str, int]:
+    """
+    Re-key a country analysis by canonical (Natural Earth) country names.
+
+    Counts reported under different aliases of the same country are summed.
+    Names that cannot be resolved are kept as they are.
+
+    Args:
+        data_analysis: Mapping of country names to counts
+
+    Returns:
+        Mapping of canonical country names to counts
+    """
+    result: Dict[str, int] = {}
+    for name, count in data_analysis.items():
+        country = resolve_country(name)
+        key = country.name if country is not None else name
+        result[key] = result.get(key, 0) + count
+    return result
+
+
+def countries_by_iso(
+    data_analysis: Dict[str, int],
+    code: Literal["iso2", "iso3"] = "iso3",
+    unknown_label: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Re-key a country analysis by ISO 3166-1 code.
+
+    Args:
+        data_analysis: Mapping of country names to counts
+        code: Which code to key by, "iso2" or "iso3"
+        unknown_label: Key to collect unresolved countries under (dropped if None)
+
+    Returns:
+        Mapping of ISO codes to counts
+    """
+    if code not in ("iso2", "iso3"):
+        raise ValueError("Invalid ISO code type. Choose either 'iso2' or 'iso3'.")
+    result: Dict[str, int] = {}
+    for name, count in data_analysis.items():
+        country = resolve_country(name)
+        key = getattr(country, code) if country is not None else None
+        if not key:
+            if unknown_label is None:
+                continue
+            key = unknown_label
+        result[key] = result.get(key, 0) + count
+    return result
+
+
+def countries_by_region(
+    data_analysis: Dict[str, int],
+    level: Literal["continent", "region", "subregion"] = "continent",
+    unknown_label: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Aggregate a country analysis by continent, UN region or UN subregion.
+
+    Args:
+        data_analysis: Mapping of country names to counts
+        level: Aggregation level, "continent", "region" or "subregion"
+        unknown_label: Key to collect unresolved countries under (dropped if None)
+
+    Returns:
+        Mapping of region names to summed counts
+    """
+    if level not in ("continent", "region", "subregion"):
+        raise ValueError(
+            "Invalid region level. Choose either 'continent', 'region' or 'subregion'."
+        )
+    result: Dict[str, int] = {}
+    for name, count in data_analysis.items():
+        country = resolve_country(name)
+        if country is not None:
+            key = getattr(country, level)
+        elif unknown_label is not None:
+            key = unknown_label
+        else:
+            continue
+        result[key] = result.get(key, 0) + count
+    return result
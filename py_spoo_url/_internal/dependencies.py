@@ -0,0 +1,28 @@
+EXTRAS = {
+    "matplotlib": "charts",
+    "mpl_toolkits": "charts",
+    "numpy": "charts",
+    "geopandas": "geo",
+    "pandas": "export",
+    "openpyxl": "export",
+    "pyarrow": "parquet",
+    "zstandard": "zstd",
+}
+
+
+def missing_dependency(package: str, feature: str) -> ImportError:
+    """
+    Build the error raised when an optional feature's dependency is missing.
+
+    Args:
+        package: Name of the package that failed to import
+        feature: Human readable name of the feature that needs it
+
+    Returns:
+        ImportError naming the extra to install
+    """
+    extra = EXTRAS.get(package, "all")
+    return ImportError(
+        f"{feature} requires the optional dependency '{package}', which is not "
+        f"installed. Install it with: pip install py_spoo_url[{extra}]"
+    )
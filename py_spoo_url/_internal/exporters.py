@@ -1,106 +1,324 @@
-import pandas as pd
+import io
 import json
 import os
-import shutil
+import time
 import zipfile
-from typing import Literal
-from .utils import create_dataframes_from_data, create_general_info_dataframe, STANDARD_DATAFRAME_CONFIGS
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Dict, Iterable, List, Literal, Optional, Sequence, Union
+from .dependencies import missing_dependency
+from .tables import (
+    CSV_FILE_NAMES,
+    EXCEL_SHEET_NAMES,
+    StatisticsTables,
+    general_info_table,
+    iter_tables,
+)
+from .textexport import csv_tables, ndjson_lines, ndjson_records
+from .transforms import top_n_dimensions
 
+# pandas is only imported by the engines that need it, see utils.py
+
+
+def _written(filename: Union[str, IO[bytes]]) -> None:
+    # Streams are written silently, e.g. when serving an export over HTTP
+    if isinstance(filename, str):
+        print(f"Data successfully written to {filename}")
+
+
+def _append_sheet(workbook, title: str, columns: List[str], rows: Iterable) -> None:
+    sheet = workbook.create_sheet(title)
+    sheet.append(columns)
+    for row in rows:
+        sheet.append(row)
+
+
+def _write_excel_streaming(data, filename: Union[str, IO[bytes]]) -> None:
+    import openpyxl  # type: ignore
+
+    # Write-only workbooks stream rows to disk instead of keeping cells in memory
+    workbook = openpyxl.Workbook(write_only=True)
+    for table_name, columns, rows in iter_tables(data):
+        _append_sheet(workbook, EXCEL_SHEET_NAMES[table_name], columns, rows)
+    columns, row = general_info_table(data, "URL")
+    _append_sheet(workbook, "General_Info", columns, [row])
+    workbook.save(filename)
+
+
+def export_to_excel(
+    data, filename: Union[str, IO[bytes]] = "export.xlsx", streaming: bool = True
+) -> None:
+    try:
+        import openpyxl  # type: ignore # noqa: F401
+    except ImportError as e:
+        raise missing_dependency("openpyxl", "Excel export") from e
+
+    if streaming:
+        _write_excel_streaming(data, filename)
+        _written(filename)
+        return
+
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise missing_dependency("pandas", "Excel export") from e
+    from .utils import (
+        create_dataframes_from_data,
+        create_general_info_dataframe,
+        STANDARD_DATAFRAME_CONFIGS,
+    )
 
-def export_to_excel(data, filename: str = "export.xlsx") -> None:
     # Create all standard DataFrames using utility function
     dataframes = create_dataframes_from_data(data, STANDARD_DATAFRAME_CONFIGS)
-    
+
     # Create general info DataFrame
     df_general_info = create_general_info_dataframe(data, "URL")
-    
-    # Excel sheet name mapping
-    sheet_mapping = {
-        "df_browser": "Browser",
-        "df_counter": "Counter", 
-        "df_country": "Country",
-        "df_os_name": "OS_Name",
-        "df_referrer": "Referrer",
-        "df_unique_browser": "Unique_Browser",
-        "df_unique_counter": "Unique_Counter",
-        "df_unique_country": "Unique_Country",
-        "df_unique_os_name": "Unique_OS_Name",
-        "df_unique_referrer": "Unique_Referrer",
-    }
-    
+
     with pd.ExcelWriter(filename, engine="openpyxl") as writer:
         # Write all standard DataFrames
-        for df_name, sheet_name in sheet_mapping.items():
+        for df_name, sheet_name in EXCEL_SHEET_NAMES.items():
             if df_name in dataframes:
                 dataframes[df_name].to_excel(writer, sheet_name=sheet_name, index=False)
-        
+
         # Write general info
         df_general_info.to_excel(writer, sheet_name="General_Info", index=False)
-    
-    print(f"Data successfully written to {filename}")
 
+    _written(filename)
+
+
+def _pandas_csv_tables(data) -> Iterable:
+    from .utils import (
+        create_dataframes_from_data,
+        create_general_info_dataframe,
+        STANDARD_DATAFRAME_CONFIGS,
+    )
 
-def export_to_csv(data, filename: str = "export.csv") -> None:
-    csv_directory = "csv_files"
-    os.makedirs(csv_directory, exist_ok=True)
-    
     # Create all standard DataFrames using utility function
     dataframes = create_dataframes_from_data(data, STANDARD_DATAFRAME_CONFIGS)
-    
+    for df_name, csv_filename in CSV_FILE_NAMES.items():
+        if df_name in dataframes:
+            yield csv_filename, dataframes[df_name].to_csv(index=False)
+
     # Create general info DataFrame (with empty string for URL column in CSV)
     df_general_info = create_general_info_dataframe(data, "")
-    
-    # CSV file name mapping
-    csv_mapping = {
-        "df_browser": "browser.csv",
-        "df_counter": "counter.csv",
-        "df_country": "country.csv",
-        "df_os_name": "os_name.csv",
-        "df_referrer": "referrer.csv",
-        "df_unique_browser": "unique_browser.csv",
-        "df_unique_counter": "unique_counter.csv",
-        "df_unique_country": "unique_country.csv",
-        "df_unique_os_name": "unique_os_name.csv",
-        "df_unique_referrer": "unique_referrer.csv",
-    }
-    
-    # Save all DataFrames to CSV files
-    for df_name, csv_filename in csv_mapping.items():
-        if df_name in dataframes:
-            dataframes[df_name].to_csv(os.path.join(csv_directory, csv_filename), index=False)
-    
-    # Save general info
-    df_general_info.to_csv(os.path.join(csv_directory, "general_info.csv"), index=False)
-    
-    # Create zip file
-    with zipfile.ZipFile(f"{filename}.zip", "w") as zipf:
-        for root, dirs, files in os.walk(csv_directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, csv_directory)
-                zipf.write(file_path, arcname=arcname)
-    
-    # Clean up temporary directory
-    shutil.rmtree(csv_directory)
-    print(f"Data successfully written to {filename}.zip")
-
-
-def export_to_json(data, filename: str = "export.json") -> None:
-    with open(filename, "w") as w:
-        w.write(json.dumps(data, indent=4))
-    print(f"Data successfully written to {filename}")
+    yield "general_info.csv", df_general_info.to_csv(index=False)
+
+
+def export_to_csv(
+    data,
+    filename: Union[str, IO[bytes]] = "export.csv",
+    engine: Literal["auto", "stdlib", "pandas"] = "auto",
+    tables: Optional[StatisticsTables] = None,
+) -> None:
+    """
+    Export the standard tables and general info as CSV files inside a zip.
+
+    The CSVs are built in memory and written straight into the archive, so no
+    temporary directory is used and concurrent exports cannot collide.
+
+    Args:
+        data: Raw data dictionary
+        filename: Name of the zip (".zip" is appended) or a binary file-like
+            object to write the archive into
+        engine: "stdlib" writes the CSVs with the csv module, "pandas" through
+            DataFrames; both produce identical files, so "auto" uses "stdlib"
+        tables: Memoized tables of ``data`` whose CSV texts the "stdlib"
+            engine reuses
+    """
+    if engine not in ("auto", "stdlib", "pandas"):
+        raise ValueError("Invalid engine. Choose either 'auto', 'stdlib' or 'pandas'.")
+    # Build the files first so a failure does not leave a partial archive
+    if engine == "pandas":
+        files = dict(_pandas_csv_tables(data))
+    else:
+        files = tables.csv_files() if tables else dict(csv_tables(data))
+
+    target = f"{filename}.zip" if isinstance(filename, str) else filename
+    with zipfile.ZipFile(target, "w") as zipf:
+        for csv_filename, content in files.items():
+            zipf.writestr(csv_filename, content)
+
+    _written(target)
+
+
+def export_to_json(data, filename: Union[str, IO[bytes]] = "export.json") -> None:
+    content = json.dumps(data, indent=4)
+    if isinstance(filename, str):
+        with open(filename, "w") as w:
+            w.write(content)
+    else:
+        filename.write(content.encode("utf-8"))
+    _written(filename)
+
+
+def export_to_ndjson(data, filename: Union[str, IO[bytes]] = "export.ndjson") -> None:
+    """
+    Export the standard tables and general info as newline-delimited JSON.
+
+    Every line is one compact record holding a table row and the name of its
+    ``table``, see ``ndjson_records``.
+
+    Args:
+        data: Raw data dictionary
+        filename: Path or binary file-like object to write into
+    """
+    lines = ndjson_lines(ndjson_records(data))
+    if isinstance(filename, str):
+        with open(filename, "w", encoding="utf-8") as w:
+            w.writelines(lines)
+    else:
+        filename.write("".join(lines).encode("utf-8"))
+    _written(filename)
 
 
 def export_data(
     data,
-    filename: str = "export.xlsx",
-    filetype: Literal["csv", "xlsx", "json"] = "xlsx",
+    filename: Union[str, IO[bytes]] = "export.xlsx",
+    filetype: Literal[
+        "csv", "xlsx", "json", "ndjson", "parquet", "arrow", "sqlite"
+    ] = "xlsx",
+    top_n: Optional[int] = None,
+    tables: Optional[StatisticsTables] = None,
 ) -> None:
+    if top_n is not None:
+        # The memoized tables hold the full payload
+        data = top_n_dimensions(data, top_n)
+        tables = None
     if filetype == "xlsx":
         export_to_excel(data, filename)
     elif filetype == "json":
         export_to_json(data, filename)
+    elif filetype == "ndjson":
+        export_to_ndjson(data, filename)
     elif filetype == "csv":
-        export_to_csv(data, filename)
+        export_to_csv(data, filename, tables=tables)
+    elif filetype in ("parquet", "arrow"):
+        from .columnar import export_to_columnar
+
+        export_to_columnar(data, filename, format=filetype, tables=tables)
+    elif filetype == "sqlite":
+        if not isinstance(filename, str):
+            raise ValueError("SQLite exports need a database path.")
+        from .sqlite import sync_sqlite
+
+        sync_sqlite([data], filename)
+        _written(filename)
     else:
-        raise ValueError("Invalid file type. Choose either 'csv', 'json' or 'xlsx'.")
+        raise ValueError(
+            "Invalid file type. Choose either 'csv', 'json', 'ndjson', 'xlsx', "
+            "'parquet', 'arrow' or 'sqlite'."
+        )
+
+
+def export_data_bytes(
+    data,
+    filetype: Literal["csv", "xlsx", "json", "ndjson", "parquet", "arrow"] = "xlsx",
+    top_n: Optional[int] = None,
+    buffer: Optional[IO[bytes]] = None,
+    tables: Optional[StatisticsTables] = None,
+) -> Optional[bytes]:
+    """
+    Export the data in memory instead of to the filesystem.
+
+    CSV, Parquet and Arrow exports are zip archives with one file per table.
+
+    Args:
+        data: Raw data dictionary
+        filetype: Export format
+        top_n: Keep only the ``top_n`` largest entries of each dimension
+        buffer: Binary file-like object to write into instead of returning bytes
+        tables: Memoized tables of ``data`` to reuse
+
+    Returns:
+        The exported file, or None if it was written into ``buffer``
+    """
+    target = buffer if buffer is not None else io.BytesIO()
+    export_data(data, target, filetype=filetype, top_n=top_n, tables=tables)
+    if buffer is None:
+        return target.getvalue()
+    return None
+
+
+# File name suffix of each format in export_formats ("csv" is zipped)
+FORMAT_SUFFIXES = {
+    "xlsx": ".xlsx",
+    "csv": ".csv.zip",
+    "json": ".json",
+    "ndjson": ".ndjson",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+    "sqlite": ".db",
+}
+
+
+def _prepare_tables(tables: StatisticsTables, filetype: str) -> None:
+    # Build what the writer reads up front, so the writer threads only read
+    # the shared tables and never build the same table twice
+    if filetype == "csv":
+        tables.csv_files()
+    elif filetype in ("parquet", "arrow"):
+        tables.arrow()
+
+
+def _export_size(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(folder, name))
+        for folder, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def export_formats(
+    data,
+    filename: str = "export",
+    filetypes: Sequence[str] = ("xlsx", "csv", "json"),
+    top_n: Optional[int] = None,
+    tables: Optional[StatisticsTables] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Union[str, int, float]]]:
+    """
+    Export the data in several formats at once.
+
+    The tables shared by the formats are built once, then every format is
+    written by its own thread.
+
+    Args:
+        data: Raw data dictionary
+        filename: Base path; each format appends its suffix ("export.xlsx",
+            "export.csv.zip", "export.json", "export.parquet/", ...)
+        filetypes: Formats to write, any of those accepted by ``export_data``
+        top_n: Keep only the ``top_n`` largest entries of each dimension
+        tables: Memoized tables of ``data`` to reuse
+        max_workers: Number of writer threads (one per format by default)
+
+    Returns:
+        Mapping of format to its ``path``, ``size`` in bytes (summed over the
+        files of Parquet and Arrow directories) and writing time in ``seconds``
+    """
+    filetypes = list(dict.fromkeys(filetypes))
+    invalid = [filetype for filetype in filetypes if filetype not in FORMAT_SUFFIXES]
+    if invalid:
+        raise ValueError(
+            f"Invalid file type {invalid[0]!r}. Choose from 'csv', 'json', "
+            "'ndjson', 'xlsx', 'parquet', 'arrow' or 'sqlite'."
+        )
+    if top_n is not None:
+        data = top_n_dimensions(data, top_n)
+        tables = None
+    tables = tables or StatisticsTables(data)
+    for filetype in filetypes:
+        _prepare_tables(tables, filetype)
+
+    def write(filetype: str) -> Dict[str, Union[str, int, float]]:
+        path = filename + FORMAT_SUFFIXES[filetype]
+        start = time.perf_counter()
+        # export_to_csv appends ".zip" itself
+        target = path[: -len(".zip")] if filetype == "csv" else path
+        export_data(data, target, filetype=filetype, tables=tables)
+        seconds = time.perf_counter() - start
+        return {"path": path, "size": _export_size(path), "seconds": seconds}
+
+    with ThreadPoolExecutor(max_workers or max(len(filetypes), 1)) as executor:
+        futures = {filetype: executor.submit(write, filetype) for filetype in filetypes}
+        return {filetype: future.result() for filetype, future in futures.items()}
@@ -0,0 +1,211 @@
+"""
+Reusable country heatmap base layer.
+
+Building a heatmap from scratch means creating the figure, the axes, the
+country boundaries, the fill polygons and the colour bar. ``HeatmapRenderer``
+does that once and then only swaps the values of the fill collection for
+every new dataset, which makes rendering heatmaps for many links or animating
+a sequence of snapshots much cheaper. For PNG output the static layers are
+also rasterized once and only the fills, the colour bar and the title are
+redrawn on top of the saved background (blitting).
+
+A renderer owns a single figure, so it must not be shared between threads;
+create one per thread or process instead.
+"""
+
+import io
+from typing import IO, Dict, Literal, Optional, Sequence, Tuple
+from .dependencies import missing_dependency
+
+try:
+    import matplotlib  # type: ignore
+    import matplotlib.image  # type: ignore
+    from matplotlib.animation import FuncAnimation  # type: ignore
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
+    from matplotlib.collections import LineCollection, PolyCollection  # type: ignore
+    from matplotlib.figure import Figure  # type: ignore
+    import numpy as np
+except ImportError as e:
+    raise missing_dependency((e.name or "matplotlib").split(".")[0], "Charting") from e
+from .countries import canonical_country_names
+from .plotting import (
+    HEATMAP_FACECOLOR,
+    HEATMAP_FIGSIZE,
+    _finish_heatmap,
+    _setup_heatmap_axes,
+)
+from .polygons import load_world_polygons
+from .rendering import figure_to_bytes
+
+
+class HeatmapRenderer:
+    """
+    Country heatmap whose base map is drawn once and recoloured per dataset.
+
+    The output matches the "polygons" heatmap engine. By default the colour
+    scale follows each dataset; pass ``vmin``/``vmax`` to fix it (e.g. to
+    compare links on the same scale).
+    """
+
+    def __init__(
+        self,
+        cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+        title: str = "Countries Heatmap",
+        figsize: Optional[Tuple[float, float]] = None,
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+    ):
+        self.vmin = vmin
+        self.vmax = vmax
+        self._world = load_world_polygons()
+        self._country_index = {name: i for i, name in enumerate(self._world.names)}
+
+        self.figure = Figure(
+            figsize=figsize or HEATMAP_FIGSIZE, facecolor=HEATMAP_FACECOLOR
+        )
+        FigureCanvasAgg(self.figure)
+        ax, cax = _setup_heatmap_axes(self.figure)
+        self._boundaries = LineCollection(self._world.rings, linewidths=1, colors="C0")
+        ax.add_collection(self._boundaries)
+        self._fills = PolyCollection(
+            self._world.rings,
+            array=np.ma.masked_all(len(self._world.rings)),
+            cmap=matplotlib.colormaps[cmap].with_extremes(bad=(0, 0, 0, 0)),
+            edgecolors="none",
+            alpha=0.9,
+        )
+        self._fills.set_clim(0 if vmin is None else vmin, 1 if vmax is None else vmax)
+        ax.add_collection(self._fills)
+        minx, miny, maxx, maxy = self._world.bounds
+        ax.autoscale_view()
+        ax.set_aspect(1 / np.cos(np.radians((miny + maxy) / 2)))
+        self._colorbar = self.figure.colorbar(self._fills, cax=cax, label="Clicks")
+        self._colorbar.solids.set_alpha(1)
+        self._title = _finish_heatmap(self.figure, ax, cax, title)
+        self._background = None
+
+    def _values(self, data_analysis: Dict[str, int]) -> np.ndarray:
+        values = np.full(len(self._world.names), np.nan)
+        for name, value in canonical_country_names(data_analysis).items():
+            index = self._country_index.get(name)
+            if index is not None:
+                values[index] = value
+        return values
+
+    def update(
+        self, data_analysis: Dict[str, int], title: Optional[str] = None
+    ) -> Figure:
+        """
+        Recolour the countries with a new dataset.
+
+        Args:
+            data_analysis: Mapping of country names to clicks
+            title: New figure title (unchanged if None)
+
+        Returns:
+            The renderer's Figure
+        """
+        self._recolour(data_analysis, title, self.vmin, self.vmax)
+        return self.figure
+
+    def _recolour(
+        self,
+        data_analysis: Dict[str, int],
+        title: Optional[str],
+        vmin: Optional[float],
+        vmax: Optional[float],
+    ) -> None:
+        values = self._values(data_analysis)
+        self._fills.set_array(np.ma.masked_invalid(values[self._world.ring_country]))
+        if np.isfinite(values).any():
+            vmin = np.nanmin(values) if vmin is None else vmin
+            vmax = np.nanmax(values) if vmax is None else vmax
+        self._fills.set_clim(0 if vmin is None else vmin, 1 if vmax is None else vmax)
+        self._colorbar.solids.set_alpha(1)
+        if title is not None:
+            self._title.set_text(title)
+
+    def _blit(self, dpi: float) -> None:
+        canvas = self.figure.canvas
+        # in drawing order: boundaries have a higher zorder than the fills
+        dynamic = [self._fills, self._boundaries, self._colorbar.ax, self._title]
+        if self._background is None or self.figure.dpi != dpi:
+            self.figure.set_dpi(dpi)
+            for artist in dynamic:
+                artist.set_visible(False)
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.figure.bbox)
+            for artist in dynamic:
+                artist.set_visible(True)
+        else:
+            canvas.restore_region(self._background)
+        for artist in dynamic:
+            self.figure.draw_artist(artist)
+
+    def render(
+        self,
+        data_analysis: Dict[str, int],
+        title: Optional[str] = None,
+        format: Literal["png", "svg", "webp", "jpg", "pdf"] = "png",
+        dpi: float = 100,
+        buffer: Optional[IO[bytes]] = None,
+    ) -> Optional[bytes]:
+        """
+        Recolour the countries and encode the heatmap.
+
+        Returns:
+            The encoded image, or None if it was written into ``buffer``
+        """
+        self.update(data_analysis, title=title)
+        if format != "png":
+            return figure_to_bytes(self.figure, format=format, dpi=dpi, buffer=buffer)
+        self._blit(dpi)
+        target = buffer if buffer is not None else io.BytesIO()
+        matplotlib.image.imsave(
+            target,
+            self.figure.canvas.buffer_rgba(),
+            format="png",
+            origin="upper",
+            dpi=dpi,
+        )
+        if buffer is None:
+            return target.getvalue()
+        return None
+
+    def animate(
+        self,
+        frames: Sequence[Dict[str, int]],
+        titles: Optional[Sequence[str]] = None,
+        interval: int = 500,
+        **kwargs,
+    ) -> FuncAnimation:
+        """
+        Animate a sequence of country datasets (e.g. one per day or per link).
+
+        Unless ``vmin``/``vmax`` were given, the colour scale is fixed to the
+        range of all frames so colours are comparable between frames.
+
+        Args:
+            frames: Country to clicks mappings, one per frame
+            titles: Title of each frame (the current title is kept if None)
+            interval: Delay between frames in milliseconds
+            **kwargs: Passed to ``FuncAnimation``
+
+        Returns:
+            The animation; save it with ``animation.save("map.gif", writer="pillow")``
+        """
+        # The range of the drawn values: aliases summed, unknown names dropped
+        drawn = np.concatenate([self._values(frame) for frame in frames] or [[]])
+        drawn = drawn[np.isfinite(drawn)]
+        vmin, vmax = (drawn.min(), drawn.max()) if drawn.size else (None, None)
+        vmin = vmin if self.vmin is None else self.vmin
+        vmax = vmax if self.vmax is None else self.vmax
+
+        def draw_frame(index):
+            title = None if titles is None else titles[index]
+            self._recolour(frames[index], title, vmin, vmax)
+            return [self._fills, self._title]
+
+        return FuncAnimation(
+            self.figure, draw_frame, frames=len(frames), interval=interval, **kwargs
+        )
@@ -0,0 +1,323 @@
+"""
+Incremental exports that only write what changed since the last run.
+
+A JSON watermark keeps, per link, the last exported date with its counts, the
+click totals up to that date and the exported dimension counts. Each run then
+appends only:
+
+- daily rows for days after the watermark, and for the watermark day itself
+  if its counts changed (it was usually still in progress); if an older day
+  changed, the link's full history is written again
+- dimension rows holding the change of each count since the last run
+
+Rows carry the ``Exported_At`` time of their run, so for daily rows the latest
+export of a (link, date) pair wins, and dimension deltas sum up to the current
+counts. The SQLite target upserts absolute counts of the changed rows instead.
+Each run writes its rows to hidden temporary files, which are only appended
+(CSV) or renamed (Parquet) into the export once every link was written, and
+the watermark is replaced after that. An interrupted run leaves neither rows
+nor watermark behind, so it is exported again in full instead of being lost
+or counted twice.
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union
+from ..statistics import Statistics
+from .bulk import SHORT_CODE_COLUMN, _CsvPart, _ParquetPart
+from .sqlite import DIMENSIONS
+
+WATERMARK_FILE = "watermark.json"
+DAILY_COLUMNS = [SHORT_CODE_COLUMN, "Date", "Clicks", "Unique_Clicks", "Exported_At"]
+DIMENSION_COLUMNS = [
+    SHORT_CODE_COLUMN,
+    "Dimension",
+    "Value",
+    "Clicks",
+    "Unique_Clicks",
+    "Exported_At",
+]
+
+
+def load_watermark(path: str) -> Dict[str, Dict]:
+    """
+    Read a watermark file, or return an empty watermark if it does not exist.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_watermark(path: str, watermark: Dict[str, Dict]) -> None:
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(watermark, f, separators=(",", ":"))
+    os.replace(temporary, path)
+
+
+def link_changes(
+    data: Dict, mark: Optional[Dict]
+) -> Tuple[List[Tuple], List[Tuple], Dict]:
+    """
+    Compare a payload with its watermark.
+
+    Args:
+        data: Raw data dictionary
+        mark: Watermark of the link (None if it was never exported)
+
+    Returns:
+        The new or changed days as (date, clicks, unique clicks), the changed
+        dimension values as (dimension, value, clicks, unique clicks, clicks
+        delta, unique clicks delta), and the link's new watermark
+    """
+    mark = mark or {}
+    clicks = data.get("counter", {})
+    unique_clicks = data.get("unique_counter", {})
+    days = sorted(set(clicks) | set(unique_clicks))
+    counts = {day: [clicks.get(day, 0), unique_clicks.get(day, 0)] for day in days}
+
+    last_date = mark.get("last_date")
+    if last_date is None:
+        changed = days
+    else:
+        changed = [
+            day
+            for day in days
+            if day > last_date
+            or (day == last_date and counts[day] != mark.get("last_counts"))
+        ]
+        # Earlier days are only checked through their totals
+        before = [day for day in days if day < last_date]
+        totals = [sum(counts[day][i] for day in before) for i in (0, 1)]
+        if totals != mark.get("totals_before"):
+            changed = days
+
+    previous = mark.get("dimensions", {})
+    dimensions, deltas = {}, []
+    for dimension in DIMENSIONS:
+        current = data.get(dimension, {})
+        unique_current = data.get(f"unique_{dimension}", {})
+        exported = previous.get(dimension, {})
+        values = {}
+        for value in {**exported, **current, **unique_current}:
+            now = [current.get(value, 0), unique_current.get(value, 0)]
+            old = exported.get(value, [0, 0])
+            if now != old:
+                deltas.append(
+                    (dimension, value, *now, now[0] - old[0], now[1] - old[1])
+                )
+            if now != [0, 0]:
+                values[value] = now
+        dimensions[dimension] = values
+
+    last = days[-1] if days else None
+    new_mark = {
+        "last_date": last,
+        "last_counts": counts[last] if last else None,
+        "totals_before": [
+            sum(counts[day][i] for day in days if day != last) for i in (0, 1)
+        ],
+        "dimensions": dimensions,
+    }
+    daily = [(day, *counts[day]) for day in changed]
+    return daily, deltas, new_mark
+
+
+def _changed_payload(data: Dict, daily: List[Tuple], deltas: List[Tuple]) -> Dict:
+    # The payload reduced to the changed rows, with their absolute counts
+    changes = dict(data)
+    changes["counter"] = {day: clicks for day, clicks, _ in daily}
+    changes["unique_counter"] = {day: unique for day, _, unique in daily}
+    for dimension in DIMENSIONS:
+        changes[dimension], changes[f"unique_{dimension}"] = {}, {}
+    for dimension, value, clicks, unique_clicks, _, _ in deltas:
+        changes[dimension][value] = clicks
+        changes[f"unique_{dimension}"][value] = unique_clicks
+    return changes
+
+
+def _open_writers(
+    target: str, filetype: str, run: str, compression: Optional[str]
+) -> List[Tuple[object, str, str]]:
+    # Returns the daily and dimension writers with their temporary and final
+    # paths; the hidden temporary names are skipped by dataset readers
+    if filetype == "csv":
+        os.makedirs(target, exist_ok=True)
+        writers = []
+        for name, columns in (
+            ("daily_clicks.csv", DAILY_COLUMNS),
+            ("dimension_counts.csv", DIMENSION_COLUMNS),
+        ):
+            temporary = os.path.join(target, f".{name}.{run}.tmp")
+            writers.append(
+                (_CsvPart(temporary, columns), temporary, os.path.join(target, name))
+            )
+        return writers
+    from .columnar import DIMENSION_TYPE, pa
+
+    # Parquet files cannot be appended to, so every run adds one file
+    name = f"part-{run}.parquet"
+    writers = []
+    for table, schema in (
+        (
+            "daily_clicks",
+            [
+                (SHORT_CODE_COLUMN, DIMENSION_TYPE),
+                ("Date", pa.date32()),
+                ("Clicks", pa.int64()),
+                ("Unique_Clicks", pa.int64()),
+            ],
+        ),
+        (
+            "dimension_counts",
+            [
+                (SHORT_CODE_COLUMN, DIMENSION_TYPE),
+                ("Dimension", DIMENSION_TYPE),
+                ("Value", pa.string()),
+                ("Clicks", pa.int64()),
+                ("Unique_Clicks", pa.int64()),
+            ],
+        ),
+    ):
+        folder = os.path.join(target, table)
+        os.makedirs(folder, exist_ok=True)
+        schema = pa.schema(schema + [("Exported_At", DIMENSION_TYPE)])
+        temporary = os.path.join(folder, f".{name}.tmp")
+        try:
+            part = _ParquetPart(temporary, schema, compression)
+        except BaseException:
+            _discard_writers(writers)
+            raise
+        writers.append((part, temporary, os.path.join(folder, name)))
+    return writers
+
+
+def _close_writers(writers: List[Tuple[object, str, str]]) -> None:
+    # Every writer is closed even if another one fails; the first error wins
+    error = None
+    for writer, _, _ in writers:
+        try:
+            writer.close()
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+
+
+def _discard_writers(writers: List[Tuple[object, str, str]]) -> None:
+    # Runs while another error propagates, so its own errors are swallowed
+    for writer, temporary, _ in writers:
+        try:
+            writer.close()
+        except Exception:
+            pass
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+
+def _publish(temporary: str, path: str) -> None:
+    if path.endswith(".parquet"):
+        os.replace(temporary, path)
+        return
+    # Append the CSV rows, with the header only if the file is new
+    with open(temporary, encoding="utf-8", newline="") as source:
+        header = source.readline()
+        new = not os.path.exists(path) or not os.path.getsize(path)
+        with open(path, "a", encoding="utf-8", newline="") as target:
+            if new:
+                target.write(header)
+            shutil.copyfileobj(source, target)
+    os.remove(temporary)
+
+
+def export_incremental(
+    links: Iterable[Union[Statistics, Dict]],
+    filename: str = "export",
+    filetype: Literal["csv", "parquet", "sqlite"] = "csv",
+    watermark: Optional[str] = None,
+    compression: Optional[str] = "zstd",
+) -> Dict[str, int]:
+    """
+    Append only the new and changed statistics of many links.
+
+    Args:
+        links: Statistics objects or raw stats payloads (may be a generator)
+        filename: Output directory ("csv", "parquet") or database ("sqlite")
+        filetype: "csv" appends to ``daily_clicks.csv`` and
+            ``dimension_counts.csv``, "parquet" adds one file per run to the
+            ``daily_clicks`` and ``dimension_counts`` datasets, "sqlite"
+            upserts the changed rows into a ``SQLiteStore``
+        watermark: Path of the watermark file (``watermark.json`` in the
+            output directory, or ``<database>.watermark.json`` for SQLite)
+        compression: Parquet compression codec
+
+    Returns:
+        The number of links, daily rows and dimension rows written
+    """
+    if filetype not in ("csv", "parquet", "sqlite"):
+        raise ValueError(
+            "Invalid file type. Choose either 'csv', 'parquet' or 'sqlite'."
+        )
+    if watermark is None:
+        watermark = (
+            f"{filename}.watermark.json"
+            if filetype == "sqlite"
+            else os.path.join(filename, WATERMARK_FILE)
+        )
+    marks = load_watermark(watermark)
+    now = datetime.now(timezone.utc)
+    exported_at = now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    summary = {"links": 0, "daily_rows": 0, "dimension_rows": 0}
+
+    def changes():
+        for link in links:
+            data = link.data if isinstance(link, Statistics) else link
+            short_code = data["_id"]
+            daily, deltas, marks[short_code] = link_changes(data, marks.get(short_code))
+            summary["links"] += 1
+            summary["daily_rows"] += len(daily)
+            summary["dimension_rows"] += len(deltas)
+            yield data, daily, deltas
+
+    if filetype == "sqlite":
+        from .sqlite import sync_sqlite
+
+        sync_sqlite(
+            (
+                _changed_payload(data, daily, deltas)
+                for data, daily, deltas in changes()
+            ),
+            filename,
+        )
+    else:
+        writers = _open_writers(
+            filename, filetype, now.strftime("%Y%m%dT%H%M%S%fZ"), compression
+        )
+        daily_writer, dimension_writer = (writer for writer, _, _ in writers)
+        written = False
+        try:
+            for data, daily, deltas in changes():
+                short_code = data["_id"]
+                daily_writer.append([(short_code, *row, exported_at) for row in daily])
+                dimension_writer.append(
+                    [
+                        (short_code, dimension, value, *delta, exported_at)
+                        for dimension, value, _, _, *delta in deltas
+                    ]
+                )
+            # Parquet parts write their buffered rows on close, which can fail too
+            _close_writers(writers)
+            written = True
+        finally:
+            if not written:
+                _discard_writers(writers)
+        for _, temporary, path in writers:
+            _publish(temporary, path)
+
+    _save_watermark(watermark, marks)
+    print(f"Data successfully written to {filename}")
+    return summary
@@ -0,0 +1,242 @@
+"""
+Small-multiples charts for comparing many links in one figure.
+
+All panels live on a single Axes: every panel is a unit square placed on a
+grid in data coordinates, and the lines, areas, bars and frames of all panels
+are each drawn as one vectorized collection. Drawing cost therefore grows with
+the number of points, not with the number of artists, and hundreds of panels
+stay cheap to render.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union
+from .dependencies import missing_dependency
+
+try:
+    import matplotlib  # type: ignore
+    from matplotlib.collections import LineCollection, PolyCollection  # type: ignore
+    from matplotlib.figure import Figure  # type: ignore
+    from matplotlib.patches import Patch  # type: ignore
+    import numpy as np
+except ImportError as e:
+    raise missing_dependency((e.name or "matplotlib").split(".")[0], "Charting") from e
+from ..statistics import Statistics
+from .transforms import (
+    OTHER_LABEL,
+    TIME_SERIES_LABELS,
+    downsample_series,
+    top_n_with_other,
+)
+
+PANEL_SIZE = (3.0, 2.0)
+PANEL_GAP = (0.15, 0.35)
+PANEL_MAX_POINTS = 200
+PANEL_FRAME_COLOR = "#cccccc"
+PANEL_FONT_SIZE = 8
+
+
+def _panel_origins(count: int, ncols: int) -> np.ndarray:
+    index = np.arange(count)
+    return np.column_stack(
+        [
+            (index % ncols) * (1 + PANEL_GAP[0]),
+            -(index // ncols) * (1 + PANEL_GAP[1]),
+        ]
+    )
+
+
+def _series_geometry(
+    panels: List[Tuple[str, Dict]], sharey: bool, max_points: int
+) -> Tuple[List[np.ndarray], List[float], Tuple[str, str]]:
+    series = []
+    for _, values in panels:
+        # Panels are drawn on a date axis, so LTTB picks points by date too
+        days = [datetime.strptime(key, "%Y-%m-%d").toordinal() for key in values]
+        kept = downsample_series(values, "line", max_points, xs=days)
+        days = [day for day, key in zip(days, values) if key in kept]
+        values = kept
+        series.append((np.array(days, float), np.array(list(values.values()), float)))
+
+    days = [x for x, _ in series if len(x)]
+    first = min((x.min() for x in days), default=0.0)
+    last = max((x.max() for x in days), default=1.0)
+    shared_top = max((y.max() for _, y in series if len(y)), default=0.0)
+
+    lines, tops = [], []
+    for x, y in series:
+        top = shared_top if sharey else (y.max() if len(y) else 0.0)
+        tops.append(top)
+        lines.append(
+            np.column_stack([(x - first) / ((last - first) or 1), y / (top or 1)])
+        )
+    span = tuple(
+        datetime.fromordinal(int(day)).strftime("%Y-%m-%d") for day in (first, last)
+    )
+    return lines, tops, span
+
+
+def _draw_small_multiples(
+    fig: Figure,
+    panels: List[Tuple[str, Dict]],
+    chart_type: Literal["line", "area", "bar"] = "line",
+    data_label: Optional[str] = None,
+    ncols: Optional[int] = None,
+    sharey: bool = True,
+    top_n: int = 8,
+    max_points: int = PANEL_MAX_POINTS,
+) -> None:
+    """
+    Draw one panel per (title, analysis) pair onto a single Axes of ``fig``.
+
+    Time series (line/area) share the date range of all panels; dimension
+    breakdowns (bar) share one category order, the ``top_n`` categories over
+    all panels plus "Other", with one colour per category.
+    """
+    if chart_type not in ("line", "area", "bar"):
+        raise ValueError("Invalid chart type. Choose either 'line', 'area' or 'bar'.")
+    ncols = ncols or max(1, math.ceil(math.sqrt(len(panels))))
+    nrows = max(1, math.ceil(len(panels) / ncols))
+    origins = _panel_origins(len(panels), ncols)
+    ax = fig.add_axes([0.01, 0.06, 0.98, 0.88])
+    ax.set_axis_off()
+
+    if chart_type == "bar":
+        totals: Dict = {}
+        for _, values in panels:
+            for key, value in values.items():
+                totals[key] = totals.get(key, 0) + value
+        categories = list(top_n_with_other(totals, top_n) if totals else {})
+        colors = matplotlib.colormaps["tab10"].resampled(max(len(categories), 1))
+        named = [c for c in categories if c != OTHER_LABEL]
+        heights = []
+        for _, values in panels:
+            rest = sum(values.values()) - sum(values.get(c, 0) for c in named)
+            heights.append(
+                np.array(
+                    [
+                        rest if c == OTHER_LABEL else values.get(c, 0)
+                        for c in categories
+                    ],
+                    float,
+                )
+            )
+        shared_top = max((h.max() for h in heights if len(h)), default=0.0)
+        tops = [shared_top if sharey else (h.max() if len(h) else 0.0) for h in heights]
+
+        width = 1 / max(len(categories), 1)
+        left = np.arange(len(categories)) * width + width * 0.1
+        bars, bar_colors = [], []
+        for (x0, y0), height, top in zip(origins, heights, tops):
+            h = height / (top or 1)
+            for i in range(len(categories)):
+                x, w = x0 + left[i], width * 0.8
+                bars.append([(x, y0), (x, y0 + h[i]), (x + w, y0 + h[i]), (x + w, y0)])
+                bar_colors.append(colors(i))
+        ax.add_collection(
+            PolyCollection(bars, facecolors=bar_colors, edgecolors="none")
+        )
+        fig.legend(
+            handles=[Patch(color=colors(i), label=c) for i, c in enumerate(categories)],
+            loc="lower center",
+            ncol=min(len(categories), 9),
+            fontsize=PANEL_FONT_SIZE,
+            frameon=False,
+        )
+        subtitle = data_label or ""
+    else:
+        lines, tops, (first, last) = _series_geometry(panels, sharey, max_points)
+        lines = [line + origin for line, origin in zip(lines, origins)]
+        if chart_type == "area":
+            ax.add_collection(
+                PolyCollection(
+                    [
+                        np.vstack([[line[0, 0], y0], line, [line[-1, 0], y0]])
+                        for line, (_, y0) in zip(lines, origins)
+                        if len(line)
+                    ],
+                    facecolors="C0",
+                    edgecolors="none",
+                    alpha=0.4,
+                )
+            )
+        ax.add_collection(LineCollection(lines, colors="C0", linewidths=1))
+        subtitle = f"{data_label or ''} {first} to {last}".strip()
+
+    frames = [
+        origin + np.array([(0, 0), (0, 1), (1, 1), (1, 0), (0, 0)])
+        for origin in origins
+    ]
+    ax.add_collection(LineCollection(frames, colors=PANEL_FRAME_COLOR, linewidths=0.5))
+    for (x0, y0), (title, _), top in zip(origins, panels, tops):
+        ax.text(x0, y0 + 1.03, title, fontsize=PANEL_FONT_SIZE, va="bottom")
+        if not sharey:
+            ax.text(
+                x0 + 1,
+                y0 + 1.03,
+                f"{top:g}",
+                fontsize=PANEL_FONT_SIZE,
+                ha="right",
+                va="bottom",
+                color="grey",
+            )
+
+    ax.set_xlim(-0.05, ncols * (1 + PANEL_GAP[0]))
+    ax.set_ylim(-(nrows - 1) * (1 + PANEL_GAP[1]) - 0.05, 1 + PANEL_GAP[1])
+    if sharey:
+        shared_top = max(tops, default=0)
+        subtitle = f"{subtitle} (shared scale, max {shared_top:g})".strip()
+    fig.suptitle(subtitle, fontsize=PANEL_FONT_SIZE + 2)
+
+
+def render_small_multiples(
+    links: Iterable[Union[Statistics, Dict]],
+    data: str = "clicks_analysis",
+    chart_type: Optional[Literal["line", "area", "bar"]] = None,
+    days: int = 7,
+    ncols: Optional[int] = None,
+    panel_size: Tuple[float, float] = PANEL_SIZE,
+    sharey: bool = True,
+    top_n: int = 8,
+    max_points: int = PANEL_MAX_POINTS,
+) -> Figure:
+    """
+    Compare one analysis across many links in a single small-multiples figure.
+
+    Args:
+        links: Statistics objects or raw stats payloads
+        data: Analysis to plot, as accepted by ``Statistics.make_chart``
+        chart_type: "line" or "area" for time series, "bar" for dimension
+            breakdowns (chosen from ``data`` if None)
+        days: Number of days for the last_n_days analyses
+        ncols: Number of panel columns (square-ish grid if None)
+        panel_size: Size of one panel in inches
+        sharey: Whether all panels use the same value scale
+        top_n: Number of categories shown for dimension breakdowns
+        max_points: Point budget of each time series panel
+
+    Returns:
+        The rendered Figure with one panel per link, in order, titled with
+        the link short codes (a link passed twice gets two panels)
+    """
+    panels = []
+    for link in links:
+        stats = link if isinstance(link, Statistics) else Statistics.from_data(link)
+        panels.append((stats.short_code, stats._chart_data(data, days=days)))
+    if chart_type is None:
+        chart_type = "line" if data in TIME_SERIES_LABELS else "bar"
+
+    ncols = ncols or max(1, math.ceil(math.sqrt(len(panels))))
+    nrows = max(1, math.ceil(len(panels) / ncols))
+    fig = Figure(figsize=(ncols * panel_size[0], nrows * panel_size[1] + 1))
+    _draw_small_multiples(
+        fig,
+        panels,
+        chart_type=chart_type,
+        data_label=data,
+        ncols=ncols,
+        sharey=sharey,
+        top_n=top_n,
+        max_points=max_points,
+    )
+    return fig
@@ -1,18 +1,63 @@
-import matplotlib.pyplot as plt  # type: ignore
-import matplotlib  # type: ignore
-from mpl_toolkits.axes_grid1 import make_axes_locatable  # type: ignore
-import geopandas as gpd  # type: ignore
-from typing import Literal, Dict
+from typing import Literal, Dict, List, Optional
+from .dependencies import missing_dependency
+
+try:
+    import matplotlib.pyplot as plt  # type: ignore
+    import matplotlib  # type: ignore
+    import matplotlib.figure  # type: ignore
+    from matplotlib.collections import LineCollection, PolyCollection  # type: ignore
+    from matplotlib.ticker import FixedFormatter, FixedLocator  # type: ignore
+    from mpl_toolkits.axes_grid1 import make_axes_locatable  # type: ignore
+    import numpy as np
+except ImportError as e:
+    raise missing_dependency((e.name or "matplotlib").split(".")[0], "Charting") from e
+from .countries import canonical_country_names
+from .polygons import load_world_polygons
+from .transforms import (
+    DEFAULT_MAX_TICKS,
+    OTHER_LABEL,
+    TIME_SERIES_LABELS,
+    date_ticks,
+    downsample_series,
+    series_positions,
+    top_n_with_other,
+)
+
+SERIES_CHART_TYPES = ["bar", "line", "scatter", "area"]
+
+
+def _locate_date_ticks(
+    ax, keys: List, max_ticks: int = DEFAULT_MAX_TICKS, numeric: bool = False
+) -> None:
+    # Numeric axes (series drawn at their positions) always need the labels
+    if len(keys) > max_ticks or numeric:
+        positions, labels = date_ticks(keys, max_ticks)
+        ax.xaxis.set_major_locator(FixedLocator(positions))
+        ax.xaxis.set_major_formatter(FixedFormatter(labels))
 
 
 def make_chart(
     chart_data: Dict,
     chart_type: Literal["bar", "pie", "line", "scatter", "hist", "box", "area"] = "bar",
     data_label: str = None,
+    downsample: bool = True,
+    max_points: Optional[int] = None,
+    top_n: Optional[int] = None,
+    other_label: str = OTHER_LABEL,
     **kwargs,
 ) -> plt.Figure:
     matplotlib.rcParams["font.size"] = 15
     matplotlib.rcParams["axes.labelcolor"] = "Black"
+    is_series = data_label in TIME_SERIES_LABELS and chart_type in SERIES_CHART_TYPES
+    all_keys = list(chart_data.keys())
+    if is_series and downsample:
+        chart_data = downsample_series(chart_data, chart_type, max_points)
+    elif top_n is not None and data_label not in TIME_SERIES_LABELS:
+        chart_data = top_n_with_other(chart_data, top_n, other_label)
+    # Series points are drawn at their positions in the full series, so the
+    # gaps left by downsampling keep their width
+    positioned = is_series and chart_type != "bar"
+    keys = series_positions(all_keys, chart_data) if positioned else chart_data.keys()
 
     if chart_type == "bar":
         plt.bar(chart_data.keys(), chart_data.values(), **kwargs)
@@ -25,49 +70,74 @@ def make_chart(
     elif chart_type == "pie":
         plt.pie(chart_data.values(), labels=chart_data.keys(), **kwargs)
     elif chart_type == "line":
-        plt.plot(chart_data.keys(), chart_data.values(), **kwargs)
+        plt.plot(keys, list(chart_data.values()), **kwargs)
     elif chart_type == "scatter":
-        plt.scatter(chart_data.keys(), chart_data.values(), **kwargs)
+        plt.scatter(keys, list(chart_data.values()), **kwargs)
     elif chart_type == "hist":
         plt.hist(list(chart_data.values()), **kwargs)
     elif chart_type == "box":
         plt.boxplot(list(chart_data.values()), **kwargs)
     elif chart_type == "area":
-        plt.stackplot(chart_data.keys(), chart_data.values(), **kwargs)
+        plt.stackplot(keys, list(chart_data.values()), **kwargs)
     else:
         raise Exception(
             "Invalid chart type. Valid chart types are: bar, pie, line, scatter, hist, box, area"
         )
+    if positioned:
+        _locate_date_ticks(plt.gca(), all_keys, numeric=True)
+    elif is_series:
+        _locate_date_ticks(plt.gca(), list(chart_data.keys()))
     return plt
 
 
-def _create_heatmap(
+HEATMAP_FIGSIZE = (15, 10)
+HEATMAP_FACECOLOR = (32 / 255, 34 / 255, 37 / 255, 0.5)
+HEATMAP_SPINE_COLOR = (46 / 255, 48 / 255, 53 / 255)
+
+
+def _setup_heatmap_axes(fig: matplotlib.figure.Figure):
+    ax = fig.add_subplot(1, 1, 1)
+    fig.subplots_adjust(left=0.05, right=0.90, bottom=0.05, top=0.95)
+    for spine in ax.spines.values():
+        spine.set_color(HEATMAP_SPINE_COLOR)
+        spine.set_linewidth(2)
+    ax.tick_params(labelcolor="white", labelsize=15)
+    divider = make_axes_locatable(ax)
+    cax = divider.append_axes("right", size="5%", pad=0.1)
+    return ax, cax
+
+
+def _finish_heatmap(fig: matplotlib.figure.Figure, ax, cax, title: str):
+    ax.set_facecolor(HEATMAP_FACECOLOR)
+    cax.tick_params(labelcolor="white", labelsize=15)
+    cax.yaxis.label.set_color("white")
+    cax.yaxis.label.set_size(15)
+    return fig.suptitle(title, x=0.5, y=0.95, fontsize=20, fontweight=3, color="white")
+
+
+def _draw_heatmap(
+    fig: matplotlib.figure.Figure,
     data_analysis: Dict[str, int],
     title: str,
     merge_column: str = "NAME",
-    cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
-) -> plt.Figure:
-    matplotlib.rcParams["font.size"] = 15
-    matplotlib.rcParams["axes.labelcolor"] = "White"
-    world = gpd.read_file("py_spoo_url/data/ne_110m_admin_0_countries.zip")
-    world = world.merge(
+    cmap: str = "YlOrRd",
+) -> None:
+    """
+    Draw the geopandas country heatmap onto ``fig`` without touching pyplot state.
+    """
+    from .world import gpd, load_world
+
+    if merge_column == "NAME":
+        data_analysis = canonical_country_names(data_analysis)
+    world = load_world().merge(
         gpd.GeoDataFrame(data_analysis.items(), columns=["Country", "Value"]),
         how="left",
         left_on=merge_column,
         right_on="Country",
     )
-    fig, ax = plt.subplots(
-        1, 1, figsize=(15, 10), facecolor=(32 / 255, 34 / 255, 37 / 255, 0.5)
-    )
-    plt.subplots_adjust(left=0.05, right=0.90, bottom=0.05, top=0.95)
-    for spine in ax.spines.values():
-        spine.set_color((46 / 255, 48 / 255, 53 / 255))
-        spine.set_linewidth(2)
-    ax.tick_params(labelcolor="white")
+    ax, cax = _setup_heatmap_axes(fig)
     world.boundary.plot(ax=ax, linewidth=1)
-    divider = make_axes_locatable(ax)
-    cax = divider.append_axes("right", size="5%", pad=0.1)
-    p = world.plot(
+    world.plot(
         column="Value",
         ax=ax,
         legend=True,
@@ -77,32 +147,96 @@ def _create_heatmap(
         legend_kwds={"label": "Clicks"},
         alpha=0.9,
     )
-    p.set_facecolor((32 / 255, 34 / 255, 37 / 255, 0.5))
-    cbax = cax
-    cbax.tick_params(labelcolor="white")
-    plt.suptitle(title, x=0.5, y=0.95, fontsize=20, fontweight=3, color="white")
+    _finish_heatmap(fig, ax, cax, title)
+
+
+def _draw_polygon_heatmap(
+    fig: matplotlib.figure.Figure,
+    data_analysis: Dict[str, int],
+    title: str,
+    cmap: str = "YlOrRd",
+) -> None:
+    """
+    Draw the country heatmap from the baked polygon arrays onto ``fig``.
+    """
+    world = load_world_polygons()
+    data_analysis = canonical_country_names(data_analysis)
+    values = np.array(
+        [data_analysis.get(name, np.nan) for name in world.names], dtype=float
+    )
+    ax, cax = _setup_heatmap_axes(fig)
+    ax.add_collection(LineCollection(world.rings, linewidths=1, colors="C0"))
+    fills = PolyCollection(
+        world.rings,
+        array=np.ma.masked_invalid(values[world.ring_country]),
+        cmap=matplotlib.colormaps[cmap].with_extremes(bad=(0, 0, 0, 0)),
+        edgecolors="none",
+        alpha=0.9,
+    )
+    if np.isfinite(values).any():
+        fills.set_clim(np.nanmin(values), np.nanmax(values))
+    ax.add_collection(fills)
+    minx, miny, maxx, maxy = world.bounds
+    ax.autoscale_view()
+    ax.set_aspect(1 / np.cos(np.radians((miny + maxy) / 2)))
+    colorbar = fig.colorbar(fills, cax=cax, label="Clicks")
+    colorbar.solids.set_alpha(1)
+    _finish_heatmap(fig, ax, cax, title)
+
+
+def _create_heatmap(
+    data_analysis: Dict[str, int],
+    title: str,
+    merge_column: str = "NAME",
+    cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+) -> plt.Figure:
+    matplotlib.rcParams["font.size"] = 15
+    matplotlib.rcParams["axes.labelcolor"] = "White"
+    fig = plt.figure(figsize=HEATMAP_FIGSIZE, facecolor=HEATMAP_FACECOLOR)
+    _draw_heatmap(fig, data_analysis, title, merge_column=merge_column, cmap=cmap)
     return plt
 
 
+def _create_polygon_heatmap(
+    data_analysis: Dict[str, int],
+    title: str,
+    cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+) -> plt.Figure:
+    matplotlib.rcParams["font.size"] = 15
+    matplotlib.rcParams["axes.labelcolor"] = "White"
+    fig = plt.figure(figsize=HEATMAP_FIGSIZE, facecolor=HEATMAP_FACECOLOR)
+    _draw_polygon_heatmap(fig, data_analysis, title, cmap=cmap)
+    return plt
+
+
+def _heatmap(
+    data_analysis: Dict[str, int],
+    title: str,
+    cmap: str,
+    engine: Literal["geopandas", "polygons"],
+) -> plt.Figure:
+    if engine == "geopandas":
+        return _create_heatmap(
+            data_analysis=data_analysis, title=title, merge_column="NAME", cmap=cmap
+        )
+    elif engine == "polygons":
+        return _create_polygon_heatmap(
+            data_analysis=data_analysis, title=title, cmap=cmap
+        )
+    raise ValueError("Invalid heatmap engine. Choose either 'geopandas' or 'polygons'.")
+
+
 def make_countries_heatmap(
     country_analysis: Dict[str, int],
     cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+    engine: Literal["geopandas", "polygons"] = "geopandas",
 ) -> plt.Figure:
-    return _create_heatmap(
-        data_analysis=country_analysis,
-        title="Countries Heatmap",
-        merge_column="NAME",
-        cmap=cmap,
-    )
+    return _heatmap(country_analysis, "Countries Heatmap", cmap, engine)
 
 
 def make_unique_countries_heatmap(
     unique_country_analysis: Dict[str, int],
     cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+    engine: Literal["geopandas", "polygons"] = "geopandas",
 ) -> plt.Figure:
-    return _create_heatmap(
-        data_analysis=unique_country_analysis,
-        title="Unique Countries Heatmap",
-        merge_column="NAME",
-        cmap=cmap,
-    )
+    return _heatmap(unique_country_analysis, "Unique Countries Heatmap", cmap, engine)
@@ -0,0 +1,83 @@
+import os
+from functools import lru_cache
+from typing import List, NamedTuple
+from .dependencies import missing_dependency
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise missing_dependency("numpy", "The polygon heatmap engine") from e
+
+
+WORLD_POLYGONS_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "world_polygons.npz",
+)
+
+
+class WorldPolygons(NamedTuple):
+    """
+    Country outlines baked into plain vertex arrays.
+
+    ``rings[i]`` is an (n, 2) array of lon/lat vertices belonging to the
+    country ``names[ring_country[i]]``. Rings are ordered by decreasing area
+    so enclaves (e.g. Lesotho) are drawn on top of the country around them.
+    """
+
+    names: np.ndarray
+    rings: List[np.ndarray]
+    ring_country: np.ndarray
+    bounds: np.ndarray
+
+
+def bake_world_polygons(world, filename: str = WORLD_POLYGONS_FILE) -> None:
+    """
+    Bake the exterior rings of a world GeoDataFrame into a compressed .npz file.
+
+    This is only needed when the packaged Natural Earth data changes; the
+    result is shipped with the package so rendering needs no geopandas.
+
+    Args:
+        world: GeoDataFrame with a ``NAME`` column and (multi)polygon geometry
+        filename: Output .npz path
+    """
+    names = []
+    rings = []
+    for country_id, (name, geometry) in enumerate(zip(world["NAME"], world.geometry)):
+        names.append(name)
+        parts = geometry.geoms if geometry.geom_type == "MultiPolygon" else [geometry]
+        for part in parts:
+            rings.append((part.area, country_id, np.asarray(part.exterior.coords)))
+    rings.sort(key=lambda ring: -ring[0])
+
+    vertices = np.concatenate([coords for _, _, coords in rings]).astype(np.float32)
+    offsets = np.cumsum([0] + [len(coords) for _, _, coords in rings]).astype(np.int32)
+    np.savez_compressed(
+        filename,
+        names=np.array(names),
+        vertices=vertices,
+        offsets=offsets,
+        ring_country=np.array([country_id for _, country_id, _ in rings], np.int32),
+        bounds=np.asarray(world.total_bounds, np.float32),
+    )
+
+
+@lru_cache(maxsize=None)
+def load_world_polygons() -> WorldPolygons:
+    """
+    Load the pre-baked country polygons shipped with the package.
+
+    The arrays are read once per process; callers must treat them as read-only.
+
+    Returns:
+        WorldPolygons with one vertex array per country ring
+    """
+    with np.load(WORLD_POLYGONS_FILE, allow_pickle=False) as baked:
+        rings = np.split(baked["vertices"], baked["offsets"][1:-1])
+        return WorldPolygons(
+            names=baked["names"],
+            rings=rings,
+            ring_country=baked["ring_country"],
+            bounds=baked["bounds"],
+        )
@@ -0,0 +1,332 @@
+"""
+Object-oriented chart rendering.
+
+Unlike the pyplot based helpers in ``plotting.py``, every function here builds
+its own ``Figure``/``Axes``, never touches ``matplotlib.rcParams`` or the
+pyplot figure manager and returns the figure. Figures are not registered with
+pyplot, so they are garbage collected once dropped and the functions are safe
+to call concurrently from many threads.
+"""
+
+import io
+from typing import IO, Any, Callable, Dict, Literal, Optional, Tuple
+from .dependencies import missing_dependency
+
+try:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
+    from matplotlib.figure import Figure  # type: ignore
+except ImportError as e:
+    raise missing_dependency("matplotlib", "Charting") from e
+from .cache import RenderCache, make_cache_key
+from .plotting import (
+    HEATMAP_FACECOLOR,
+    HEATMAP_FIGSIZE,
+    _draw_heatmap,
+    _draw_polygon_heatmap,
+    _locate_date_ticks,
+    SERIES_CHART_TYPES,
+)
+from .transforms import (
+    OTHER_LABEL,
+    TIME_SERIES_LABELS,
+    downsample_series,
+    series_positions,
+    top_n_with_other,
+)
+
+CHART_FONT_SIZE = 15
+CHART_LABEL_COLOR = "black"
+
+
+def _style_chart_axes(ax) -> None:
+    ax.tick_params(labelsize=CHART_FONT_SIZE)
+    for axis in (ax.xaxis, ax.yaxis):
+        axis.label.set_size(CHART_FONT_SIZE)
+        axis.label.set_color(CHART_LABEL_COLOR)
+        axis.get_offset_text().set_fontsize(CHART_FONT_SIZE)
+
+
+def render_chart(
+    chart_data: Dict,
+    chart_type: Literal["bar", "pie", "line", "scatter", "hist", "box", "area"] = "bar",
+    data_label: Optional[str] = None,
+    figsize: Optional[Tuple[float, float]] = None,
+    downsample: bool = True,
+    max_points: Optional[int] = None,
+    top_n: Optional[int] = None,
+    other_label: str = OTHER_LABEL,
+    **kwargs,
+) -> Figure:
+    """
+    Render a chart onto a new, standalone figure.
+
+    Time series (``data_label`` in ``TIME_SERIES_LABELS``) are downsampled to
+    ``max_points`` (LTTB for line/area/scatter, bucket sums for bar) and get
+    date ticks at day/week/month/quarter/year boundaries. Other analyses can
+    be reduced to their ``top_n`` entries plus an ``other_label`` bucket.
+
+    Args:
+        chart_data: Mapping of labels to values
+        chart_type: One of bar, pie, line, scatter, hist, box, area
+        data_label: Name of the analysis being plotted (controls time series handling)
+        figsize: Figure size in inches (matplotlib default if None)
+        downsample: Whether to cap the number of points of time series
+        max_points: Point budget (per chart type default if None)
+        top_n: Number of largest entries to keep for non time series (all if None)
+        other_label: Label of the bucket summing the entries beyond ``top_n``
+        **kwargs: Passed to the underlying Axes plotting method
+
+    Returns:
+        The rendered Figure
+    """
+    is_series = data_label in TIME_SERIES_LABELS and chart_type in SERIES_CHART_TYPES
+    all_keys = list(chart_data.keys())
+    if is_series and downsample:
+        chart_data = downsample_series(chart_data, chart_type, max_points)
+    elif top_n is not None and data_label not in TIME_SERIES_LABELS:
+        chart_data = top_n_with_other(chart_data, top_n, other_label)
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot(1, 1, 1)
+    keys, values = list(chart_data.keys()), list(chart_data.values())
+    # Series points are drawn at their positions in the full series, so the
+    # gaps left by downsampling keep their width
+    positioned = is_series and chart_type != "bar"
+    if positioned:
+        keys = series_positions(all_keys, keys)
+
+    if chart_type == "bar":
+        ax.bar(keys, values, **kwargs)
+        if data_label in TIME_SERIES_LABELS:
+            ax.tick_params(axis="x", labelrotation=90)
+    elif chart_type == "pie":
+        kwargs.setdefault("textprops", {"fontsize": CHART_FONT_SIZE})
+        ax.pie(values, labels=keys, **kwargs)
+    elif chart_type == "line":
+        ax.plot(keys, values, **kwargs)
+    elif chart_type == "scatter":
+        ax.scatter(keys, values, **kwargs)
+    elif chart_type == "hist":
+        ax.hist(values, **kwargs)
+    elif chart_type == "box":
+        ax.boxplot(values, **kwargs)
+    elif chart_type == "area":
+        ax.stackplot(keys, values, **kwargs)
+    else:
+        raise Exception(
+            "Invalid chart type. Valid chart types are: bar, pie, line, scatter, hist, box, area"
+        )
+    if positioned:
+        _locate_date_ticks(ax, all_keys, numeric=True)
+    elif is_series:
+        _locate_date_ticks(ax, keys)
+    _style_chart_axes(ax)
+    return fig
+
+
+def _render_heatmap(
+    data_analysis: Dict[str, int],
+    title: str,
+    cmap: str,
+    engine: Literal["geopandas", "polygons"],
+    figsize: Optional[Tuple[float, float]] = None,
+) -> Figure:
+    fig = Figure(figsize=figsize or HEATMAP_FIGSIZE, facecolor=HEATMAP_FACECOLOR)
+    if engine == "geopandas":
+        _draw_heatmap(fig, data_analysis, title, merge_column="NAME", cmap=cmap)
+    elif engine == "polygons":
+        _draw_polygon_heatmap(fig, data_analysis, title, cmap=cmap)
+    else:
+        raise ValueError(
+            "Invalid heatmap engine. Choose either 'geopandas' or 'polygons'."
+        )
+    return fig
+
+
+def render_countries_heatmap(
+    country_analysis: Dict[str, int],
+    cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+    engine: Literal["geopandas", "polygons"] = "geopandas",
+    figsize: Optional[Tuple[float, float]] = None,
+) -> Figure:
+    return _render_heatmap(
+        country_analysis, "Countries Heatmap", cmap, engine, figsize=figsize
+    )
+
+
+def render_unique_countries_heatmap(
+    unique_country_analysis: Dict[str, int],
+    cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+    engine: Literal["geopandas", "polygons"] = "geopandas",
+    figsize: Optional[Tuple[float, float]] = None,
+) -> Figure:
+    return _render_heatmap(
+        unique_country_analysis,
+        "Unique Countries Heatmap",
+        cmap,
+        engine,
+        figsize=figsize,
+    )
+
+
+def figure_to_bytes(
+    fig: Figure,
+    format: Literal["png", "svg", "webp", "jpg", "pdf"] = "png",
+    dpi: float = 100,
+    buffer: Optional[IO[bytes]] = None,
+    **savefig_kwargs,
+) -> Optional[bytes]:
+    """
+    Encode a figure with the headless Agg canvas.
+
+    Args:
+        fig: Figure to encode
+        format: Image format understood by matplotlib (webp needs Pillow)
+        dpi: Output resolution
+        buffer: Binary file-like object to write into instead of returning bytes
+        **savefig_kwargs: Passed to ``Figure.savefig`` (e.g. bbox_inches)
+
+    Returns:
+        The encoded image, or None if it was written into ``buffer``
+    """
+    FigureCanvasAgg(fig)
+    target = buffer if buffer is not None else io.BytesIO()
+    fig.savefig(target, format=format, dpi=dpi, **savefig_kwargs)
+    if buffer is None:
+        return target.getvalue()
+    return None
+
+
+def _cached_render(
+    cache: Optional[RenderCache],
+    key_parts: Dict[str, Any],
+    render: Callable[[], Figure],
+    format: str,
+    dpi: float,
+    buffer: Optional[IO[bytes]],
+) -> Optional[bytes]:
+    if cache is not None:
+        try:
+            key = make_cache_key(format=format, dpi=dpi, **key_parts)
+        except TypeError:
+            # Inputs without a stable key (e.g. a Colormap object) skip the cache
+            cache = None
+    if cache is None:
+        return figure_to_bytes(render(), format=format, dpi=dpi, buffer=buffer)
+    data = cache.get(key)
+    if data is None:
+        data = figure_to_bytes(render(), format=format, dpi=dpi)
+        cache.set(key, data)
+    if buffer is not None:
+        buffer.write(data)
+        return None
+    return data
+
+
+def render_chart_bytes(
+    chart_data: Dict,
+    chart_type: Literal["bar", "pie", "line", "scatter", "hist", "box", "area"] = "bar",
+    data_label: Optional[str] = None,
+    format: Literal["png", "svg", "webp", "jpg", "pdf"] = "png",
+    dpi: float = 100,
+    figsize: Optional[Tuple[float, float]] = None,
+    buffer: Optional[IO[bytes]] = None,
+    cache: Optional[RenderCache] = None,
+    **kwargs,
+) -> Optional[bytes]:
+    """
+    Render a chart and encode it, going through ``cache`` when one is given.
+
+    The cache key covers the chart data, chart type, data label, kwargs,
+    figure size, format and dpi, so changed inputs never hit a stale image.
+    """
+    return _cached_render(
+        cache,
+        dict(
+            kind="chart",
+            chart_data=chart_data,
+            chart_type=chart_type,
+            data_label=data_label,
+            figsize=figsize,
+            kwargs=kwargs,
+        ),
+        lambda: render_chart(
+            chart_data, chart_type, data_label=data_label, figsize=figsize, **kwargs
+        ),
+        format,
+        dpi,
+        buffer,
+    )
+
+
+def _render_heatmap_bytes(
+    data_analysis: Dict[str, int],
+    title: str,
+    cmap: str,
+    engine: Literal["geopandas", "polygons"],
+    format: str,
+    dpi: float,
+    figsize: Optional[Tuple[float, float]],
+    buffer: Optional[IO[bytes]],
+    cache: Optional[RenderCache],
+) -> Optional[bytes]:
+    return _cached_render(
+        cache,
+        dict(
+            kind="heatmap",
+            data_analysis=data_analysis,
+            title=title,
+            cmap=cmap,
+            engine=engine,
+            figsize=figsize,
+        ),
+        lambda: _render_heatmap(data_analysis, title, cmap, engine, figsize=figsize),
+        format,
+        dpi,
+        buffer,
+    )
+
+
+def render_countries_heatmap_bytes(
+    country_analysis: Dict[str, int],
+    cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+    engine: Literal["geopandas", "polygons"] = "geopandas",
+    format: Literal["png", "svg", "webp", "jpg", "pdf"] = "png",
+    dpi: float = 100,
+    figsize: Optional[Tuple[float, float]] = None,
+    buffer: Optional[IO[bytes]] = None,
+    cache: Optional[RenderCache] = None,
+) -> Optional[bytes]:
+    return _render_heatmap_bytes(
+        country_analysis,
+        "Countries Heatmap",
+        cmap,
+        engine,
+        format,
+        dpi,
+        figsize,
+        buffer,
+        cache,
+    )
+
+
+def render_unique_countries_heatmap_bytes(
+    unique_country_analysis: Dict[str, int],
+    cmap: Literal["YlOrRd", "viridis", "plasma", "inferno", "RdPu_r"] = "YlOrRd",
+    engine: Literal["geopandas", "polygons"] = "geopandas",
+    format: Literal["png", "svg", "webp", "jpg", "pdf"] = "png",
+    dpi: float = 100,
+    figsize: Optional[Tuple[float, float]] = None,
+    buffer: Optional[IO[bytes]] = None,
+    cache: Optional[RenderCache] = None,
+) -> Optional[bytes]:
+    return _render_heatmap_bytes(
+        unique_country_analysis,
+        "Unique Countries Heatmap",
+        cmap,
+        engine,
+        format,
+        dpi,
+        figsize,
+        buffer,
+        cache,
+    )
@@ -0,0 +1,198 @@
+"""
+Self-contained HTML reports.
+
+A report holds the general info of a link, one chart per analysis, the
+country heatmaps and a table per dimension. The chart data is derived once,
+the sections are rendered concurrently with the thread-safe object-oriented
+renderers, and both heatmaps share one ``HeatmapRenderer`` base map.
+"""
+
+import base64
+import html
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional, Tuple
+from .cache import RenderCache
+from .rendering import render_chart_bytes
+from .transforms import DIMENSION_LABELS, TIME_SERIES_LABELS, top_n_with_other
+
+REPORT_CHARTS = [
+    ("clicks_analysis", "line"),
+    ("unique_clicks_analysis", "line"),
+    ("browsers_analysis", "pie"),
+    ("platforms_analysis", "pie"),
+    ("referrers_analysis", "bar"),
+    ("country_analysis", "bar"),
+]
+
+GENERAL_INFO_FIELDS = [
+    ("URL", "url"),
+    ("Short code", "_id"),
+    ("Total clicks", "total-clicks"),
+    ("Total unique clicks", "total_unique_clicks"),
+    ("Max clicks", "max-clicks"),
+    ("Creation date", "creation-date"),
+    ("Expired", "expired"),
+    ("Average daily clicks", "average_daily_clicks"),
+    ("Average weekly clicks", "average_weekly_clicks"),
+    ("Average monthly clicks", "average_monthly_clicks"),
+    ("Last click", "last-click"),
+    ("Last click browser", "last-click-browser"),
+    ("Last click OS", "last-click-os"),
+]
+
+REPORT_STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 1100px; color: #222; }
+h1 { font-size: 1.6em; } h2 { font-size: 1.2em; margin-top: 2em; }
+table { border-collapse: collapse; margin: 0.5em 1em 1em 0; display: inline-table; vertical-align: top; }
+th, td { border: 1px solid #ddd; padding: 0.25em 0.6em; text-align: left; }
+td.count { text-align: right; }
+figure { margin: 1em 0; } figure svg, figure img { max-width: 100%; height: auto; }
+"""
+
+
+def _title(label: str) -> str:
+    return label.replace("_", " ").capitalize()
+
+
+def _embed(image: bytes, format: str) -> str:
+    if format == "svg":
+        svg = image.decode("utf-8")
+        return svg[svg.index("<svg") :]
+    encoded = base64.b64encode(image).decode("ascii")
+    return f'<img src="data:image/{format};base64,{encoded}">'
+
+
+def _table(header: Tuple[str, str], rows, numeric: bool = True) -> str:
+    value_cell = '<td class="count">' if numeric else "<td>"
+    cells = "".join(
+        f"<tr><td>{html.escape(str(key))}</td>{value_cell}{html.escape(str(value))}</td></tr>"
+        for key, value in rows
+    )
+    return (
+        f"<table><tr><th>{html.escape(header[0])}</th>"
+        f"<th>{html.escape(header[1])}</th></tr>{cells}</table>"
+    )
+
+
+def _render_heatmaps(
+    country_analysis: Dict[str, int],
+    unique_country_analysis: Dict[str, int],
+    format: str,
+    dpi: float,
+) -> List[bytes]:
+    from .heatmaps import HeatmapRenderer
+
+    renderer = HeatmapRenderer(figsize=(12, 8))
+    return [
+        renderer.render(country_analysis, "Countries Heatmap", format, dpi),
+        renderer.render(
+            unique_country_analysis, "Unique Countries Heatmap", format, dpi
+        ),
+    ]
+
+
+def build_report(
+    stats,
+    filename: Optional[str] = None,
+    format: Literal["svg", "png"] = "svg",
+    dpi: float = 100,
+    charts: Optional[List[Tuple[str, str]]] = None,
+    heatmaps: bool = True,
+    top_n: int = 20,
+    max_workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+) -> str:
+    """
+    Build a self-contained HTML report for a link.
+
+    Args:
+        stats: Statistics object of the link
+        filename: Path to also write the report to
+        format: Image format of the embedded charts (inline SVG or base64 PNG)
+        dpi: Resolution of PNG charts
+        charts: (analysis, chart type) pairs to plot (``REPORT_CHARTS`` if None)
+        heatmaps: Whether to include the country heatmaps
+        top_n: Number of entries shown per dimension chart and table
+        max_workers: Number of rendering threads
+        cache: Optional RenderCache for the charts
+
+    Returns:
+        The report HTML
+    """
+    charts = REPORT_CHARTS if charts is None else charts
+    datasets = {
+        label: stats._chart_data(label)
+        for label in DIMENSION_LABELS + [label for label, _ in charts]
+    }
+    tables = {
+        label: top_n_with_other(datasets[label], top_n)
+        for label in DIMENSION_LABELS
+        if datasets[label]
+    }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        chart_futures = []
+        for label, chart_type in charts:
+            if not datasets[label]:
+                chart_futures.append(None)
+                continue
+            options = {} if label in TIME_SERIES_LABELS else {"top_n": top_n}
+            chart_futures.append(
+                pool.submit(
+                    render_chart_bytes,
+                    datasets[label],
+                    chart_type,
+                    data_label=label,
+                    format=format,
+                    dpi=dpi,
+                    figsize=(10, 5),
+                    cache=cache,
+                    **options,
+                )
+            )
+        heatmap_future = (
+            pool.submit(
+                _render_heatmaps,
+                stats.country_analysis,
+                stats.unique_country_analysis,
+                format,
+                dpi,
+            )
+            if heatmaps
+            else None
+        )
+
+        sections = []
+        for (label, _), future in zip(charts, chart_futures):
+            body = (
+                "<p>No data.</p>" if future is None else _embed(future.result(), format)
+            )
+            sections.append(f"<h2>{_title(label)}</h2><figure>{body}</figure>")
+        if heatmap_future is not None:
+            figures = "".join(
+                f"<figure>{_embed(image, format)}</figure>"
+                for image in heatmap_future.result()
+            )
+            sections.append(f"<h2>Countries</h2>{figures}")
+
+    info = _table(
+        ("Field", "Value"),
+        [(name, stats.data.get(key)) for name, key in GENERAL_INFO_FIELDS],
+        numeric=False,
+    )
+    dimension_tables = "<h2>Breakdowns</h2>" + "".join(
+        _table((_title(label), "Clicks"), rows.items())
+        for label, rows in tables.items()
+    )
+    title = html.escape(f"Statistics for {stats.short_code}")
+    report = (
+        "<!DOCTYPE html>\n"
+        f'<html><head><meta charset="utf-8"><title>{title}</title>'
+        f"<style>{REPORT_STYLE}</style></head><body>"
+        f"<h1>{title}</h1>{info}{''.join(sections)}{dimension_tables}"
+        "</body></html>\n"
+    )
+    if filename is not None:
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(report)
+    return report
@@ -0,0 +1,228 @@
+"""
+Local SQLite store for the statistics of many links.
+
+Payloads are normalized into three indexed tables:
+
+- ``links``: one row per link with its general info
+- ``daily_clicks``: clicks and unique clicks per link and day
+- ``dimension_counts``: clicks and unique clicks per link, dimension
+  (browser, os_name, country, referrer) and value
+
+Links are written in batches, one transaction and one ``executemany`` per
+table and batch. Rows are upserted with ``ON CONFLICT DO UPDATE``, and rows
+whose counts did not change are left untouched, so re-syncing the same links
+only rewrites what changed.
+"""
+
+import sqlite3
+from typing import Dict, Iterable, List, Tuple, Union
+from ..statistics import Statistics
+from .tables import GENERAL_INFO_COLUMNS
+
+DEFAULT_BATCH_SIZE = 1000
+DIMENSIONS = ["browser", "os_name", "country", "referrer"]
+
+# WAL with synchronous=NORMAL survives application crashes without an fsync
+# on every commit; the 64 MiB page cache keeps the indexes in memory
+PRAGMAS = [
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -65536",
+]
+
+# links column of each general info field, in the order of GENERAL_INFO_COLUMNS
+LINK_COLUMNS = {
+    "total-clicks": "total_clicks",
+    "total_unique_clicks": "total_unique_clicks",
+    "url": "url",
+    "_id": "short_code",
+    "max-clicks": "max_clicks",
+    "password": "password",
+    "creation-date": "creation_date",
+    "expired": "expired",
+    "average_daily_clicks": "average_daily_clicks",
+    "average_monthly_clicks": "average_monthly_clicks",
+    "average_weekly_clicks": "average_weekly_clicks",
+    "last-click": "last_click",
+    "last-click-browser": "last_click_browser",
+    "last-click-os": "last_click_os",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    short_code TEXT PRIMARY KEY,
+    url TEXT,
+    total_clicks INTEGER,
+    total_unique_clicks INTEGER,
+    max_clicks INTEGER,
+    password TEXT,
+    creation_date TEXT,
+    expired INTEGER,
+    average_daily_clicks REAL,
+    average_monthly_clicks REAL,
+    average_weekly_clicks REAL,
+    last_click TEXT,
+    last_click_browser TEXT,
+    last_click_os TEXT
+);
+CREATE TABLE IF NOT EXISTS daily_clicks (
+    short_code TEXT NOT NULL,
+    date TEXT NOT NULL,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    unique_clicks INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (short_code, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS daily_clicks_date ON daily_clicks (date);
+CREATE TABLE IF NOT EXISTS dimension_counts (
+    short_code TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    unique_clicks INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (short_code, dimension, value)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS dimension_counts_value
+    ON dimension_counts (dimension, value);
+"""
+
+_LINK_FIELDS = [key for _, key in GENERAL_INFO_COLUMNS]
+_LINK_NAMES = [LINK_COLUMNS[key] for key in _LINK_FIELDS]
+UPSERT_LINK = (
+    f"INSERT INTO links ({', '.join(_LINK_NAMES)}) "
+    f"VALUES ({', '.join('?' * len(_LINK_NAMES))}) "
+    "ON CONFLICT (short_code) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in _LINK_NAMES)
+)
+UPSERT_DAILY_CLICKS = (
+    "INSERT INTO daily_clicks (short_code, date, clicks, unique_clicks) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (short_code, date) DO UPDATE SET "
+    "clicks = excluded.clicks, unique_clicks = excluded.unique_clicks "
+    "WHERE clicks != excluded.clicks OR unique_clicks != excluded.unique_clicks"
+)
+UPSERT_DIMENSION_COUNTS = (
+    "INSERT INTO dimension_counts (short_code, dimension, value, clicks, "
+    "unique_clicks) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (short_code, dimension, value) DO UPDATE SET "
+    "clicks = excluded.clicks, unique_clicks = excluded.unique_clicks "
+    "WHERE clicks != excluded.clicks OR unique_clicks != excluded.unique_clicks"
+)
+
+
+def _merge_counts(clicks: Dict, unique_clicks: Dict) -> List[Tuple]:
+    return [
+        (key, clicks.get(key, 0), unique_clicks.get(key, 0))
+        for key in {**clicks, **unique_clicks}
+    ]
+
+
+def link_rows(data: Dict) -> Tuple[Tuple, List[Tuple], List[Tuple]]:
+    """
+    Normalize a payload into rows of the three store tables.
+
+    Args:
+        data: Raw data dictionary
+
+    Returns:
+        The links row, the daily_clicks rows and the dimension_counts rows
+    """
+    short_code = data["_id"]
+    link = tuple(data.get(key) for key in _LINK_FIELDS)
+    daily = [
+        (short_code, day, clicks, unique_clicks)
+        for day, clicks, unique_clicks in _merge_counts(
+            data.get("counter", {}), data.get("unique_counter", {})
+        )
+    ]
+    dimensions = [
+        (short_code, dimension, value, clicks, unique_clicks)
+        for dimension in DIMENSIONS
+        for value, clicks, unique_clicks in _merge_counts(
+            data.get(dimension, {}), data.get(f"unique_{dimension}", {})
+        )
+    ]
+    return link, daily, dimensions
+
+
+class SQLiteStore:
+    """
+    SQLite database holding the statistics of many links.
+
+    Use it as a context manager, or call ``close`` when done. The underlying
+    ``sqlite3.Connection`` is available as ``connection`` for queries.
+    """
+
+    def __init__(self, database: str = "spoo.db"):
+        self.database = database
+        self.connection = sqlite3.connect(database)
+        for pragma in PRAGMAS:
+            self.connection.execute(pragma)
+        self.connection.executescript(SCHEMA)
+
+    def upsert(
+        self,
+        links: Iterable[Union[Statistics, Dict]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert or update the statistics of many links.
+
+        Args:
+            links: Statistics objects or raw stats payloads (may be a generator)
+            batch_size: Number of links written per transaction
+
+        Returns:
+            The number of links written
+        """
+        count = 0
+        batch: List[Tuple[Tuple, List[Tuple], List[Tuple]]] = []
+        for link in links:
+            data = link.data if isinstance(link, Statistics) else link
+            batch.append(link_rows(data))
+            if len(batch) >= batch_size:
+                count += self._write(batch)
+                batch = []
+        return count + self._write(batch)
+
+    def _write(self, batch: List[Tuple[Tuple, List[Tuple], List[Tuple]]]) -> int:
+        if not batch:
+            return 0
+        with self.connection:
+            self.connection.executemany(UPSERT_LINK, (link for link, _, _ in batch))
+            self.connection.executemany(
+                UPSERT_DAILY_CLICKS, (row for _, daily, _ in batch for row in daily)
+            )
+            self.connection.executemany(
+                UPSERT_DIMENSION_COUNTS,
+                (row for _, _, dimensions in batch for row in dimensions),
+            )
+        return len(batch)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def sync_sqlite(
+    links: Iterable[Union[Statistics, Dict]],
+    database: str = "spoo.db",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Upsert the statistics of many links into a SQLite database.
+
+    Args:
+        links: Statistics objects or raw stats payloads (may be a generator)
+        database: Path of the database (created if missing)
+        batch_size: Number of links written per transaction
+
+    Returns:
+        The number of links written
+    """
+    with SQLiteStore(database) as store:
+        return store.upsert(links, batch_size=batch_size)
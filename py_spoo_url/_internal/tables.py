@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+
+# Configuration for standard tables: (data_key, table name, column names)
+STANDARD_DATAFRAME_CONFIGS = [
+    ("browser", "df_browser", ["Browser", "Count"]),
+    ("counter", "df_counter", ["Date", "Count"]),
+    ("country", "df_country", ["Country", "Count"]),
+    ("os_name", "df_os_name", ["OS_Name", "Count"]),
+    ("referrer", "df_referrer", ["Referrer", "Count"]),
+    ("unique_browser", "df_unique_browser", ["Browser", "Count"]),
+    ("unique_counter", "df_unique_counter", ["Date", "Count"]),
+    ("unique_country", "df_unique_country", ["Country", "Count"]),
+    ("unique_os_name", "df_unique_os_name", ["OS_Name", "Count"]),
+    ("unique_referrer", "df_unique_referrer", ["Referrer", "Count"]),
+]
+
+# Excel sheet name of each standard table
+EXCEL_SHEET_NAMES = {
+    "df_browser": "Browser",
+    "df_counter": "Counter",
+    "df_country": "Country",
+    "df_os_name": "OS_Name",
+    "df_referrer": "Referrer",
+    "df_unique_browser": "Unique_Browser",
+    "df_unique_counter": "Unique_Counter",
+    "df_unique_country": "Unique_Country",
+    "df_unique_os_name": "Unique_OS_Name",
+    "df_unique_referrer": "Unique_Referrer",
+}
+
+# File name (without extension) of each standard table in multi-file exports
+TABLE_FILE_NAMES = {
+    "df_browser": "browser",
+    "df_counter": "counter",
+    "df_country": "country",
+    "df_os_name": "os_name",
+    "df_referrer": "referrer",
+    "df_unique_browser": "unique_browser",
+    "df_unique_counter": "unique_counter",
+    "df_unique_country": "unique_country",
+    "df_unique_os_name": "unique_os_name",
+    "df_unique_referrer": "unique_referrer",
+}
+
+# CSV file name of each standard table inside the export zip
+CSV_FILE_NAMES = {name: f"{stem}.csv" for name, stem in TABLE_FILE_NAMES.items()}
+
+# (column name, payload key) of the general info table; the URL column is
+# named by the caller
+GENERAL_INFO_COLUMNS = [
+    ("TOTAL CLICKS", "total-clicks"),
+    ("TOTAL UNIQUE CLICKS", "total_unique_clicks"),
+    (None, "url"),
+    ("SHORT CODE", "_id"),
+    ("MAX CLICKS", "max-clicks"),
+    ("PASSWORD", "password"),
+    ("CREATION DATE", "creation-date"),
+    ("EXPIRED", "expired"),
+    ("AVERAGE DAILY CLICKS", "average_daily_clicks"),
+    ("AVERAGE MONTHLY CLICKS", "average_monthly_clicks"),
+    ("AVERAGE WEEKLY CLICKS", "average_weekly_clicks"),
+    ("LAST CLICK", "last-click"),
+    ("LAST CLICK BROSWER", "last-click-browser"),
+    ("LAST CLICK OS", "last-click-os"),
+]
+
+
+def general_info_columns(url_column_name: str = "URL") -> List[str]:
+    """
+    Column names of the general info table.
+    """
+    return [
+        url_column_name if name is None else name for name, _ in GENERAL_INFO_COLUMNS
+    ]
+
+
+def general_info_table(
+    data: Dict, url_column_name: str = "URL"
+) -> Tuple[List[str], List[Any]]:
+    """
+    Build the single-row general info table of a payload.
+
+    Args:
+        data: Raw data dictionary
+        url_column_name: Name for the URL column (use "" for CSV export)
+
+    Returns:
+        Column names and the row of values
+    """
+    return (
+        general_info_columns(url_column_name),
+        [data[key] for _, key in GENERAL_INFO_COLUMNS],
+    )
+
+
+def iter_tables(data: Dict) -> Iterator[Tuple[str, List[str], Iterator[Tuple]]]:
+    """
+    Iterate over the standard tables of a payload without materializing them.
+
+    Args:
+        data: Raw data dictionary
+
+    Returns:
+        Iterator of (table name, column names, row iterator) for every
+        standard table present in the payload
+    """
+    for data_key, table_name, columns in STANDARD_DATAFRAME_CONFIGS:
+        if data_key in data:
+            yield table_name, columns, iter(data[data_key].items())
+
+
+class StatisticsTables:
+    """
+    Export outputs of a stats payload that are reused, each built once on
+    first use.
+
+    Only the CSV texts and Arrow tables are kept, so repeated exports and
+    exports in several formats share them. Excel exports stream straight
+    from the payload and DataFrames are built per export, so their rows are
+    never held here. The returned objects are cached, so treat them as
+    read-only.
+    """
+
+    def __init__(self, data: Dict):
+        self.data = data
+        self._cache: Dict[str, Any] = {}
+
+    def _memoize(self, key: str, build: Callable[[], Any]) -> Any:
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def csv_files(self) -> Dict[str, str]:
+        """
+        CSV text of every table, keyed by its file name in the CSV export.
+        """
+        from .textexport import csv_tables
+
+        return self._memoize("csv_files", lambda: dict(csv_tables(self.data)))
+
+    def arrow(self) -> Dict[str, Any]:
+        """
+        Arrow table of every table, keyed by its file name in columnar exports.
+        """
+        from .columnar import columnar_tables
+
+        return self._memoize("arrow", lambda: columnar_tables(self.data))
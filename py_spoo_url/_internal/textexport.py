@@ -0,0 +1,111 @@
+"""
+Pandas-free CSV and NDJSON writers.
+
+The tables are written straight from the analysis dicts with the ``csv`` and
+``json`` modules. The CSV output is byte-identical to
+``DataFrame.to_csv(index=False)`` of the same tables: every column is
+formatted the way pandas formats the dtype it would infer for it, so for
+example integers next to floats or missing values are written as floats.
+"""
+
+import csv
+import io
+import json
+import math
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+from .tables import CSV_FILE_NAMES, general_info_table, iter_tables
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _format_float(value: Any) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return repr(float(value))
+
+
+def _format_object(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _column_formatter(values: Sequence) -> Callable[[Any], str]:
+    # Mirrors the numeric dtype inference of pd.DataFrame: integers become
+    # float64 as soon as the column also holds floats or missing values
+    present = [value for value in values if value is not None]
+    numeric = bool(present) and all(_is_number(value) for value in present)
+    has_floats = any(isinstance(value, float) for value in present)
+    if numeric and (has_floats or len(present) < len(values)):
+        return _format_float
+    return _format_object
+
+
+def table_to_csv(columns: List[str], rows: Sequence[Sequence]) -> str:
+    """
+    Format a table exactly like ``DataFrame.to_csv(index=False)``.
+
+    Args:
+        columns: Column names
+        rows: Row values
+
+    Returns:
+        The CSV text
+    """
+    formatters = [_column_formatter(values) for values in zip(*rows)]
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(
+        [format(value) for format, value in zip(formatters, row)] for row in rows
+    )
+    return output.getvalue()
+
+
+def csv_tables(data: Dict) -> Iterator[Tuple[str, str]]:
+    """
+    Build the CSV files of the standard tables and the general info.
+
+    Args:
+        data: Raw data dictionary
+
+    Returns:
+        Iterator of (file name, CSV text)
+    """
+    for table_name, columns, rows in iter_tables(data):
+        yield CSV_FILE_NAMES[table_name], table_to_csv(columns, list(rows))
+    columns, row = general_info_table(data, "")
+    yield "general_info.csv", table_to_csv(columns, [row])
+
+
+def ndjson_records(data: Dict) -> Iterator[Dict]:
+    """
+    Flatten the standard tables and the general info into records.
+
+    Every record names its ``table`` and holds one row of it, keyed by the
+    table's column names.
+
+    Args:
+        data: Raw data dictionary
+
+    Returns:
+        Iterator of records
+    """
+    for table_name, columns, rows in iter_tables(data):
+        table = CSV_FILE_NAMES[table_name][: -len(".csv")]
+        for row in rows:
+            record = {"table": table}
+            record.update(zip(columns, row))
+            yield record
+    columns, row = general_info_table(data, "URL")
+    record = {"table": "general_info"}
+    record.update(zip(columns, row))
+    yield record
+
+
+def ndjson_lines(records: Iterator[Dict]) -> Iterator[str]:
+    """
+    Encode records as compact JSON lines.
+    """
+    for record in records:
+        yield json.dumps(record, separators=(",", ":")) + "\n"
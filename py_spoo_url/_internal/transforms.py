@@ -0,0 +1,262 @@
+import heapq
+from datetime import datetime
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+TIME_SERIES_LABELS = [
+    "last_n_days_analysis",
+    "last_n_days_unique_analysis",
+    "clicks_analysis",
+    "unique_clicks_analysis",
+]
+
+# Categorical analyses and the payload keys they come from
+DIMENSION_LABELS = [
+    "browsers_analysis",
+    "platforms_analysis",
+    "country_analysis",
+    "referrers_analysis",
+    "unique_browsers_analysis",
+    "unique_platforms_analysis",
+    "unique_country_analysis",
+    "unique_referrers_analysis",
+]
+DIMENSION_KEYS = [
+    "browser",
+    "os_name",
+    "country",
+    "referrer",
+    "unique_browser",
+    "unique_os_name",
+    "unique_country",
+    "unique_referrer",
+]
+OTHER_LABEL = "Other"
+
+# Default number of rendered points per chart type when downsampling
+DEFAULT_MAX_POINTS = {"bar": 180, "line": 1000, "area": 1000, "scatter": 1000}
+DEFAULT_MAX_TICKS = 12
+
+# (period of a date, tick label format), from the finest to the coarsest period
+_DATE_PERIODS: List[Tuple[Callable[[datetime], Hashable], str]] = [
+    (lambda d: d.date(), "%Y-%m-%d"),
+    (lambda d: d.isocalendar()[:2], "%Y-%m-%d"),
+    (lambda d: (d.year, d.month), "%Y-%m"),
+    (lambda d: (d.year, (d.month - 1) // 3), "%Y-%m"),
+    (lambda d: d.year, "%Y"),
+    (lambda d: d.year // 2, "%Y"),
+    (lambda d: d.year // 5, "%Y"),
+    (lambda d: d.year // 10, "%Y"),
+]
+
+
+def _parse_dates(keys: Sequence) -> Optional[List[datetime]]:
+    try:
+        return [datetime.strptime(str(key), "%Y-%m-%d") for key in keys]
+    except ValueError:
+        return None
+
+
+def lttb(points: Sequence[Tuple[float, float]], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last point and, from each of ``threshold - 2`` equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket. This preserves
+    peaks and the visual shape of the series.
+
+    Args:
+        points: (x, y) pairs sorted by x
+        threshold: Number of points to keep
+
+    Returns:
+        Indices of the kept points, in ascending order
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    bucket_size = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_bucket = points[end:next_end] or [points[-1]]
+        avg_x = sum(x for x, _ in next_bucket) / len(next_bucket)
+        avg_y = sum(y for _, y in next_bucket) / len(next_bucket)
+
+        ax, ay = points[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            x, y = points[j]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+def bucket_aggregate(chart_data: Dict, max_points: int) -> Dict:
+    """
+    Sum consecutive entries into at most ``max_points`` buckets.
+
+    Each bucket is labelled with its first key, so a daily series becomes a
+    series of multi-day totals.
+
+    Args:
+        chart_data: Ordered mapping of labels to values
+        max_points: Maximum number of buckets
+
+    Returns:
+        Mapping of bucket labels to summed values
+    """
+    items = list(chart_data.items())
+    if len(items) <= max_points:
+        return chart_data
+    size = -(-len(items) // max_points)
+    return {
+        items[i][0]: sum(value for _, value in items[i : i + size])
+        for i in range(0, len(items), size)
+    }
+
+
+def downsample_series(
+    chart_data: Dict,
+    chart_type: str,
+    max_points: Optional[int] = None,
+    xs: Optional[Sequence[float]] = None,
+) -> Dict:
+    """
+    Cap the number of points of a time series before plotting it.
+
+    Line, area and scatter charts use LTTB (keeping the selected points),
+    bar charts use bucket aggregation. Other chart types are returned as is.
+    LTTB picks points by the x-values they are drawn at: by default their
+    position on a categorical axis, so draw the kept points at
+    ``series_positions`` to keep the gaps between them.
+
+    Args:
+        chart_data: Ordered mapping of labels (dates) to values
+        chart_type: Chart type the data is plotted with
+        max_points: Point budget (``DEFAULT_MAX_POINTS`` for the chart type if None)
+        xs: x-values the points are drawn at (their positions if None)
+
+    Returns:
+        Mapping with at most ``max_points`` entries
+    """
+    if max_points is None:
+        max_points = DEFAULT_MAX_POINTS.get(chart_type)
+    if max_points is None or len(chart_data) <= max_points:
+        return chart_data
+    if chart_type == "bar":
+        return bucket_aggregate(chart_data, max_points)
+
+    keys = list(chart_data.keys())
+    points = list(zip(range(len(keys)) if xs is None else xs, chart_data.values()))
+    return {keys[i]: chart_data[keys[i]] for i in lttb(points, max_points)}
+
+
+def series_positions(all_keys: Sequence, keys: Sequence) -> List[int]:
+    """
+    Positions of ``keys`` on the categorical axis of ``all_keys``.
+
+    Args:
+        all_keys: Labels of the full series
+        keys: Labels of the points kept from it (e.g. by ``downsample_series``)
+
+    Returns:
+        Index of each kept label in the full series
+    """
+    index = {key: i for i, key in enumerate(all_keys)}
+    return [index[key] for key in keys]
+
+
+def date_ticks(
+    keys: Sequence, max_ticks: int = DEFAULT_MAX_TICKS
+) -> Tuple[List[int], List[str]]:
+    """
+    Pick ticks for a date-labelled categorical axis.
+
+    Ticks are placed at the first label of each day, week, month, quarter or
+    year (or multi-year span), choosing the finest period that gives at most
+    ``max_ticks`` ticks, and labelled as precisely as that period needs
+    ("2024-03-18", "2024-03" or "2024"). Non-date labels get evenly spaced
+    ticks with their own text.
+
+    Args:
+        keys: Axis labels, usually "%Y-%m-%d" dates
+        max_ticks: Maximum number of ticks
+
+    Returns:
+        Indices of the labels to tick and the tick label texts
+    """
+    keys = list(keys)
+    dates = _parse_dates(keys) if len(keys) > max_ticks else None
+    if dates is not None:
+        for period, label_format in _DATE_PERIODS:
+            positions = [
+                i
+                for i, date in enumerate(dates)
+                if i == 0 or period(date) != period(dates[i - 1])
+            ]
+            if len(positions) <= max_ticks:
+                return positions, [dates[i].strftime(label_format) for i in positions]
+    step = max(1, -(-len(keys) // max_ticks))
+    positions = list(range(0, len(keys), step))
+    return positions, [str(keys[i]) for i in positions]
+
+
+def top_n_with_other(chart_data: Dict, n: int, other_label: str = OTHER_LABEL) -> Dict:
+    """
+    Keep the ``n`` largest entries and sum the rest into an "Other" bucket.
+
+    The top entries are found with a partial selection (``heapq.nlargest``),
+    so the cost is O(m log n) for m keys rather than a full sort. Ties keep
+    their original order. If ``other_label`` is itself one of the top keys the
+    remainder is added to it.
+
+    Args:
+        chart_data: Mapping of labels to counts
+        n: Number of entries to keep
+        other_label: Label of the remainder bucket
+
+    Returns:
+        Mapping of at most ``n + 1`` labels to counts, largest first
+    """
+    if n < 1:
+        raise ValueError("n must be a positive integer.")
+    if len(chart_data) <= n:
+        return dict(sorted(chart_data.items(), key=lambda item: -item[1]))
+    top = heapq.nlargest(n, chart_data.items(), key=lambda item: item[1])
+    result = dict(top)
+    remainder = sum(chart_data.values()) - sum(result.values())
+    if remainder or other_label in result:
+        result[other_label] = result.get(other_label, 0) + remainder
+    return result
+
+
+def top_n_dimensions(data: Dict, n: int, other_label: str = OTHER_LABEL) -> Dict:
+    """
+    Apply :func:`top_n_with_other` to every dimension of a stats payload.
+
+    Time series and general info are left untouched; the payload itself is
+    not modified.
+
+    Args:
+        data: Raw stats payload
+        n: Number of entries to keep per dimension
+        other_label: Label of the remainder bucket
+
+    Returns:
+        Shallow copy of the payload with reduced dimensions
+    """
+    reduced = dict(data)
+    for key in DIMENSION_KEYS:
+        if key in reduced:
+            reduced[key] = top_n_with_other(reduced[key], n, other_label)
+    return reduced
@@ -0,0 +1,30 @@
+import os
+from functools import lru_cache
+from .dependencies import missing_dependency
+
+try:
+    import geopandas as gpd  # type: ignore
+except ImportError as e:
+    raise missing_dependency("geopandas", "The geopandas heatmap engine") from e
+
+
+WORLD_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "ne_110m_admin_0_countries.zip",
+)
+
+
+@lru_cache(maxsize=None)
+def load_world() -> gpd.GeoDataFrame:
+    """
+    Load the Natural Earth country geometry shipped with the package.
+
+    The shapefile is read from the installed package data (not the current
+    working directory) and parsed only once per process; later calls return
+    the same GeoDataFrame. Callers must treat it as read-only.
+
+    Returns:
+        GeoDataFrame with one row per country
+    """
+    return gpd.read_file(WORLD_FILE)
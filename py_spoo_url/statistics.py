@@ -1,8 +1,8 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict
-from ._internal.plotting import make_chart, make_countries_heatmap, make_unique_countries_heatmap
-from ._internal.exporters import export_data
 from ._internal.api import fetch_statistics
+from ._internal.countries import countries_by_iso, countries_by_region
+from ._internal.tables import StatisticsTables
 
 
 class Statistics:
@@ -10,8 +10,43 @@ class Statistics:
         short_code = short_code.split("/")[-1]
         self.short_code = short_code
         self.password = password
+        self._request_password = password
         r = fetch_statistics(self.short_code, self.password)
+        self._load(r)
+
+    @classmethod
+    def from_data(cls, data: Dict, password: Optional[str] = None) -> "Statistics":
+        """
+        Build a Statistics object from an already fetched stats payload.
+
+        No request is made; the short code is taken from the payload's ``_id``.
+        """
+        stats = cls.__new__(cls)
+        stats.short_code = str(data["_id"])
+        stats.password = password
+        stats._request_password = password
+        stats._load(data)
+        return stats
+
+    def refresh(self) -> "Statistics":
+        """
+        Fetch the statistics again and drop the memoized tables.
+        """
+        self._load(fetch_statistics(self.short_code, self._request_password))
+        return self
+
+    @property
+    def tables(self) -> StatisticsTables:
+        """
+        Tables derived from the payload, built once and shared by all exports.
+        """
+        if getattr(self, "_tables", None) is None:
+            self._tables = StatisticsTables(self.data)
+        return self._tables
+
+    def _load(self, r: Dict) -> None:
         self.data = r
+        self._tables = None
         self.long_url = r["url"]
         self.average_daily_clicks = r["average_daily_clicks"]
         self.average_monthly_clicks = r["average_monthly_clicks"]
@@ -37,7 +72,7 @@ class Statistics:
         self.expired = r["expired"]
         self.password = r.get("password", None)
 
-    def make_chart(self, data, chart_type="bar", days=7, **kwargs):
+    def _chart_data(self, data, days=7) -> Dict:
         data_methods = {
             "browsers_analysis": self.browsers_analysis,
             "platforms_analysis": self.platforms_analysis,
@@ -61,19 +96,192 @@ class Statistics:
                 )
             )
         if callable(selected):
-            chart_data = selected(days=days)
-        else:
-            chart_data = selected
+            return selected(days=days)
+        return selected
+
+    def make_chart(self, data, chart_type="bar", days=7, **kwargs):
+        from ._internal.plotting import make_chart
+
+        chart_data = self._chart_data(data, days=days)
         return make_chart(chart_data, chart_type=chart_type, data_label=data, **kwargs)
 
-    def make_countries_heatmap(self, cmap="YlOrRd"):
-        return make_countries_heatmap(self.country_analysis, cmap=cmap)
+    def render_chart(self, data, chart_type="bar", days=7, figsize=None, **kwargs):
+        from ._internal.rendering import render_chart
+
+        chart_data = self._chart_data(data, days=days)
+        return render_chart(
+            chart_data,
+            chart_type=chart_type,
+            data_label=data,
+            figsize=figsize,
+            **kwargs,
+        )
+
+    def render_chart_bytes(
+        self,
+        data,
+        chart_type="bar",
+        days=7,
+        format="png",
+        dpi=100,
+        figsize=None,
+        buffer=None,
+        cache=None,
+        **kwargs,
+    ):
+        from ._internal.rendering import render_chart_bytes
+
+        chart_data = self._chart_data(data, days=days)
+        return render_chart_bytes(
+            chart_data,
+            chart_type=chart_type,
+            data_label=data,
+            format=format,
+            dpi=dpi,
+            figsize=figsize,
+            buffer=buffer,
+            cache=cache,
+            **kwargs,
+        )
+
+    def make_countries_heatmap(self, cmap="YlOrRd", engine="geopandas"):
+        from ._internal.plotting import make_countries_heatmap
+
+        return make_countries_heatmap(self.country_analysis, cmap=cmap, engine=engine)
+
+    def make_unique_countries_heatmap(self, cmap="YlOrRd", engine="geopandas"):
+        from ._internal.plotting import make_unique_countries_heatmap
+
+        return make_unique_countries_heatmap(
+            self.unique_country_analysis, cmap=cmap, engine=engine
+        )
+
+    def render_countries_heatmap(self, cmap="YlOrRd", engine="geopandas", figsize=None):
+        from ._internal.rendering import render_countries_heatmap
 
-    def make_unique_countries_heatmap(self, cmap="YlOrRd"):
-        return make_unique_countries_heatmap(self.unique_country_analysis, cmap=cmap)
+        return render_countries_heatmap(
+            self.country_analysis, cmap=cmap, engine=engine, figsize=figsize
+        )
 
-    def export_data(self, filename="export.xlsx", filetype="xlsx"):
-        return export_data(self.data, filename=filename, filetype=filetype)
+    def render_unique_countries_heatmap(
+        self, cmap="YlOrRd", engine="geopandas", figsize=None
+    ):
+        from ._internal.rendering import render_unique_countries_heatmap
+
+        return render_unique_countries_heatmap(
+            self.unique_country_analysis, cmap=cmap, engine=engine, figsize=figsize
+        )
+
+    def render_countries_heatmap_bytes(
+        self,
+        cmap="YlOrRd",
+        engine="geopandas",
+        format="png",
+        dpi=100,
+        figsize=None,
+        buffer=None,
+        cache=None,
+    ):
+        from ._internal.rendering import render_countries_heatmap_bytes
+
+        return render_countries_heatmap_bytes(
+            self.country_analysis,
+            cmap=cmap,
+            engine=engine,
+            format=format,
+            dpi=dpi,
+            figsize=figsize,
+            buffer=buffer,
+            cache=cache,
+        )
+
+    def render_unique_countries_heatmap_bytes(
+        self,
+        cmap="YlOrRd",
+        engine="geopandas",
+        format="png",
+        dpi=100,
+        figsize=None,
+        buffer=None,
+        cache=None,
+    ):
+        from ._internal.rendering import render_unique_countries_heatmap_bytes
+
+        return render_unique_countries_heatmap_bytes(
+            self.unique_country_analysis,
+            cmap=cmap,
+            engine=engine,
+            format=format,
+            dpi=dpi,
+            figsize=figsize,
+            buffer=buffer,
+            cache=cache,
+        )
+
+    def export_data(self, filename="export.xlsx", filetype="xlsx", top_n=None):
+        from ._internal.exporters import export_data
+
+        return export_data(
+            self.data,
+            filename=filename,
+            filetype=filetype,
+            top_n=top_n,
+            tables=self.tables,
+        )
+
+    def export_data_bytes(self, filetype="xlsx", top_n=None, buffer=None):
+        from ._internal.exporters import export_data_bytes
+
+        return export_data_bytes(
+            self.data,
+            filetype=filetype,
+            top_n=top_n,
+            buffer=buffer,
+            tables=self.tables,
+        )
+
+    def export_formats(
+        self,
+        filename="export",
+        filetypes=("xlsx", "csv", "json"),
+        top_n=None,
+        max_workers=None,
+    ):
+        from ._internal.exporters import export_formats
+
+        return export_formats(
+            self.data,
+            filename=filename,
+            filetypes=filetypes,
+            top_n=top_n,
+            tables=self.tables,
+            max_workers=max_workers,
+        )
+
+    def build_report(
+        self,
+        filename=None,
+        format="svg",
+        dpi=100,
+        charts=None,
+        heatmaps=True,
+        top_n=20,
+        max_workers=None,
+        cache=None,
+    ):
+        from ._internal.report import build_report
+
+        return build_report(
+            self,
+            filename=filename,
+            format=format,
+            dpi=dpi,
+            charts=charts,
+            heatmaps=heatmaps,
+            top_n=top_n,
+            max_workers=max_workers,
+            cache=cache,
+        )
 
     def last_n_days_analysis(self, days: int = 7) -> Dict[str, int]:
         clicks_analysis_dates = {
@@ -101,6 +309,20 @@ class Statistics:
             raise ValueError(f"No data available for the last {days} days.")
         return unique_clicks_analysis_dates
 
+    def country_iso_analysis(self, code: str = "iso3") -> Dict[str, int]:
+        return countries_by_iso(self.country_analysis, code=code)
+
+    def unique_country_iso_analysis(self, code: str = "iso3") -> Dict[str, int]:
+        return countries_by_iso(self.unique_country_analysis, code=code)
+
+    def country_region_analysis(self, level: str = "continent") -> Dict[str, int]:
+        return countries_by_region(self.country_analysis, level=level)
+
+    def unique_country_region_analysis(
+        self, level: str = "continent"
+    ) -> Dict[str, int]:
+        return countries_by_region(self.unique_country_analysis, level=level)
+
     def __str__(self) -> str:
         return f"<Statistics {self.short_code}>"
 
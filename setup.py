@@ -14,7 +14,24 @@ setup(
     url="https://github.com/spoo-me/py_spoo_url",
     license="MIT",
     packages=find_packages(),
-    install_requires=["matplotlib", "requests", "geopandas", "pandas", "openpyxl"],
+    package_data={"py_spoo_url": ["data/*"]},
+    install_requires=["requests"],
+    extras_require={
+        "charts": ["matplotlib", "numpy"],
+        "geo": ["matplotlib", "numpy", "geopandas"],
+        "export": ["pandas", "openpyxl"],
+        "parquet": ["pyarrow"],
+        "zstd": ["zstandard"],
+        "all": [
+            "matplotlib",
+            "numpy",
+            "geopandas",
+            "pandas",
+            "openpyxl",
+            "pyarrow",
+            "zstandard",
+        ],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -0,0 +1,106 @@
+"""
+Tests for parallel batch rendering.
+"""
+
+import pytest
+import os
+from py_spoo_url import Statistics, render_batch
+
+
+@pytest.mark.unit
+class TestStatisticsFromData:
+    """Test suite for building Statistics from a payload"""
+
+    def test_from_data_makes_no_request(self, sample_statistics_data):
+        """Test that from_data loads a payload without hitting the API"""
+        import unittest.mock as mock
+
+        with mock.patch("requests.post") as mock_post:
+            stats = Statistics.from_data(sample_statistics_data)
+
+        mock_post.assert_not_called()
+        assert stats.short_code == "abc123"
+        assert stats.total_clicks == 1000
+        assert stats.country_analysis == sample_statistics_data["country"]
+
+
+@pytest.mark.slow
+class TestRenderBatch:
+    """Test suite for render_batch"""
+
+    def test_render_batch_to_bytes(self, sample_statistics_data):
+        """Test that jobs return encoded images in job order with progress"""
+        stats = Statistics.from_data(sample_statistics_data)
+        jobs = [
+            (stats, {"data": "browsers_analysis", "chart_type": "pie"}),
+            (sample_statistics_data, {"data": "clicks_analysis", "format": "svg"}),
+            (stats, {"kind": "countries_heatmap", "dpi": 20}),
+        ]
+        progress = []
+
+        results = render_batch(
+            jobs, max_workers=2, progress=lambda done, total: progress.append(done)
+        )
+
+        assert results[0].startswith(b"\x89PNG")
+        assert results[1].startswith(b"<?xml")
+        assert results[2].startswith(b"\x89PNG")
+        assert sorted(progress) == [1, 2, 3]
+
+    def test_render_batch_to_directory(self, sample_statistics_data, tmp_path):
+        """Test that jobs are written into the output directory"""
+        jobs = [
+            (sample_statistics_data, {"data": "browsers_analysis"}),
+            (sample_statistics_data, {"kind": "unique_countries_heatmap", "dpi": 20}),
+            (sample_statistics_data, {"data": "country_analysis", "name": "custom"}),
+        ]
+
+        paths = render_batch(jobs, output_dir=str(tmp_path), max_workers=2)
+
+        assert [os.path.basename(p) for p in paths] == [
+            "abc123_browsers_analysis_bar.png",
+            "abc123_unique_countries_heatmap.png",
+            "custom.png",
+        ]
+        assert all(os.path.getsize(p) > 0 for p in paths)
+
+    def test_render_batch_names_by_chart_type(
+        self, sample_statistics_data, recent_statistics_data, tmp_path
+    ):
+        """Test that charts of one analysis differing in type or days get own files"""
+        jobs = [
+            (sample_statistics_data, {"data": "browsers_analysis"}),
+            (
+                sample_statistics_data,
+                {"data": "browsers_analysis", "chart_type": "pie"},
+            ),
+            (recent_statistics_data, {"data": "last_n_days_analysis", "days": 3}),
+            (recent_statistics_data, {"data": "last_n_days_analysis", "days": 5}),
+        ]
+
+        paths = render_batch(jobs, output_dir=str(tmp_path), max_workers=1)
+
+        assert [os.path.basename(p) for p in paths] == [
+            "abc123_browsers_analysis_bar.png",
+            "abc123_browsers_analysis_pie.png",
+            "abc123_last_n_days_analysis_bar_3d.png",
+            "abc123_last_n_days_analysis_bar_5d.png",
+        ]
+        assert len(os.listdir(tmp_path)) == 4
+
+    def test_render_batch_duplicate_paths(self, sample_statistics_data, tmp_path):
+        """Test that jobs writing the same file are rejected before rendering"""
+        jobs = [
+            (sample_statistics_data, {"kind": "countries_heatmap"}),
+            (sample_statistics_data, {"kind": "countries_heatmap", "cmap": "Blues"}),
+        ]
+
+        with pytest.raises(ValueError, match="abc123_countries_heatmap.png"):
+            render_batch(jobs, output_dir=str(tmp_path / "out"), max_workers=1)
+
+        assert not (tmp_path / "out").exists()
+
+    def test_render_batch_invalid_kind(self, sample_statistics_data):
+        """Test that an invalid chart kind surfaces as ValueError"""
+        with pytest.raises(ValueError):
+            render_batch([(sample_statistics_data, {"kind": "radar"})], max_workers=1)
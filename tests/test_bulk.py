@@ -0,0 +1,181 @@
+"""
+Tests for bulk exports of many links.
+"""
+
+import pytest
+import csv
+import gzip
+import io
+import json
+import openpyxl
+from py_spoo_url import Statistics, export_many, export_ndjson
+
+
+def _links(sample_statistics_data, count):
+    for i in range(count):
+        data = dict(sample_statistics_data)
+        data["_id"] = f"link{i}"
+        data["browser"] = {"Chrome": i, "Edge": 1}
+        data["counter"] = {"2024-01-31": i, "2024-02-01": 2 * i}
+        yield data
+
+
+@pytest.mark.unit
+class TestExportMany:
+    """Test suite for export_many"""
+
+    def test_small_set_writes_one_workbook(self, tmp_path, sample_statistics_data):
+        """Test that a few links end up as long sheets of one workbook"""
+        links = [Statistics.from_data(d) for d in _links(sample_statistics_data, 3)]
+
+        path = export_many(links, str(tmp_path / "links"))
+
+        assert path.endswith("links.xlsx")
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        assert workbook.sheetnames[0] == "Browser"
+        assert workbook.sheetnames[-1] == "General_Info"
+        rows = list(workbook["Browser"].values)
+        assert rows[0] == ("Short_Code", "Browser", "Count")
+        assert rows[1:] == [
+            ("link0", "Chrome", 0),
+            ("link0", "Edge", 1),
+            ("link1", "Chrome", 1),
+            ("link1", "Edge", 1),
+            ("link2", "Chrome", 2),
+            ("link2", "Edge", 1),
+        ]
+        info = list(workbook["General_Info"].values)
+        assert [row[3] for row in info] == ["SHORT CODE", "link0", "link1", "link2"]
+        workbook.close()
+
+    def test_large_set_writes_csv_parts(self, tmp_path, sample_statistics_data):
+        """Test that a generator of links is split into part files"""
+        directory = tmp_path / "links"
+
+        export_many(
+            _links(sample_statistics_data, 5),
+            str(directory),
+            filetype="csv",
+            links_per_file=2,
+        )
+
+        parts = sorted(p.name for p in (directory / "browser").iterdir())
+        assert parts == ["part-00000.csv", "part-00001.csv", "part-00002.csv"]
+        with open(directory / "browser" / "part-00002.csv", newline="") as f:
+            assert list(csv.reader(f)) == [
+                ["Short_Code", "Browser", "Count"],
+                ["link4", "Chrome", "4"],
+                ["link4", "Edge", "1"],
+            ]
+        assert (directory / "general_info" / "part-00000.csv").exists()
+
+    def test_partition_by_date(self, tmp_path, sample_statistics_data):
+        """Test that daily tables are split into month folders"""
+        directory = tmp_path / "links"
+
+        export_many(
+            _links(sample_statistics_data, 2),
+            str(directory),
+            filetype="csv",
+            partition_by="date",
+        )
+
+        months = sorted(p.name for p in (directory / "counter").iterdir())
+        assert months == ["month=2024-01", "month=2024-02"]
+        with open(directory / "counter" / "month=2024-02" / "part-00000.csv") as f:
+            assert f.read().splitlines()[1:] == [
+                "link0,2024-02-01,0",
+                "link1,2024-02-01,2",
+            ]
+        assert (directory / "browser" / "part-00000.csv").exists()
+
+    def test_auto_picks_parquet_for_large_sets(self, tmp_path, sample_statistics_data):
+        """Test that sets above the workbook limit become a Parquet dataset"""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.dataset as ds
+
+        directory = tmp_path / "links"
+
+        path = export_many(
+            _links(sample_statistics_data, 5),
+            str(directory),
+            max_workbook_links=3,
+            links_per_file=2,
+        )
+
+        assert path == str(directory)
+        browser = ds.dataset(directory / "browser", format="parquet").to_table()
+        assert browser.num_rows == 10
+        assert pa.types.is_dictionary(browser.schema.field("Short_Code").type)
+        counter = ds.dataset(directory / "counter", format="parquet")
+        assert counter.schema.field("Date").type == pa.date32()
+        info = ds.dataset(directory / "general_info", format="parquet").to_table()
+        assert sorted(info["SHORT CODE"].to_pylist()) == [f"link{i}" for i in range(5)]
+
+    def test_invalid_arguments(self, tmp_path, sample_statistics_data):
+        """Test that unknown file types and partitionings are rejected"""
+        with pytest.raises(ValueError, match="Invalid file type"):
+            export_many([sample_statistics_data], str(tmp_path), filetype="json")
+        with pytest.raises(ValueError, match="Invalid partitioning"):
+            export_many([sample_statistics_data], str(tmp_path), partition_by="day")
+
+
+@pytest.mark.unit
+class TestExportNDJSON:
+    """Test suite for export_ndjson"""
+
+    def test_one_record_per_link(self, capsys, sample_statistics_data):
+        """Test that a generator of links is written as compact lines"""
+        buffer = io.BytesIO()
+
+        count = export_ndjson(_links(sample_statistics_data, 3), buffer)
+
+        lines = buffer.getvalue().decode().splitlines()
+        assert count == 3
+        assert [json.loads(line)["_id"] for line in lines] == [
+            "link0",
+            "link1",
+            "link2",
+        ]
+        assert ": " not in lines[0]
+        assert capsys.readouterr().out == ""
+
+    def test_link_day_records_gzip(self, tmp_path, sample_statistics_data):
+        """Test per link and day records with gzip compression"""
+        path = tmp_path / "days.ndjson.gz"
+        links = [Statistics.from_data(sample_statistics_data)]
+
+        count = export_ndjson(links, str(path), records="link-day", compression="gzip")
+
+        with gzip.open(path, "rt") as f:
+            records = [json.loads(line) for line in f]
+        assert count == 3
+        assert records[1] == {
+            "short_code": "abc123",
+            "date": "2024-01-02",
+            "clicks": 75,
+            "unique_clicks": 60,
+        }
+
+    def test_zstd_compression(self, sample_statistics_data):
+        """Test that zstd output decompresses to the same lines"""
+        zstandard = pytest.importorskip("zstandard")
+        plain, compressed = io.BytesIO(), io.BytesIO()
+
+        export_ndjson(_links(sample_statistics_data, 50), plain)
+        export_ndjson(
+            _links(sample_statistics_data, 50), compressed, compression="zstd"
+        )
+
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            io.BytesIO(compressed.getvalue())
+        )
+        assert reader.read() == plain.getvalue()
+        assert len(compressed.getvalue()) < len(plain.getvalue()) / 5
+
+    def test_invalid_arguments(self, sample_statistics_data):
+        """Test that unknown record kinds and codecs are rejected"""
+        with pytest.raises(ValueError, match="Invalid records"):
+            export_ndjson([sample_statistics_data], io.BytesIO(), records="day")
+        with pytest.raises(ValueError, match="Invalid compression"):
+            export_ndjson([sample_statistics_data], io.BytesIO(), compression="lz4")
@@ -0,0 +1,142 @@
+"""
+Tests for the content-addressed render cache.
+"""
+
+import pytest
+import unittest.mock as mock
+import json
+import os
+from py_spoo_url import RenderCache, Statistics
+from py_spoo_url._internal import rendering
+from py_spoo_url._internal.cache import make_cache_key
+
+
+@pytest.fixture
+def stats(sample_statistics_data):
+    with mock.patch("requests.post") as mock_post:
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.text = json.dumps(sample_statistics_data)
+        mock_post.return_value = mock_response
+        yield Statistics("abc123")
+
+
+@pytest.mark.unit
+class TestRenderCache:
+    """Test suite for RenderCache"""
+
+    def test_make_cache_key_ignores_part_order(self):
+        """Test that equal inputs give equal keys regardless of argument order"""
+        key_a = make_cache_key(data={"a": 1, "b": 2}, chart_type="bar")
+        key_b = make_cache_key(chart_type="bar", data={"a": 1, "b": 2})
+        key_c = make_cache_key(chart_type="pie", data={"a": 1, "b": 2})
+
+        assert key_a == key_b
+        assert key_a != key_c
+
+    def test_make_cache_key_keeps_item_order(self):
+        """Test that analyses drawn in a different order get different keys"""
+        key_a = make_cache_key(data={"a": 1, "b": 2})
+        key_b = make_cache_key(data={"b": 2, "a": 1})
+
+        assert key_a != key_b
+        assert make_cache_key(data={1: 2}) != make_cache_key(data={"1": 2})
+        assert make_cache_key(data=["a"]) != make_cache_key(data={"a": None})
+
+    def test_make_cache_key_normalizes_values(self):
+        """Test that numpy values are normalized and other objects rejected"""
+        np = pytest.importorskip("numpy")
+
+        assert make_cache_key(data={"a": np.int64(1)}) == make_cache_key(data={"a": 1})
+        assert make_cache_key(figsize=(4, 3)) == make_cache_key(
+            figsize=np.array([4, 3])
+        )
+        with pytest.raises(TypeError, match="object"):
+            make_cache_key(color=object())
+
+    def test_unkeyable_inputs_skip_cache(self, stats):
+        """Test that inputs without a stable key are rendered without caching"""
+        from matplotlib import colormaps
+
+        cache = RenderCache()
+        for _ in range(2):
+            image = stats.render_chart_bytes(
+                "browsers_analysis",
+                chart_type="scatter",
+                cmap=colormaps["viridis"],
+                c=[1, 2, 3],
+                cache=cache,
+            )
+
+        assert image.startswith(b"\x89PNG")
+        assert cache.hits == cache.misses == 0
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        """Test that the memory tier stays within its byte budget"""
+        cache = RenderCache(max_memory_bytes=10)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        assert cache.get("a") == b"12345"
+
+        cache.set("c", b"12345")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"12345"
+        assert cache.get("c") == b"12345"
+
+    def test_disk_tier_persists_and_evicts(self, tmp_path):
+        """Test that the disk tier survives a new instance and respects its size"""
+        directory = str(tmp_path / "renders")
+        cache = RenderCache(max_memory_bytes=0, directory=directory, max_disk_bytes=10)
+        cache.set("a", b"12345")
+        os.utime(os.path.join(directory, "a.bin"), (1, 1))
+        cache.set("b", b"12345")
+        cache.set("c", b"12345")
+
+        reopened = RenderCache(directory=directory, max_disk_bytes=10)
+
+        assert reopened.get("a") is None
+        assert reopened.get("b") == b"12345"
+        assert reopened.get("c") == b"12345"
+
+        reopened.clear()
+        assert os.listdir(directory) == []
+
+
+@pytest.mark.unit
+class TestCachedRendering:
+    """Test suite for rendering through the cache"""
+
+    def test_chart_rendered_once_for_same_inputs(self, stats):
+        """Test that a repeated chart render is served from the cache"""
+        cache = RenderCache()
+
+        with mock.patch.object(
+            rendering, "render_chart", wraps=rendering.render_chart
+        ) as spy:
+            first = stats.render_chart_bytes("browsers_analysis", cache=cache)
+            second = stats.render_chart_bytes("browsers_analysis", cache=cache)
+            stats.render_chart_bytes("browsers_analysis", format="svg", cache=cache)
+
+        assert first == second
+        assert spy.call_count == 2
+        assert cache.hits == 1
+
+    def test_heatmap_cache_writes_into_buffer(self, stats, tmp_path):
+        """Test that cached heatmaps are written into a supplied buffer"""
+        import io
+
+        cache = RenderCache(directory=str(tmp_path))
+        data = stats.render_countries_heatmap_bytes(
+            engine="polygons", dpi=20, cache=cache
+        )
+        buffer = io.BytesIO()
+
+        result = stats.render_countries_heatmap_bytes(
+            engine="polygons", dpi=20, cache=cache, buffer=buffer
+        )
+
+        assert result is None
+        assert buffer.getvalue() == data
+        assert cache.hits == 1
+        assert len(os.listdir(tmp_path)) == 1
@@ -408,3 +408,87 @@ class TestChartCustomization:
             call_args = mock_pie.call_args
             assert "autopct" in call_args.kwargs
             assert "startangle" in call_args.kwargs
+
+
+@pytest.mark.unit
+class TestWorldGeometry:
+    """Test suite for the cached world geometry"""
+
+    def test_load_world_reads_package_data_once(self, tmp_path, monkeypatch):
+        """Test that the shapefile is read once, independently of the CWD"""
+        from py_spoo_url._internal.world import WORLD_FILE, load_world
+
+        load_world.cache_clear()
+        monkeypatch.chdir(tmp_path)
+        try:
+            with mock.patch("geopandas.read_file") as mock_read_file:
+                first = load_world()
+                second = load_world()
+
+                assert first is second
+                mock_read_file.assert_called_once_with(WORLD_FILE)
+        finally:
+            load_world.cache_clear()
+
+    def test_world_file_is_packaged(self):
+        """Test that the world geometry path points into the package"""
+        import os
+        from py_spoo_url._internal.world import WORLD_FILE
+
+        assert os.path.isfile(WORLD_FILE)
+
+
+@pytest.mark.unit
+class TestPolygonHeatmap:
+    """Test suite for the geopandas-free heatmap engine"""
+
+    def test_world_polygons_are_packaged(self):
+        """Test that the baked polygon arrays load and cover the world map"""
+        from py_spoo_url._internal.polygons import load_world_polygons
+
+        world = load_world_polygons()
+
+        assert len(world.rings) == len(world.ring_country)
+        assert "United States of America" in set(world.names)
+        assert all(ring.shape[1] == 2 for ring in world.rings)
+
+    @mock.patch("requests.post")
+    def test_polygon_engine_renders_without_geopandas(
+        self, mock_post, sample_statistics_data
+    ):
+        """Test that the polygon engine colours matched countries only"""
+        import numpy as np
+        from matplotlib.collections import PolyCollection
+        from py_spoo_url._internal.polygons import load_world_polygons
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.text = json.dumps(sample_statistics_data)
+        mock_post.return_value = mock_response
+
+        stats = Statistics("abc123")
+
+        with mock.patch("geopandas.read_file") as mock_read_file:
+            result = stats.make_countries_heatmap(engine="polygons")
+
+        assert result == plt
+        mock_read_file.assert_not_called()
+
+        fills = [
+            c for c in plt.gcf().axes[0].collections if isinstance(c, PolyCollection)
+        ]
+        assert len(fills) == 1
+        world = load_world_polygons()
+        values = fills[0].get_array()
+        colored = {
+            world.names[world.ring_country[i]]
+            for i in np.flatnonzero(~np.ma.getmaskarray(values))
+        }
+        assert colored == {"United States of America", "United Kingdom", "Germany"}
+
+    def test_invalid_engine(self):
+        """Test that an unknown heatmap engine raises ValueError"""
+        from py_spoo_url._internal.plotting import make_countries_heatmap
+
+        with pytest.raises(ValueError):
+            make_countries_heatmap({"USA": 1}, engine="cartopy")
@@ -0,0 +1,109 @@
+"""
+Tests for the country name / ISO code index.
+"""
+
+import pytest
+import unittest.mock as mock
+import json
+from py_spoo_url import Statistics
+from py_spoo_url._internal.countries import (
+    canonical_country_names,
+    countries_by_iso,
+    countries_by_region,
+    resolve_country,
+)
+
+
+@pytest.mark.unit
+class TestCountryIndex:
+    """Test suite for country resolution"""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["United States", "USA", "us", "usa", "United States of America", "America"],
+    )
+    def test_resolve_aliases(self, name):
+        """Test that common aliases and ISO codes resolve to the same country"""
+        country = resolve_country(name)
+
+        assert country is not None
+        assert country.iso2 == "US"
+        assert country.iso3 == "USA"
+        assert country.name == "United States of America"
+        assert country.continent == "North America"
+
+    def test_resolve_normalizes_accents_and_punctuation(self):
+        """Test that accents, ampersands and punctuation do not break lookups"""
+        assert resolve_country("Côte d’Ivoire").iso3 == "CIV"
+        assert resolve_country("cote d ivoire").iso3 == "CIV"
+        assert resolve_country("Bosnia & Herzegovina").iso3 == "BIH"
+
+    def test_resolve_unknown(self):
+        """Test that unknown names resolve to None"""
+        assert resolve_country("Atlantis") is None
+
+    def test_canonical_country_names_merges_aliases(self):
+        """Test that aliases of the same country are summed under its map name"""
+        result = canonical_country_names({"USA": 10, "United States": 5, "Atlantis": 1})
+
+        assert result == {"United States of America": 15, "Atlantis": 1}
+
+    def test_countries_by_iso(self):
+        """Test ISO-keyed re-aggregation"""
+        data = {"USA": 400, "UK": 300, "Germany": 300, "Atlantis": 1}
+
+        assert countries_by_iso(data) == {"USA": 400, "GBR": 300, "DEU": 300}
+        assert countries_by_iso(data, code="iso2", unknown_label="ZZ") == {
+            "US": 400,
+            "GB": 300,
+            "DE": 300,
+            "ZZ": 1,
+        }
+
+    def test_countries_by_iso_invalid_code(self):
+        """Test that an invalid ISO code type raises ValueError"""
+        with pytest.raises(ValueError):
+            countries_by_iso({"USA": 1}, code="iso4")
+
+    def test_countries_by_region(self):
+        """Test continent and subregion aggregation"""
+        data = {"USA": 400, "UK": 300, "Germany": 300, "France": 50}
+
+        assert countries_by_region(data) == {"North America": 400, "Europe": 650}
+        assert countries_by_region(data, level="subregion") == {
+            "Northern America": 400,
+            "Northern Europe": 300,
+            "Western Europe": 350,
+        }
+
+    def test_countries_by_region_invalid_level(self):
+        """Test that an invalid region level raises ValueError"""
+        with pytest.raises(ValueError):
+            countries_by_region({"USA": 1}, level="planet")
+
+
+@pytest.mark.unit
+class TestStatisticsCountryAnalyses:
+    """Test suite for the ISO-keyed and region-aggregated Statistics methods"""
+
+    @mock.patch("requests.post")
+    def test_iso_and_region_analyses(self, mock_post, sample_statistics_data):
+        """Test ISO and region analyses on a Statistics instance"""
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.text = json.dumps(sample_statistics_data)
+        mock_post.return_value = mock_response
+
+        stats = Statistics("abc123")
+
+        assert stats.country_iso_analysis() == {"USA": 400, "GBR": 300, "DEU": 300}
+        assert stats.unique_country_iso_analysis(code="iso2") == {
+            "US": 300,
+            "GB": 250,
+            "DE": 200,
+        }
+        assert stats.country_region_analysis() == {"North America": 400, "Europe": 600}
+        assert stats.unique_country_region_analysis(level="region") == {
+            "Americas": 300,
+            "Europe": 450,
+        }
@@ -67,6 +67,33 @@ class TestJSONExport:
             if os.path.exists(custom_filename):
                 os.unlink(custom_filename)
 
+    @mock.patch("requests.post")
+    def test_export_to_json_top_n(self, mock_post, sample_statistics_data):
+        """Test JSON export limited to the top entries of each dimension"""
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.text = json.dumps(sample_statistics_data)
+        mock_post.return_value = mock_response
+
+        stats = Statistics("abc123")
+
+        filename = "top_n_export.json"
+
+        try:
+            stats.export_data(filename=filename, filetype="json", top_n=1)
+
+            with open(filename, "r") as f:
+                exported_data = json.load(f)
+
+            assert list(exported_data["browser"]) == ["Chrome", "Other"]
+            assert sum(exported_data["browser"].values()) == sum(
+                sample_statistics_data["browser"].values()
+            )
+            assert exported_data["counter"] == sample_statistics_data["counter"]
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
+
 
 @pytest.mark.unit
 class TestExcelExport:
@@ -154,6 +181,28 @@ class TestExcelExport:
             if os.path.exists(temp_filename):
                 os.unlink(temp_filename)
 
+    def test_streaming_excel_matches_pandas_path(
+        self, sample_statistics_data, tmp_path
+    ):
+        """Test that the write-only export holds the same sheets as the pandas one"""
+        from py_spoo_url._internal.exporters import export_to_excel
+
+        streamed = str(tmp_path / "streamed.xlsx")
+        buffered = str(tmp_path / "buffered.xlsx")
+
+        with mock.patch(
+            "py_spoo_url._internal.utils.create_dataframes_from_data"
+        ) as create_dataframes:
+            export_to_excel(sample_statistics_data, streamed)
+        create_dataframes.assert_not_called()
+        export_to_excel(sample_statistics_data, buffered, streaming=False)
+
+        streamed_sheets = pd.read_excel(streamed, sheet_name=None)
+        buffered_sheets = pd.read_excel(buffered, sheet_name=None)
+        assert list(streamed_sheets) == list(buffered_sheets)
+        for name, frame in buffered_sheets.items():
+            pd.testing.assert_frame_equal(streamed_sheets[name], frame)
+
 
 @pytest.mark.unit
 class TestCSVExport:
@@ -247,6 +296,293 @@ class TestCSVExport:
             if os.path.exists(zip_filename):
                 os.unlink(zip_filename)
 
+    def test_export_to_csv_without_temp_directory(
+        self, tmp_path, monkeypatch, sample_statistics_data
+    ):
+        """Test that the CSVs are zipped from memory without a csv_files folder"""
+        from py_spoo_url._internal.exporters import export_to_csv
+
+        monkeypatch.chdir(tmp_path)
+
+        export_to_csv(sample_statistics_data, "links")
+
+        assert sorted(os.listdir(tmp_path)) == ["links.zip"]
+
+    def test_export_to_csv_file_like(self, capsys, sample_statistics_data):
+        """Test writing the zip into a file-like object"""
+        import io
+        from py_spoo_url._internal.exporters import export_to_csv
+
+        buffer = io.BytesIO()
+        export_to_csv(sample_statistics_data, buffer)
+
+        with zipfile.ZipFile(buffer) as zip_file:
+            browser_df = pd.read_csv(zip_file.open("browser.csv"))
+            assert "general_info.csv" in zip_file.namelist()
+        assert dict(zip(browser_df["Browser"], browser_df["Count"]))["Chrome"] == 500
+        assert capsys.readouterr().out == ""
+
+    def test_stdlib_engine_matches_pandas(self, sample_statistics_data):
+        """Test that both CSV engines write byte-identical files"""
+        import io
+        from py_spoo_url._internal.exporters import export_to_csv
+
+        data = dict(sample_statistics_data)
+        data["url"] = 'https://example.com/?a=1,b="2"'
+        data["browser"] = {"Chrome, Beta": 1, "Firefox": 2.5, "Safari": None}
+        data["os_name"] = {"Windows": 3, "Linux": None}
+        data["max-clicks"] = None
+        data["counter"] = {}
+
+        archives = {}
+        for engine in ("stdlib", "pandas"):
+            buffer = io.BytesIO()
+            export_to_csv(data, buffer, engine=engine)
+            with zipfile.ZipFile(buffer) as zip_file:
+                archives[engine] = {
+                    name: zip_file.read(name) for name in zip_file.namelist()
+                }
+
+        assert archives["stdlib"] == archives["pandas"]
+        assert (
+            archives["stdlib"]["os_name.csv"] == b"OS_Name,Count\nWindows,3.0\nLinux,\n"
+        )
+
+    def test_concurrent_csv_exports(self, tmp_path, sample_statistics_data):
+        """Test that exports running in parallel do not interfere"""
+        from concurrent.futures import ThreadPoolExecutor
+        from py_spoo_url._internal.exporters import export_to_csv
+
+        payloads = []
+        for i in range(8):
+            data = dict(sample_statistics_data)
+            data["browser"] = {"Chrome": i}
+            payloads.append(data)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(
+                pool.map(
+                    lambda i: export_to_csv(payloads[i], str(tmp_path / f"link{i}")),
+                    range(8),
+                )
+            )
+
+        for i in range(8):
+            with zipfile.ZipFile(tmp_path / f"link{i}.zip") as zip_file:
+                browser_df = pd.read_csv(zip_file.open("browser.csv"))
+            assert browser_df["Count"].tolist() == [i]
+
+
+@pytest.mark.unit
+class TestNDJSONExport:
+    """Test suite for NDJSON export functionality"""
+
+    def test_export_to_ndjson(self, tmp_path, sample_statistics_data):
+        """Test that every table row becomes one compact JSON line"""
+        stats = Statistics.from_data(sample_statistics_data)
+        path = tmp_path / "export.ndjson"
+
+        stats.export_data(filename=str(path), filetype="ndjson")
+
+        lines = path.read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert lines[0] == '{"table":"browser","Browser":"Chrome","Count":500}'
+        assert {"table": "counter", "Date": "2024-01-02", "Count": 75} in records
+        assert records[-1]["table"] == "general_info"
+        assert records[-1]["SHORT CODE"] == "abc123"
+        assert len(records) == 31
+
+
+@pytest.mark.unit
+class TestColumnarExport:
+    """Test suite for Parquet and Arrow export functionality"""
+
+    @pytest.mark.parametrize("filetype", ["parquet", "arrow"])
+    def test_export_columnar(self, filetype, tmp_path, sample_statistics_data):
+        """Test that every table is written with encoded, typed columns"""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.dataset as ds
+
+        stats = Statistics.from_data(sample_statistics_data)
+        directory = tmp_path / "export"
+
+        stats.export_data(filename=str(directory), filetype=filetype)
+
+        files = sorted(path.name for path in directory.iterdir())
+        assert f"browser.{filetype}" in files
+        assert f"general_info.{filetype}" in files
+        assert len(files) == 11
+
+        file_format = "ipc" if filetype == "arrow" else "parquet"
+        browser = ds.dataset(directory / f"browser.{filetype}", format=file_format)
+        table = browser.to_table()
+        assert pa.types.is_dictionary(table.schema.field("Browser").type)
+        assert dict(zip(table["Browser"].to_pylist(), table["Count"].to_pylist())) == {
+            "Chrome": 500,
+            "Firefox": 300,
+            "Safari": 200,
+        }
+
+        counter = ds.dataset(directory / f"counter.{filetype}", format=file_format)
+        assert counter.schema.field("Date").type == pa.date32()
+
+        info = ds.dataset(directory / f"general_info.{filetype}", format=file_format)
+        assert info.to_table()["TOTAL CLICKS"].to_pylist() == [1000]
+
+    def test_export_columnar_is_compressed(self, tmp_path, sample_statistics_data):
+        """Test that the Parquet columns are written with zstd compression"""
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        stats = Statistics.from_data(sample_statistics_data)
+        stats.export_data(filename=str(tmp_path), filetype="parquet")
+
+        metadata = pq.ParquetFile(tmp_path / "browser.parquet").metadata
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+@pytest.mark.unit
+class TestExportToStreams:
+    """Test suite for exporting to file-like objects and bytes"""
+
+    def test_export_bytes_every_format(self, capsys, sample_statistics_data):
+        """Test that every format can be exported in memory without printing"""
+        import io
+        import openpyxl
+
+        stats = Statistics.from_data(sample_statistics_data)
+
+        xlsx = stats.export_data_bytes("xlsx")
+        workbook = openpyxl.load_workbook(io.BytesIO(xlsx))
+        assert workbook["Browser"]["A2"].value == "Chrome"
+
+        assert json.loads(stats.export_data_bytes("json")) == sample_statistics_data
+
+        with zipfile.ZipFile(io.BytesIO(stats.export_data_bytes("csv"))) as zip_file:
+            assert "general_info.csv" in zip_file.namelist()
+
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize("filetype", ["parquet", "arrow"])
+    def test_export_columnar_to_stream(self, filetype, sample_statistics_data):
+        """Test that columnar exports are zipped into the given stream"""
+        pytest.importorskip("pyarrow")
+        import io
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+
+        stats = Statistics.from_data(sample_statistics_data)
+        buffer = io.BytesIO()
+
+        assert stats.export_data_bytes(filetype, buffer=buffer) is None
+
+        with zipfile.ZipFile(buffer) as zip_file:
+            assert len(zip_file.namelist()) == 11
+            content = io.BytesIO(zip_file.read(f"browser.{filetype}"))
+        read = pq.read_table if filetype == "parquet" else feather.read_table
+        assert read(content)["Count"].to_pylist() == [500, 300, 200]
+
+    def test_export_data_accepts_stream(self, tmp_path, sample_statistics_data):
+        """Test that export_data writes into an open binary file"""
+        stats = Statistics.from_data(sample_statistics_data)
+        path = tmp_path / "stats.json"
+
+        with open(path, "wb") as f:
+            stats.export_data(f, filetype="json", top_n=1)
+
+        with open(path) as f:
+            assert json.load(f)["browser"] == {"Chrome": 500, "Other": 500}
+
+
+@pytest.mark.unit
+class TestExportFormats:
+    """Test suite for exporting several formats in one call"""
+
+    def test_writes_every_format(self, tmp_path, sample_statistics_data):
+        """Test that each format is written and reported with size and time"""
+        import openpyxl
+
+        stats = Statistics.from_data(sample_statistics_data)
+        base = str(tmp_path / "stats")
+
+        results = stats.export_formats(base, filetypes=["xlsx", "csv", "json"])
+
+        assert list(results) == ["xlsx", "csv", "json"]
+        assert results["xlsx"]["path"] == base + ".xlsx"
+        assert results["csv"]["path"] == base + ".csv.zip"
+        assert results["json"]["path"] == base + ".json"
+        for result in results.values():
+            assert result["size"] == os.path.getsize(result["path"])
+            assert result["seconds"] >= 0
+        workbook = openpyxl.load_workbook(results["xlsx"]["path"], read_only=True)
+        assert list(workbook["Browser"].values)[1] == ("Chrome", 500)
+        with zipfile.ZipFile(results["csv"]["path"]) as zip_file:
+            assert zip_file.read("browser.csv") == (
+                stats.tables.csv_files()["browser.csv"].encode()
+            )
+        with open(results["json"]["path"]) as f:
+            assert json.load(f) == sample_statistics_data
+
+    def test_tables_built_once(self, tmp_path, sample_statistics_data):
+        """Test that the formats share the tables built before writing"""
+        pytest.importorskip("pyarrow")
+        from py_spoo_url._internal import columnar, textexport
+
+        stats = Statistics.from_data(sample_statistics_data)
+
+        with (
+            mock.patch.object(
+                textexport, "csv_tables", wraps=textexport.csv_tables
+            ) as csv_tables,
+            mock.patch.object(
+                columnar, "columnar_tables", wraps=columnar.columnar_tables
+            ) as columnar_tables,
+        ):
+            stats.export_formats(
+                str(tmp_path / "stats"), filetypes=["csv", "parquet", "arrow"]
+            )
+            stats.export_formats(str(tmp_path / "again"), filetypes=["csv"])
+
+        assert csv_tables.call_count == 1
+        assert columnar_tables.call_count == 1
+
+    def test_columnar_directory_size(self, tmp_path, sample_statistics_data):
+        """Test that the size of a Parquet export sums up its files"""
+        pytest.importorskip("pyarrow")
+        from py_spoo_url._internal.exporters import export_formats
+
+        results = export_formats(
+            sample_statistics_data, str(tmp_path / "stats"), filetypes=["parquet"]
+        )
+
+        path = results["parquet"]["path"]
+        assert os.path.isdir(path)
+        assert results["parquet"]["size"] == sum(
+            os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)
+        )
+
+    def test_top_n(self, tmp_path, sample_statistics_data):
+        """Test that top_n applies to every format"""
+        stats = Statistics.from_data(sample_statistics_data)
+
+        results = stats.export_formats(
+            str(tmp_path / "stats"), filetypes=["json", "csv"], top_n=1
+        )
+
+        with open(results["json"]["path"]) as f:
+            assert json.load(f)["browser"] == {"Chrome": 500, "Other": 500}
+        with zipfile.ZipFile(results["csv"]["path"]) as zip_file:
+            assert b"Other" in zip_file.read("browser.csv")
+
+    def test_invalid_format_writes_nothing(self, tmp_path, sample_statistics_data):
+        """Test that an unknown format is rejected before anything is written"""
+        stats = Statistics.from_data(sample_statistics_data)
+
+        with pytest.raises(ValueError, match="'pdf'"):
+            stats.export_formats(str(tmp_path / "stats"), filetypes=["json", "pdf"])
+
+        assert os.listdir(tmp_path) == []
+
 
 @pytest.mark.unit
 class TestExportErrors:
@@ -0,0 +1,78 @@
+"""
+Tests for the reusable heatmap base layer.
+"""
+
+import pytest
+import io
+from matplotlib.animation import FuncAnimation
+from py_spoo_url import HeatmapRenderer
+from py_spoo_url._internal.rendering import render_countries_heatmap_bytes
+
+
+DATASETS = [
+    {"United States": 400, "India": 300, "Germany": 250, "UK": 80},
+    {"France": 3, "Japan": 10000, "Chile": 7},
+]
+
+
+@pytest.mark.unit
+class TestHeatmapRenderer:
+    """Test suite for HeatmapRenderer"""
+
+    def test_render_matches_polygon_engine(self):
+        """Test that recoloured PNGs are identical to freshly drawn heatmaps"""
+        renderer = HeatmapRenderer()
+
+        for data in DATASETS + DATASETS:
+            expected = render_countries_heatmap_bytes(data, engine="polygons", dpi=40)
+            assert renderer.render(data, dpi=40) == expected
+
+    def test_render_other_formats_and_buffer(self):
+        """Test vector output and writing into a buffer"""
+        renderer = HeatmapRenderer(figsize=(6, 4))
+        buffer = io.BytesIO()
+
+        svg = renderer.render(DATASETS[0], format="svg")
+        assert renderer.render(DATASETS[1], dpi=20, buffer=buffer) is None
+
+        assert svg.startswith(b"<?xml")
+        assert buffer.getvalue().startswith(b"\x89PNG")
+
+    def test_update_title_and_fixed_scale(self):
+        """Test that titles change and a fixed colour scale is kept"""
+        renderer = HeatmapRenderer(title="Link A", vmin=0, vmax=50000)
+
+        fig = renderer.update(DATASETS[1], title="Link B")
+
+        assert fig._suptitle.get_text() == "Link B"
+        assert fig.axes[0].collections[1].get_clim() == (0, 50000)
+
+    def test_unknown_countries_are_ignored(self):
+        """Test that names missing from the world map do not fail"""
+        renderer = HeatmapRenderer()
+
+        renderer.update({"Atlantis": 100, "USA": 5, "India": 9})
+
+        assert renderer.figure.axes[0].collections[1].get_clim() == (5, 9)
+
+    def test_animate_uses_shared_scale(self, tmp_path):
+        """Test that animations recolour one frame per dataset on one scale"""
+        renderer = HeatmapRenderer(figsize=(4, 3))
+
+        animation = renderer.animate(DATASETS, titles=["Day 1", "Day 2"])
+        animation.save(str(tmp_path / "map.gif"), writer="pillow", dpi=20)
+
+        assert isinstance(animation, FuncAnimation)
+        assert (tmp_path / "map.gif").stat().st_size > 0
+        assert renderer.figure._suptitle.get_text() == "Day 2"
+        assert renderer.figure.axes[0].collections[1].get_clim() == (3, 10000)
+
+    def test_animate_scale_follows_drawn_values(self, tmp_path):
+        """Test that the shared scale covers summed aliases, not unknown names"""
+        renderer = HeatmapRenderer(figsize=(4, 3))
+        frames = [{"USA": 5, "United States": 5, "Atlantis": 1}, {"India": 2}]
+
+        animation = renderer.animate(frames)
+        animation.save(str(tmp_path / "map.gif"), writer="pillow", dpi=20)
+
+        assert renderer.figure.axes[0].collections[1].get_clim() == (2, 10)
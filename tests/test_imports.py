@@ -0,0 +1,169 @@
+"""
+Import-time regression tests.
+"""
+
+import pytest
+import subprocess
+import sys
+import json
+
+HEAVY_MODULES = [
+    "matplotlib",
+    "mpl_toolkits",
+    "geopandas",
+    "shapely",
+    "pyproj",
+    "pandas",
+    "numpy",
+]
+
+
+def _loaded_modules(code):
+    script = (
+        "import sys, json\n"
+        f"{code}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Test suite for keeping heavy dependencies out of the import path"""
+
+    def test_import_package_is_lightweight(self):
+        """Test that importing the package loads no plotting or dataframe libraries"""
+        assert _loaded_modules("import py_spoo_url") == []
+
+    def test_shortener_and_statistics_data_access_are_lightweight(self):
+        """Test that shortening and reading stats data stay lightweight"""
+        code = (
+            "from py_spoo_url import Shortener, Statistics\n"
+            "from py_spoo_url._internal import fetch_statistics\n"
+            "Shortener()\n"
+            "stats = Statistics.from_data({'_id': 'x', 'url': 'u', 'average_daily_clicks': 0,"
+            " 'average_monthly_clicks': 0, 'average_weekly_clicks': 0, 'total-clicks': 0,"
+            " 'total_unique_clicks': 0, 'max-clicks': None, 'last-click': None,"
+            " 'last-click-browser': None, 'last-click-os': None, 'creation-date': '2024-01-01',"
+            " 'browser': {}, 'os_name': {}, 'country': {'USA': 1}, 'referrer': {}, 'counter': {},"
+            " 'unique_browser': {}, 'unique_os_name': {}, 'unique_country': {},"
+            " 'unique_referrer': {}, 'unique_counter': {}, 'expired': False})\n"
+            "stats.country_region_analysis()"
+        )
+        assert _loaded_modules(code) == []
+
+    def test_charting_loads_matplotlib_on_first_use(self):
+        """Test that the lazy attributes still resolve to the real functions"""
+        code = "from py_spoo_url._internal import make_chart"
+        loaded = _loaded_modules(code)
+
+        assert "matplotlib" in loaded
+        assert "pandas" not in loaded
+
+    def test_polygon_heatmap_does_not_load_geopandas(self):
+        """Test that the geopandas-free engine does not import geopandas"""
+        code = (
+            "import matplotlib\n"
+            "matplotlib.use('Agg')\n"
+            "from py_spoo_url._internal.rendering import render_countries_heatmap\n"
+            "render_countries_heatmap({'USA': 1}, engine='polygons')"
+        )
+        loaded = _loaded_modules(code)
+
+        assert "geopandas" not in loaded
+        assert "pandas" not in loaded
+
+    def test_csv_and_json_exports_do_not_load_pandas(self):
+        """Test that text exports are written without pandas"""
+        code = (
+            "import io\n"
+            "from py_spoo_url._internal.exporters import export_data_bytes\n"
+            "data = {'_id': 'x', 'url': 'u', 'browser': {'Chrome': 1}}\n"
+            "for key in ['average_daily_clicks', 'average_monthly_clicks',"
+            " 'average_weekly_clicks', 'total-clicks', 'total_unique_clicks',"
+            " 'max-clicks', 'last-click', 'last-click-browser', 'last-click-os',"
+            " 'creation-date', 'expired', 'password']:\n"
+            "    data[key] = None\n"
+            "for filetype in ['csv', 'json', 'ndjson']:\n"
+            "    export_data_bytes(data, filetype)"
+        )
+        assert _loaded_modules(code) == []
+
+
+def _error_with_blocked(blocked, code):
+    script = (
+        "import sys\n"
+        f"for name in {blocked!r}:\n"
+        "    sys.modules[name] = None\n"
+        "try:\n"
+        + "".join(f"    {line}\n" for line in code.splitlines())
+        + "except ImportError as e:\n"
+        "    print(e)\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+
+@pytest.mark.unit
+class TestOptionalDependencies:
+    """Test suite for the errors raised when an extra is not installed"""
+
+    STATS = (
+        "from py_spoo_url import Statistics\n"
+        "stats = Statistics.__new__(Statistics)\n"
+        "stats.data = {}\n"
+        "stats.browsers_analysis = {'Chrome': 1}\n"
+        "stats.country_analysis = {'USA': 1}\n"
+    )
+
+    def test_charts_extra_missing(self):
+        """Test that charting without matplotlib names the charts extra"""
+        output = _error_with_blocked(
+            ["matplotlib", "matplotlib.pyplot"],
+            self.STATS + "stats.render_chart('browsers_analysis')",
+        )
+
+        assert "pip install py_spoo_url[charts]" in output
+
+    def test_geo_extra_missing(self):
+        """Test that the geopandas heatmap without geopandas names the geo extra"""
+        output = _error_with_blocked(
+            ["geopandas"],
+            "import matplotlib\nmatplotlib.use('Agg')\n"
+            + self.STATS
+            + "stats.render_countries_heatmap(engine='geopandas')",
+        )
+
+        assert "pip install py_spoo_url[geo]" in output
+
+    def test_export_extra_missing(self):
+        """Test that exporting to Excel without openpyxl names the export extra"""
+        output = _error_with_blocked(
+            ["openpyxl"], self.STATS + "stats.export_data('out.xlsx', 'xlsx')"
+        )
+
+        assert "pip install py_spoo_url[export]" in output
+
+    def test_pandas_excel_missing(self):
+        """Test that the pandas Excel path without pandas names the export extra"""
+        output = _error_with_blocked(
+            ["pandas"],
+            "from py_spoo_url._internal.exporters import export_to_excel\n"
+            "export_to_excel({}, 'out.xlsx', streaming=False)",
+        )
+
+        assert "pip install py_spoo_url[export]" in output
+
+    def test_pandas_engine_missing(self):
+        """Test that the pandas CSV engine without pandas names the export extra"""
+        output = _error_with_blocked(
+            ["pandas"],
+            "from py_spoo_url._internal.exporters import export_to_csv\n"
+            "export_to_csv({}, 'out', engine='pandas')",
+        )
+
+        assert "pip install py_spoo_url[export]" in output
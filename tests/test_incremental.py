@@ -0,0 +1,169 @@
+"""
+Tests for incremental exports.
+"""
+
+import pytest
+import csv
+import json
+import sqlite3
+from py_spoo_url import Statistics, export_incremental
+
+
+def _next_day(data):
+    """The payload a day later: one new day, the last day and Chrome grew"""
+    data = dict(data)
+    data["counter"] = {**data["counter"], "2024-01-03": 110, "2024-01-04": 20}
+    data["unique_counter"] = {**data["unique_counter"], "2024-01-04": 15}
+    data["browser"] = {**data["browser"], "Chrome": 530}
+    return data
+
+
+def _rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.unit
+class TestExportIncremental:
+    """Test suite for export_incremental"""
+
+    def test_csv_appends_only_changes(self, tmp_path, sample_statistics_data):
+        """Test that a second run only appends new days and dimension deltas"""
+        directory = tmp_path / "export"
+        stats = Statistics.from_data(sample_statistics_data)
+
+        first = export_incremental([stats], str(directory))
+        second = export_incremental([_next_day(sample_statistics_data)], str(directory))
+        third = export_incremental([_next_day(sample_statistics_data)], str(directory))
+
+        assert first == {"links": 1, "daily_rows": 3, "dimension_rows": 12}
+        assert second == {"links": 1, "daily_rows": 2, "dimension_rows": 1}
+        assert third == {"links": 1, "daily_rows": 0, "dimension_rows": 0}
+
+        daily = _rows(directory / "daily_clicks.csv")
+        assert daily[0] == [
+            "Short_Code",
+            "Date",
+            "Clicks",
+            "Unique_Clicks",
+            "Exported_At",
+        ]
+        assert [row[:4] for row in daily[4:]] == [
+            ["abc123", "2024-01-03", "110", "80"],
+            ["abc123", "2024-01-04", "20", "15"],
+        ]
+        dimensions = _rows(directory / "dimension_counts.csv")
+        assert len(dimensions) == 14
+        assert dimensions[-1][:5] == ["abc123", "browser", "Chrome", "30", "0"]
+
+        with open(directory / "watermark.json") as f:
+            assert json.load(f)["abc123"]["last_date"] == "2024-01-04"
+
+    def test_changed_history_is_rewritten(self, sample_statistics_data):
+        """Test that a change before the watermark re-exports the whole link"""
+        from py_spoo_url._internal.incremental import link_changes
+
+        _, _, mark = link_changes(sample_statistics_data, None)
+        data = dict(sample_statistics_data)
+        data["counter"] = {**data["counter"], "2024-01-01": 51}
+
+        daily, deltas, _ = link_changes(data, mark)
+
+        assert [day for day, _, _ in daily] == [
+            "2024-01-01",
+            "2024-01-02",
+            "2024-01-03",
+        ]
+        assert deltas == []
+
+    def test_parquet_adds_one_file_per_run(self, tmp_path, sample_statistics_data):
+        """Test that Parquet runs add files whose deltas sum to the counts"""
+        pytest.importorskip("pyarrow")
+        import pyarrow.dataset as ds
+
+        directory = tmp_path / "export"
+        export_incremental([sample_statistics_data], str(directory), filetype="parquet")
+        export_incremental(
+            [_next_day(sample_statistics_data)], str(directory), filetype="parquet"
+        )
+
+        assert len(list((directory / "daily_clicks").iterdir())) == 2
+        table = ds.dataset(directory / "dimension_counts", format="parquet").to_table()
+        chrome = [
+            clicks
+            for value, clicks in zip(
+                table["Value"].to_pylist(), table["Clicks"].to_pylist()
+            )
+            if value == "Chrome"
+        ]
+        assert sum(chrome) == 530
+
+    @pytest.mark.parametrize("filetype", ["csv", "parquet"])
+    def test_interrupted_run_leaves_no_rows(
+        self, tmp_path, filetype, sample_statistics_data
+    ):
+        """Test that a failed run writes nothing and is exported again in full"""
+        if filetype == "parquet":
+            pytest.importorskip("pyarrow")
+        directory = tmp_path / "export"
+        export_incremental([sample_statistics_data], str(directory), filetype=filetype)
+        before = sorted(str(path) for path in directory.rglob("*"))
+
+        def failing():
+            yield _next_day(sample_statistics_data)
+            raise RuntimeError("fetch failed")
+
+        with pytest.raises(RuntimeError):
+            export_incremental(failing(), str(directory), filetype=filetype)
+
+        assert sorted(str(path) for path in directory.rglob("*")) == before
+
+        second = export_incremental(
+            [_next_day(sample_statistics_data)], str(directory), filetype=filetype
+        )
+        assert second["dimension_rows"] == 1
+        if filetype == "csv":
+            chrome = [
+                int(row[3])
+                for row in _rows(directory / "dimension_counts.csv")[1:]
+                if row[2] == "Chrome"
+            ]
+            assert sum(chrome) == 530
+
+    def test_failed_parquet_close_removes_parts(self, tmp_path, sample_statistics_data):
+        """Test that rows failing as the Parquet parts are closed leave no files"""
+        pytest.importorskip("pyarrow")
+        directory = tmp_path / "export"
+        export_incremental([sample_statistics_data], str(directory), filetype="parquet")
+        before = sorted(str(path) for path in directory.rglob("*"))
+        bad = dict(sample_statistics_data, _id="bad", counter={"01/02/2024": 1})
+
+        # The buffered rows are only converted when the parts are closed
+        with pytest.raises(ValueError):
+            export_incremental(
+                [_next_day(sample_statistics_data), bad],
+                str(directory),
+                filetype="parquet",
+            )
+
+        assert sorted(str(path) for path in directory.rglob("*")) == before
+
+    def test_sqlite_upserts_changes(self, tmp_path, sample_statistics_data):
+        """Test that SQLite runs upsert the absolute counts of changed rows"""
+        database = str(tmp_path / "stats.db")
+
+        export_incremental([sample_statistics_data], database, filetype="sqlite")
+        summary = export_incremental(
+            [_next_day(sample_statistics_data)], database, filetype="sqlite"
+        )
+
+        assert summary["daily_rows"] == 2
+        assert (tmp_path / "stats.db.watermark.json").exists()
+        connection = sqlite3.connect(database)
+        assert connection.execute(
+            "SELECT date, clicks, unique_clicks FROM daily_clicks ORDER BY date"
+        ).fetchall()[-2:] == [("2024-01-03", 110, 80), ("2024-01-04", 20, 15)]
+        assert connection.execute(
+            "SELECT clicks, unique_clicks FROM dimension_counts WHERE value = 'Chrome'"
+        ).fetchone() == (530, 400)
+        connection.close()
@@ -0,0 +1,98 @@
+"""
+Tests for small-multiples charts.
+"""
+
+import pytest
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from py_spoo_url import Statistics, render_small_multiples
+
+
+def _link(sample, short_code, counter, browser):
+    return dict(sample, _id=short_code, counter=counter, browser=browser)
+
+
+@pytest.fixture
+def links(sample_statistics_data):
+    return [
+        _link(
+            sample_statistics_data,
+            "a",
+            {"2024-01-01": 5, "2024-01-02": 10},
+            {"Chrome": 10, "Firefox": 5, "Lynx": 1},
+        ),
+        _link(
+            sample_statistics_data,
+            "b",
+            {"2024-01-02": 20, "2024-01-05": 40},
+            {"Chrome": 2, "Safari": 8},
+        ),
+        _link(sample_statistics_data, "c", {"2024-01-03": 1}, {"Edge": 3}),
+    ]
+
+
+@pytest.mark.unit
+class TestSmallMultiples:
+    """Test suite for render_small_multiples"""
+
+    def test_series_panels_share_one_axes(self, links):
+        """Test that all series are drawn as one collection on a single Axes"""
+        fig = render_small_multiples(links, "clicks_analysis")
+
+        assert isinstance(fig, Figure)
+        assert len(fig.axes) == 1
+        series, frames = fig.axes[0].collections
+        assert isinstance(series, LineCollection)
+        assert len(series.get_segments()) == 3
+        assert len(frames.get_segments()) == 3
+        assert [text.get_text() for text in fig.axes[0].texts] == ["a", "b", "c"]
+
+    def test_series_share_date_range_and_scale(self, links):
+        """Test that panels are placed on a common date axis and value scale"""
+        fig = render_small_multiples(links, "clicks_analysis", ncols=3)
+
+        first, second, third = fig.axes[0].collections[0].get_segments()
+        assert first[0].tolist() == [0.0, 5 / 40]
+        assert second[-1][1] == pytest.approx(1.0)
+        assert third[0][0] - second[0][0] == pytest.approx(1.15 + 0.25)
+        assert "2024-01-01 to 2024-01-05" in fig._suptitle.get_text()
+
+    def test_area_panels(self, links):
+        """Test that area charts add one filled polygon per non-empty panel"""
+        fig = render_small_multiples(links, "clicks_analysis", chart_type="area")
+
+        fills = fig.axes[0].collections[0]
+        assert isinstance(fills, PolyCollection)
+        assert len(fills.get_paths()) == 3
+
+    def test_dimension_bars_share_categories(self, links):
+        """Test that bars use the top categories over all links plus Other"""
+        stats = [Statistics.from_data(link) for link in links]
+
+        fig = render_small_multiples(stats, "browsers_analysis", top_n=2)
+
+        bars = fig.axes[0].collections[0]
+        assert len(bars.get_paths()) == 3 * 3
+        legend = [text.get_text() for text in fig.legends[0].get_texts()]
+        assert legend == ["Chrome", "Safari", "Other"]
+
+    def test_independent_scales_label_panels(self, links):
+        """Test that sharey=False labels each panel with its own maximum"""
+        fig = render_small_multiples(links, "clicks_analysis", sharey=False)
+
+        labels = [text.get_text() for text in fig.axes[0].texts]
+        assert labels == ["a", "10", "b", "40", "c", "1"]
+
+    def test_repeated_link_gets_own_panel(self, links):
+        """Test that a link passed twice is drawn in two panels"""
+        fig = render_small_multiples([links[0], links[1], links[0]], "clicks_analysis")
+
+        series, frames = fig.axes[0].collections
+        assert len(series.get_segments()) == 3
+        assert len(frames.get_segments()) == 3
+        assert [text.get_text() for text in fig.axes[0].texts] == ["a", "b", "a"]
+
+    def test_invalid_chart_type(self, links):
+        """Test that unsupported chart types raise"""
+        with pytest.raises(ValueError, match="Invalid chart type"):
+            render_small_multiples(links, "clicks_analysis", chart_type="pie")
@@ -0,0 +1,145 @@
+"""
+Tests for the object-oriented, thread-safe rendering API.
+"""
+
+import pytest
+import unittest.mock as mock
+import json
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from py_spoo_url import Statistics
+from py_spoo_url._internal.rendering import render_chart
+
+
+@pytest.fixture
+def stats(sample_statistics_data):
+    with mock.patch("requests.post") as mock_post:
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.text = json.dumps(sample_statistics_data)
+        mock_post.return_value = mock_response
+        yield Statistics("abc123")
+
+
+@pytest.mark.unit
+class TestRenderChart:
+    """Test suite for render_chart"""
+
+    @pytest.mark.parametrize(
+        "chart_type", ["bar", "pie", "line", "scatter", "hist", "box", "area"]
+    )
+    def test_render_chart_returns_standalone_figure(self, stats, chart_type):
+        """Test that every chart type returns a Figure not tracked by pyplot"""
+        figures_before = plt.get_fignums()
+
+        fig = stats.render_chart("browsers_analysis", chart_type)
+
+        assert isinstance(fig, Figure)
+        assert len(fig.axes) == 1
+        assert plt.get_fignums() == figures_before
+
+    def test_render_chart_leaves_rcparams_alone(self, stats):
+        """Test that rendering does not modify the global rcParams"""
+        with matplotlib.rc_context({"font.size": 7, "axes.labelcolor": "red"}):
+            fig = stats.render_chart("clicks_analysis", "bar", figsize=(4, 3))
+
+            assert matplotlib.rcParams["font.size"] == 7
+            assert matplotlib.rcParams["axes.labelcolor"] == "red"
+        assert tuple(fig.get_size_inches()) == (4, 3)
+        assert fig.axes[0].get_xticklabels()[0].get_rotation() == 90
+
+    def test_render_chart_invalid_type(self):
+        """Test that an invalid chart type raises"""
+        with pytest.raises(Exception, match="Invalid chart type"):
+            render_chart({"a": 1}, chart_type="radar")
+
+    def test_concurrent_renders_do_not_interfere(self):
+        """Test that figures rendered in parallel each hold only their own data"""
+
+        def render(i):
+            return i, render_chart({f"k{i}-{j}": j for j in range(5)}, "bar")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(render, range(32)))
+
+        for i, fig in results:
+            ax = fig.axes[0]
+            assert len(ax.patches) == 5
+            labels = [t.get_text() for t in ax.get_xticklabels()]
+            assert labels == [f"k{i}-{j}" for j in range(5)]
+
+
+@pytest.mark.unit
+class TestRenderHeatmap:
+    """Test suite for the object-oriented heatmaps"""
+
+    def test_render_countries_heatmap_polygons(self, stats):
+        """Test that the heatmap is rendered onto a standalone figure"""
+        figures_before = plt.get_fignums()
+
+        fig = stats.render_countries_heatmap(engine="polygons")
+        unique_fig = stats.render_unique_countries_heatmap(engine="polygons")
+
+        assert isinstance(fig, Figure)
+        assert fig is not unique_fig
+        assert fig._suptitle.get_text() == "Countries Heatmap"
+        assert unique_fig._suptitle.get_text() == "Unique Countries Heatmap"
+        assert plt.get_fignums() == figures_before
+
+    def test_render_heatmap_invalid_engine(self, stats):
+        """Test that an unknown heatmap engine raises ValueError"""
+        with pytest.raises(ValueError):
+            stats.render_countries_heatmap(engine="cartopy")
+
+
+@pytest.mark.unit
+class TestRenderBytes:
+    """Test suite for direct-to-bytes rendering"""
+
+    @pytest.mark.parametrize(
+        "image_format, magic",
+        [("png", b"\x89PNG"), ("svg", b"<?xml"), ("webp", b"RIFF")],
+    )
+    def test_render_chart_bytes_formats(self, stats, image_format, magic):
+        """Test that charts are encoded in the requested format"""
+        if image_format == "webp":
+            pytest.importorskip("PIL")
+
+        data = stats.render_chart_bytes("browsers_analysis", format=image_format)
+
+        assert isinstance(data, bytes)
+        assert data.startswith(magic)
+
+    def test_render_chart_bytes_dpi_and_size(self, stats):
+        """Test that dpi and figsize control the encoded image size"""
+        from PIL import Image
+        import io
+
+        data = stats.render_chart_bytes(
+            "browsers_analysis", "pie", dpi=50, figsize=(4, 2)
+        )
+
+        assert Image.open(io.BytesIO(data)).size == (200, 100)
+
+    def test_render_into_buffer(self, stats):
+        """Test writing into a caller supplied buffer"""
+        import io
+
+        buffer = io.BytesIO()
+        result = stats.render_countries_heatmap_bytes(
+            engine="polygons", buffer=buffer, dpi=20
+        )
+
+        assert result is None
+        assert buffer.getvalue().startswith(b"\x89PNG")
+
+    def test_render_unique_heatmap_bytes(self, stats):
+        """Test that the unique heatmap can be encoded as SVG"""
+        data = stats.render_unique_countries_heatmap_bytes(
+            engine="polygons", format="svg"
+        )
+
+        assert data.startswith(b"<?xml")
+        assert b"<svg" in data
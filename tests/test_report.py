@@ -0,0 +1,76 @@
+"""
+Tests for HTML report generation.
+"""
+
+import pytest
+import re
+from py_spoo_url import RenderCache, Statistics
+
+
+@pytest.fixture
+def stats(sample_statistics_data):
+    return Statistics.from_data(sample_statistics_data)
+
+
+@pytest.mark.unit
+class TestBuildReport:
+    """Test suite for Statistics.build_report"""
+
+    def test_report_is_self_contained_html(self, stats, tmp_path):
+        """Test that the report embeds inline SVG charts, heatmaps and tables"""
+        filename = tmp_path / "report.html"
+
+        report = stats.build_report(filename=str(filename))
+
+        assert filename.read_text(encoding="utf-8") == report
+        assert report.startswith("<!DOCTYPE html>")
+        assert report.count("<svg") == 8
+        assert "<?xml" not in report
+        assert "src=" not in report
+        assert "<td>https://www.example.com</td>" in report
+        assert "<th>Browsers analysis</th>" in report
+
+    def test_report_png_charts(self, stats):
+        """Test that PNG charts are embedded as data URIs"""
+        report = stats.build_report(
+            format="png", dpi=20, charts=[("browsers_analysis", "pie")], heatmaps=False
+        )
+
+        assert report.count('src="data:image/png;base64,') == 1
+        assert "<h2>Countries</h2>" not in report
+
+    def test_report_top_n_and_escaping(self, sample_statistics_data):
+        """Test that tables are limited to the top entries and escaped"""
+        data = dict(
+            sample_statistics_data,
+            referrer={"<script>": 50, "a.com": 30, "b.com": 20, "c.com": 10},
+        )
+        stats = Statistics.from_data(data)
+
+        report = stats.build_report(charts=[], heatmaps=False, top_n=2)
+
+        assert "<td>&lt;script&gt;</td>" in report
+        assert "<script>" not in report
+        assert "<td>Other</td>" in report
+        assert "<td>c.com</td>" not in report
+
+    def test_report_handles_empty_analyses(self, sample_statistics_data):
+        """Test that empty analyses produce a placeholder instead of failing"""
+        stats = Statistics.from_data(dict(sample_statistics_data, counter={}))
+
+        report = stats.build_report(
+            charts=[("clicks_analysis", "line")], heatmaps=False
+        )
+
+        assert re.search(r"Clicks analysis</h2><figure><p>No data.</p>", report)
+
+    def test_report_reuses_cached_charts(self, stats):
+        """Test that a RenderCache is used for the report charts"""
+        cache = RenderCache()
+        charts = [("browsers_analysis", "pie"), ("clicks_analysis", "bar")]
+
+        first = stats.build_report(charts=charts, heatmaps=False, cache=cache)
+        second = stats.build_report(charts=charts, heatmaps=False, cache=cache)
+
+        assert first == second
+        assert cache.hits == 2
@@ -0,0 +1,93 @@
+"""
+Tests for the SQLite statistics store.
+"""
+
+import pytest
+import sqlite3
+from py_spoo_url import SQLiteStore, Statistics, sync_sqlite
+
+
+def _links(sample_statistics_data, count):
+    for i in range(count):
+        data = dict(sample_statistics_data)
+        data["_id"] = f"link{i}"
+        yield data
+
+
+@pytest.mark.unit
+class TestSQLiteStore:
+    """Test suite for SQLiteStore and sync_sqlite"""
+
+    def test_sync_creates_normalized_tables(self, tmp_path, sample_statistics_data):
+        """Test that links, days and dimensions land in their own tables"""
+        database = str(tmp_path / "stats.db")
+
+        assert (
+            sync_sqlite(_links(sample_statistics_data, 3), database, batch_size=2) == 3
+        )
+
+        connection = sqlite3.connect(database)
+        assert connection.execute("SELECT COUNT(*) FROM links").fetchone() == (3,)
+        assert connection.execute(
+            "SELECT url, total_clicks, expired FROM links WHERE short_code = 'link1'"
+        ).fetchone() == ("https://www.example.com", 1000, 0)
+        assert connection.execute(
+            "SELECT clicks, unique_clicks FROM daily_clicks"
+            " WHERE short_code = 'link2' AND date = '2024-01-02'"
+        ).fetchone() == (75, 60)
+        assert connection.execute(
+            "SELECT SUM(clicks), SUM(unique_clicks) FROM dimension_counts"
+            " WHERE dimension = 'browser' AND value = 'Chrome'"
+        ).fetchone() == (1500, 1200)
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert {"daily_clicks_date", "dimension_counts_value"} <= indexes
+        connection.close()
+
+    def test_resync_updates_changed_rows(self, tmp_path, sample_statistics_data):
+        """Test that re-syncing a link upserts its new counts"""
+        updated = dict(sample_statistics_data)
+        updated["total-clicks"] = 1100
+        updated["counter"] = {
+            **sample_statistics_data["counter"],
+            "2024-01-03": 150,
+            "2024-01-04": 5,
+        }
+
+        with SQLiteStore(str(tmp_path / "stats.db")) as store:
+            store.upsert([Statistics.from_data(sample_statistics_data)])
+            store.upsert([updated])
+            connection = store.connection
+
+            assert connection.execute("SELECT total_clicks FROM links").fetchall() == [
+                (1100,)
+            ]
+            assert connection.execute(
+                "SELECT date, clicks FROM daily_clicks ORDER BY date"
+            ).fetchall() == [
+                ("2024-01-01", 50),
+                ("2024-01-02", 75),
+                ("2024-01-03", 150),
+                ("2024-01-04", 5),
+            ]
+            before = connection.total_changes
+            store.upsert([updated])
+            # only the links row is rewritten, unchanged counts are skipped
+            assert connection.total_changes - before == 1
+
+    def test_export_data_sqlite(self, tmp_path, sample_statistics_data):
+        """Test the sqlite file type of export_data"""
+        database = str(tmp_path / "stats.db")
+        stats = Statistics.from_data(sample_statistics_data)
+
+        stats.export_data(database, filetype="sqlite")
+
+        connection = sqlite3.connect(database)
+        assert connection.execute("SELECT short_code FROM links").fetchall() == [
+            ("abc123",)
+        ]
+        connection.close()
@@ -4,7 +4,9 @@ Tests for the Statistics class core functionality.
 
 import pytest
 import unittest.mock as mock
+import io
 import json
+import zipfile
 from py_spoo_url import Statistics
 
 
@@ -322,3 +324,80 @@ class TestStatisticsEdgeCases:
         assert stats.total_clicks == 100
         assert stats.creation_time is None  # Should handle missing field
         assert stats.password is None  # Should handle missing field
+
+
+@pytest.mark.unit
+class TestStatisticsTables:
+    """Test suite for the memoized tables of Statistics"""
+
+    def test_tables_are_memoized(self, sample_statistics_data):
+        """Test that the tables and their contents are built only once"""
+        stats = Statistics.from_data(sample_statistics_data)
+
+        assert stats.tables is stats.tables
+        assert stats.tables.csv_files() is stats.tables.csv_files()
+        assert stats.tables.csv_files()["browser.csv"].startswith(
+            "Browser,Count\nChrome,500\n"
+        )
+
+    def test_excel_export_keeps_no_rows(self, tmp_path, sample_statistics_data):
+        """Test that the streaming Excel export reads the payload, not the cache"""
+        stats = Statistics.from_data(sample_statistics_data)
+
+        from py_spoo_url._internal import exporters
+
+        with mock.patch.object(
+            exporters, "iter_tables", wraps=exporters.iter_tables
+        ) as iter_tables:
+            stats.export_data(str(tmp_path / "stats.xlsx"), "xlsx")
+            stats.export_data(str(tmp_path / "stats.xlsx"), "xlsx")
+
+        assert iter_tables.call_count == 2
+
+    def test_exports_share_tables(self, sample_statistics_data):
+        """Test that repeated exports build the CSV files once"""
+        from py_spoo_url._internal import textexport
+
+        stats = Statistics.from_data(sample_statistics_data)
+
+        with mock.patch.object(
+            textexport, "table_to_csv", wraps=textexport.table_to_csv
+        ) as table_to_csv:
+            first = stats.export_data_bytes("csv")
+            built = table_to_csv.call_count
+            second = stats.export_data_bytes("csv")
+
+        assert built > 0
+        assert table_to_csv.call_count == built
+        assert first == second
+
+    def test_top_n_export_bypasses_tables(self, sample_statistics_data):
+        """Test that a top_n export does not reuse the full tables"""
+        stats = Statistics.from_data(sample_statistics_data)
+        full = stats.tables.csv_files()["browser.csv"]
+
+        content = stats.export_data_bytes("csv", top_n=1)
+
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            browsers = archive.read("browser.csv").decode()
+        assert "Other" in browsers
+        assert "Other" not in full
+
+    @mock.patch("requests.post")
+    def test_refresh_invalidates_tables(self, mock_post, sample_statistics_data):
+        """Test that refresh fetches the statistics again and drops the tables"""
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.text = json.dumps(sample_statistics_data)
+        mock_post.return_value = mock_response
+        stats = Statistics("abc123", password="secret")
+        tables = stats.tables
+
+        updated = dict(sample_statistics_data, browser={"Chrome": 1})
+        mock_response.text = json.dumps(updated)
+        assert stats.refresh() is stats
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.kwargs["data"] == {"password": "secret"}
+        assert stats.tables is not tables
+        assert stats.tables.csv_files()["browser.csv"] == "Browser,Count\nChrome,1\n"
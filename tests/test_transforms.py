@@ -0,0 +1,245 @@
+"""
+Tests for time series downsampling, top-N reduction and date tick selection.
+"""
+
+import pytest
+from datetime import date, timedelta
+import matplotlib.pyplot as plt
+from py_spoo_url._internal.plotting import make_chart
+from py_spoo_url._internal.rendering import render_chart
+from py_spoo_url._internal.transforms import (
+    bucket_aggregate,
+    date_ticks,
+    downsample_series,
+    lttb,
+    series_positions,
+    top_n_dimensions,
+    top_n_with_other,
+)
+
+
+def daily_series(days, peak_day=None, start=date(2022, 1, 1)):
+    series = {}
+    for i in range(days):
+        value = 1000 if i == peak_day else i % 7
+        series[(start + timedelta(days=i)).isoformat()] = value
+    return series
+
+
+@pytest.mark.unit
+class TestDownsampling:
+    """Test suite for LTTB and bucket aggregation"""
+
+    def test_lttb_keeps_endpoints_and_peak(self):
+        """Test that LTTB keeps the first, last and most prominent points"""
+        points = [(x, 1000 if x == 613 else x % 5) for x in range(2000)]
+
+        indices = lttb(points, 100)
+
+        assert len(indices) == 100
+        assert indices[0] == 0 and indices[-1] == 1999
+        assert 613 in indices
+        assert indices == sorted(indices)
+
+    def test_lttb_small_input_unchanged(self):
+        """Test that LTTB keeps everything when under the threshold"""
+        assert lttb([(0, 1), (1, 2), (2, 3)], 10) == [0, 1, 2]
+
+    def test_bucket_aggregate_preserves_totals(self):
+        """Test that bucketing sums values under the first key of each bucket"""
+        series = daily_series(1000, peak_day=500)
+
+        buckets = bucket_aggregate(series, 180)
+
+        assert len(buckets) <= 180
+        assert sum(buckets.values()) == sum(series.values())
+        assert next(iter(buckets)) == "2022-01-01"
+        assert max(buckets.values()) >= 1000
+
+    @pytest.mark.parametrize(
+        "chart_type, limit", [("bar", 180), ("line", 1000), ("scatter", 1000)]
+    )
+    def test_downsample_series_default_budget(self, chart_type, limit):
+        """Test that each series chart type is capped to its default budget"""
+        series = daily_series(3000, peak_day=1234)
+
+        result = downsample_series(series, chart_type)
+
+        assert len(result) <= limit
+        assert max(result.values()) >= 1000
+
+    def test_downsample_series_picks_by_position(self):
+        """Test that LTTB works on axis positions, not on the gaps between dates"""
+        values = [2, 4, 1, 5, 8, 6, 8, 3]
+        gaps = [1, 1, 300, 300, 1, 300, 1]
+        days = [date(2022, 1, 1)]
+        for gap in gaps:
+            days.append(days[-1] + timedelta(days=gap))
+        series = {day.isoformat(): value for day, value in zip(days, values)}
+
+        result = downsample_series(series, "line", max_points=4)
+
+        # Picking by date would keep 2022-01-02 and 2024-06-22 instead
+        assert list(result) == [days[i].isoformat() for i in (0, 2, 4, 7)]
+        by_date = downsample_series(
+            series, "line", max_points=4, xs=[day.toordinal() for day in days]
+        )
+        assert list(by_date) == [days[i].isoformat() for i in (0, 1, 6, 7)]
+
+    def test_series_positions(self):
+        """Test that kept labels are mapped to their index in the full series"""
+        assert series_positions(["a", "b", "c", "d"], ["a", "c", "d"]) == [0, 2, 3]
+
+    def test_downsample_series_leaves_other_types(self):
+        """Test that non-series chart types are not downsampled"""
+        series = daily_series(3000)
+
+        assert downsample_series(series, "pie") is series
+        assert downsample_series(series, "line", max_points=5000) is series
+
+
+@pytest.mark.unit
+class TestTopN:
+    """Test suite for the top-N plus "Other" reduction"""
+
+    def test_top_n_keeps_largest_and_sums_rest(self):
+        """Test that the remainder is summed into an Other bucket"""
+        referrers = {f"site{i}.com": i for i in range(1, 5001)}
+
+        reduced = top_n_with_other(referrers, 3)
+
+        assert list(reduced) == [
+            "site5000.com",
+            "site4999.com",
+            "site4998.com",
+            "Other",
+        ]
+        assert sum(reduced.values()) == sum(referrers.values())
+
+    def test_top_n_small_input_has_no_other(self):
+        """Test that no Other bucket is added when nothing is dropped"""
+        assert top_n_with_other({"a": 1, "b": 3}, 5) == {"b": 3, "a": 1}
+
+    def test_top_n_merges_existing_other_key(self):
+        """Test that an existing Other key absorbs the remainder"""
+        data = {"Other": 50, "Chrome": 40, "Edge": 5, "Opera": 3}
+
+        reduced = top_n_with_other(data, 2)
+
+        assert reduced == {"Other": 58, "Chrome": 40}
+
+    def test_top_n_custom_label_and_invalid_n(self):
+        """Test the other_label argument and validation of n"""
+        assert top_n_with_other({"a": 3, "b": 2, "c": 1}, 1, "Rest") == {
+            "a": 3,
+            "Rest": 3,
+        }
+        with pytest.raises(ValueError):
+            top_n_with_other({"a": 1}, 0)
+
+    def test_top_n_dimensions_leaves_series(self, sample_statistics_data):
+        """Test that only dimensions of a payload are reduced"""
+        reduced = top_n_dimensions(sample_statistics_data, 1)
+
+        assert len(reduced["browser"]) == 2
+        assert len(reduced["unique_country"]) == 2
+        assert reduced["counter"] == sample_statistics_data["counter"]
+        assert len(sample_statistics_data["browser"]) > 2
+
+    def test_render_chart_top_n(self):
+        """Test that charts can be limited to the top entries"""
+        countries = {f"Country {i}": i for i in range(1, 1001)}
+
+        fig = render_chart(countries, "bar", data_label="country_analysis", top_n=10)
+
+        ax = fig.axes[0]
+        assert len(ax.patches) == 11
+        assert ax.get_xticklabels()[-1].get_text() == "Other"
+
+
+@pytest.mark.unit
+class TestDateTicks:
+    """Test suite for date tick selection"""
+
+    def test_short_series_ticks_every_day(self):
+        """Test that a short series gets a tick per label"""
+        positions, labels = date_ticks(list(daily_series(7)), max_ticks=12)
+
+        assert positions == list(range(7))
+        assert labels[0] == "2022-01-01"
+
+    def test_ticks_on_month_boundaries(self):
+        """Test that a few months of data get one tick per month"""
+        positions, labels = date_ticks(list(daily_series(120)), max_ticks=12)
+
+        assert labels == ["2022-01", "2022-02", "2022-03", "2022-04"]
+        assert positions == [0, 31, 59, 90]
+
+    def test_ticks_on_year_boundaries(self):
+        """Test that multi-year data is ticked per year"""
+        positions, labels = date_ticks(list(daily_series(1200)), max_ticks=12)
+
+        assert labels == ["2022", "2023", "2024", "2025"]
+        assert len(positions) <= 12
+
+    def test_non_date_labels_evenly_spaced(self):
+        """Test that non-date labels fall back to evenly spaced ticks"""
+        keys = [f"label{i}" for i in range(100)]
+
+        positions, labels = date_ticks(keys, max_ticks=10)
+
+        assert positions == list(range(0, 100, 10))
+        assert labels[1] == "label10"
+
+
+@pytest.mark.unit
+class TestLongSeriesCharts:
+    """Test suite for charting long time series"""
+
+    def test_render_chart_downsamples_bars(self):
+        """Test that a long bar chart draws a bounded number of bars"""
+        fig = render_chart(
+            daily_series(1200), "bar", data_label="clicks_analysis", max_points=100
+        )
+
+        ax = fig.axes[0]
+        assert len(ax.patches) <= 100
+        assert [label.get_text() for label in ax.get_xticklabels()] == [
+            "2022",
+            "2023",
+            "2024",
+            "2025",
+        ]
+
+    def test_render_chart_downsample_disabled(self):
+        """Test that downsampling can be turned off"""
+        fig = render_chart(
+            daily_series(400), "bar", data_label="clicks_analysis", downsample=False
+        )
+
+        assert len(fig.axes[0].patches) == 400
+
+    def test_render_chart_keeps_downsampled_gaps(self):
+        """Test that kept points are drawn at their positions in the full series"""
+        series = daily_series(3000, peak_day=10)
+
+        fig = render_chart(series, "line", data_label="clicks_analysis", max_points=200)
+
+        ax = fig.axes[0]
+        kept = downsample_series(series, "line", max_points=200)
+        assert list(ax.get_lines()[0].get_xdata()) == series_positions(series, kept)
+        labels = [label.get_text() for label in ax.get_xticklabels()]
+        assert labels[0] == "2022" and labels[-1] == "2030"
+
+    def test_make_chart_downsamples_lines(self):
+        """Test that the pyplot helper downsamples line charts too"""
+        make_chart(
+            daily_series(3000, peak_day=10),
+            "line",
+            data_label="clicks_analysis",
+            max_points=200,
+        )
+
+        line = plt.gca().get_lines()[0]
+        assert len(line.get_ydata()) == 200
+        assert max(line.get_ydata()) == 1000